@@ -1,6 +1,6 @@
 import copy
 from abc import abstractmethod
-from collections.abc import Collection, Iterator, Sequence
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from functools import cached_property, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -11,6 +11,8 @@ from evmchains import PUBLIC_CHAIN_META
 from pydantic import model_validator
 
 from ape.exceptions import (
+    ApeException,
+    APINotImplementedError,
     CustomError,
     NetworkError,
     NetworkMismatchError,
@@ -236,6 +238,27 @@ class EcosystemAPI(ExtraAttributesMixin, BaseInterfaceModel):
             :class:`~ape.api.providers.BlockAPI`
         """
 
+    def decode_block_columns(
+        self, headers: Sequence[dict], columns: Sequence[str]
+    ) -> dict[str, list[Any]]:
+        """
+        Decode only the given columns of block headers, such as from
+        :meth:`~ape.api.providers.ProviderAPI.get_block_headers`, without
+        validating whole :class:`~ape.api.providers.BlockAPI` models.
+
+        Args:
+            headers (Sequence[dict]): The raw block headers.
+            columns (Sequence[str]): The block fields to decode.
+
+        Raises:
+            :class:`~ape.exceptions.APINotImplementedError`: When a column can't be
+              decoded from a block header, or by default.
+
+        Returns:
+            dict[str, list[Any]]: The values of each column.
+        """
+        raise APINotImplementedError("decode_block_columns is not implemented by this ecosystem")
+
     @property
     def config(self) -> PluginConfig:
         """
@@ -641,6 +664,37 @@ class EcosystemAPI(ExtraAttributesMixin, BaseInterfaceModel):
         """
         return None
 
+    def get_proxy_infos(
+        self, addresses: Iterable[AddressType], raise_on_error: bool = True
+    ) -> dict[AddressType, ProxyInfoAPI | ApeException | None]:
+        """
+        Information about many possible proxy contracts at once. Ecosystems
+        may override this to detect proxies in fewer requests.
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses
+              of the contracts.
+            raise_on_error (bool): Set to ``False`` to get the error of a failed
+              detection in place of its result instead of raising it, so one
+              address does not fail the rest. Defaults to ``True``.
+
+        Returns:
+            dict[AddressType, ProxyInfoAPI | ApeException | None]: A mapping of each
+            address to its proxy information, or ``None`` if it does not use any
+            known proxy pattern.
+        """
+        proxy_infos: dict[AddressType, ProxyInfoAPI | ApeException | None] = {}
+        for address in addresses:
+            try:
+                proxy_infos[address] = self.get_proxy_info(address)
+            except ApeException as err:
+                if raise_on_error:
+                    raise
+
+                proxy_infos[address] = err
+
+        return proxy_infos
+
     def get_method_selector(self, abi: "MethodABI") -> HexBytes:
         """
         Get a contract method selector, typically via hashing such as ``keccak``.
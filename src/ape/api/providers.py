@@ -8,7 +8,7 @@ import sys
 import time
 import warnings
 from abc import abstractmethod
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from functools import cached_property
 from logging import FileHandler, Formatter, Logger, getLogger
 from pathlib import Path
@@ -54,7 +54,7 @@ if TYPE_CHECKING:
     from ape.api.config import PluginConfig
     from ape.api.trace import TraceAPI
     from ape.types.address import AddressType
-    from ape.types.events import ContractLog, LogFilter
+    from ape.types.events import BlockRollback, ContractLog, LogFilter
     from ape.types.vm import BlockID, ContractCode, SnapshotID
 
 
@@ -239,6 +239,117 @@ class CallResult(BaseModel, ManagerAccessMixin):
         return self.provider.network.ecosystem.decode_returndata(method_abi, self.returndata)
 
 
+class BatchResult:
+    """
+    The pending result of a request added to a :class:`~ape.api.providers.BatchRequest`.
+    The result is available once the batch is sent.
+    """
+
+    _unset: ClassVar[object] = object()
+
+    def __init__(self, rpc: str):
+        self.rpc = rpc
+        self._value: Any = self._unset
+
+    def __repr__(self) -> str:
+        state = "pending" if self._value is self._unset else "done"
+        return f"<{self.__class__.__name__} {self.rpc} ({state})>"
+
+    @property
+    def done(self) -> bool:
+        """
+        ``True`` when the batch containing this request was sent.
+        """
+        return self._value is not self._unset
+
+    @property
+    def result(self) -> Any:
+        """
+        The result of the request.
+
+        Raises:
+            :class:`~ape.exceptions.ProviderError`: When the batch was not sent yet
+              or when the request failed.
+        """
+        if self._value is self._unset:
+            raise ProviderError(f"Batch request '{self.rpc}' has not been sent.")
+
+        elif isinstance(self._value, Exception):
+            raise self._value
+
+        return self._value
+
+    def _set(self, value: Any):
+        self._value = value
+
+
+class BatchRequest:
+    """
+    A queue of raw RPC requests that are sent together using
+    :meth:`~ape.api.providers.ProviderAPI.make_batch_request`.
+    Use :meth:`~ape.api.providers.ProviderAPI.batch_requests` to create one.
+    The requests are sent when exiting the context.
+
+    Usage example::
+
+        with provider.batch_requests() as batch:
+            balance = batch.add("eth_getBalance", [address, "latest"])
+            nonce = batch.add("eth_getTransactionCount", [address, "latest"])
+
+        print(balance.result, nonce.result)
+    """
+
+    def __init__(self, provider: "ProviderAPI"):
+        self.provider = provider
+        self._requests: list[tuple[str, Iterable | None]] = []
+        self._results: list[BatchResult] = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+
+    def add(self, rpc: str, parameters: Iterable | None = None) -> BatchResult:
+        """
+        Queue a request.
+
+        Args:
+            rpc (str): The RPC method to call.
+            parameters (Iterable | None): Parameters for the method.
+
+        Returns:
+            :class:`~ape.api.providers.BatchResult`: The pending result.
+        """
+        result = BatchResult(rpc)
+        self._requests.append((rpc, parameters))
+        self._results.append(result)
+        return result
+
+    def flush(self) -> list[Any]:
+        """
+        Send all the queued requests. Failed requests raise
+        their error when accessing their ``.result``.
+
+        Returns:
+            list: The results (or errors) of the requests, in order.
+        """
+        requests, results = self._requests, self._results
+        self._requests, self._results = [], []
+        if not requests:
+            return []
+
+        values = self.provider.make_batch_request(requests, raise_on_error=False)
+        for result, value in zip(results, values):
+            result._set(value)
+
+        return values
+
+
 class ProviderAPI(BaseInterfaceModel):
     """
     An abstraction of a connection to a network in an ecosystem. Example ``ProviderAPI``
@@ -275,6 +386,11 @@ class ProviderAPI(BaseInterfaceModel):
     How many parallel threads to use when fetching logs.
     """
 
+    batch_size: int = 100
+    """
+    The maximum amount of requests to send in a single batch request.
+    """
+
     @property
     def data_folder(self) -> Path:
         """
@@ -464,6 +580,55 @@ class ProviderAPI(BaseInterfaceModel):
         class-serializations.
         """
 
+    def make_batch_request(
+        self,
+        requests: Iterable[tuple[str, Iterable | None]],
+        raise_on_error: bool = True,
+    ) -> list[Any]:
+        """
+        Make many raw RPC requests at once. Providers supporting batch requests
+        (such as JSON-RPC batches) send them in as few round-trips as possible.
+        Otherwise, the requests are made one at a time.
+
+        Args:
+            requests (Iterable[tuple[str, Iterable | None]]): Pairs of RPC methods
+              and their parameters.
+            raise_on_error (bool): Set to ``False`` to get the error of a failed
+              request in place of its result instead of raising it.
+              Defaults to ``True``.
+
+        Returns:
+            list: The results, in the same order as the requests.
+        """
+        results: list[Any] = []
+        for rpc, parameters in requests:
+            try:
+                results.append(self.make_request(rpc, parameters))
+            except (ProviderError, APINotImplementedError) as err:
+                if raise_on_error:
+                    raise
+
+                results.append(err)
+
+        return results
+
+    def batch_requests(self) -> BatchRequest:
+        """
+        Queue raw RPC requests and send them together as a batch
+        when exiting the context.
+
+        Usage example::
+
+            with provider.batch_requests() as batch:
+                code = batch.add("eth_getCode", [address, "latest"])
+
+            print(code.result)
+
+        Returns:
+            :class:`~ape.api.providers.BatchRequest`
+        """
+        return BatchRequest(self)
+
     @raises_not_implemented
     def stream_request(  # type: ignore[empty-body]
         self, method: str, params: Iterable, iter_path: str = "result.item"
@@ -505,6 +670,24 @@ class ProviderAPI(BaseInterfaceModel):
             HexBytes: The value of the storage slot.
         """
 
+    def get_storages(
+        self, address: "AddressType", slots: Iterable[int], block_id: "BlockID | None" = None
+    ) -> list[HexBytes]:
+        """
+        Gets the raw values of many storage slots of a contract.
+        Providers supporting batch requests fetch them in a single round-trip.
+
+        Args:
+            address (AddressType): The address of the contract.
+            slots (Iterable[int]): Storage slots to read the values of.
+            block_id ("BlockID | None"): The block ID
+              for checking previous storage values.
+
+        Returns:
+            list[HexBytes]: The values of the storage slots, in order.
+        """
+        return [self.get_storage(address, slot, block_id=block_id) for slot in slots]
+
     @abstractmethod
     def get_nonce(self, address: "AddressType", block_id: "BlockID | None" = None) -> int:
         """
@@ -579,6 +762,14 @@ class ProviderAPI(BaseInterfaceModel):
         """
         return False
 
+    @property
+    def supports_batch_requests(self) -> bool:
+        """
+        ``True`` when the provider can send many RPC requests in a single round-trip
+        using :meth:`~ape.api.providers.ProviderAPI.make_batch_request`.
+        """
+        return False
+
     @property
     def base_fee(self) -> int:
         """
@@ -609,6 +800,40 @@ class ProviderAPI(BaseInterfaceModel):
             :class:`~ape.types.BlockID`: The block for the given ID.
         """
 
+    def get_blocks(self, block_ids: Iterable["BlockID"]) -> Iterator[BlockAPI]:
+        """
+        Get many blocks. Providers supporting batch requests
+        fetch them in fewer round-trips.
+
+        Args:
+            block_ids (Iterable[:class:`~ape.types.BlockID`]): The IDs of the blocks to get.
+
+        Raises:
+            :class:`~ape.exceptions.BlockNotFoundError`: When a block is not found.
+
+        Returns:
+            Iterator[:class:`~ape.api.providers.BlockAPI`]
+        """
+        yield from map(self.get_block, block_ids)
+
+    def get_block_headers(self, block_ids: Iterable["BlockID"]) -> Iterator[dict]:
+        """
+        Get the raw headers of many blocks, without their transactions, e.g. for
+        :meth:`~ape.api.networks.EcosystemAPI.decode_block_columns`.
+
+        Args:
+            block_ids (Iterable[:class:`~ape.types.BlockID`]): The IDs of the blocks to get.
+
+        Raises:
+            :class:`~ape.exceptions.APINotImplementedError`: When the provider can't get
+              raw block headers, which is the default.
+            :class:`~ape.exceptions.BlockNotFoundError`: When a block is not found.
+
+        Returns:
+            Iterator[dict]
+        """
+        raise APINotImplementedError("get_block_headers is not implemented by this provider")
+
     # TODO: In 0.9, change the return value to be `CallResult`
     #    (right now it does only when using raise_on_revert=False and it reverts).
     @abstractmethod
@@ -880,13 +1105,14 @@ class ProviderAPI(BaseInterfaceModel):
         stop_block: int | None = None,
         required_confirmations: int | None = None,
         new_block_timeout: int | None = None,
+        on_rollback: Callable[["BlockRollback"], None] | None = None,
     ) -> Iterator[BlockAPI]:
         """
         Poll new blocks.
 
-        **NOTE**: When a chain reorganization occurs, this method logs an error and
-        yields the missed blocks, even if they were previously yielded with different
-        block numbers.
+        **NOTE**: When a chain reorganization occurs, this method logs an error,
+        calls ``on_rollback`` with the orphaned blocks, and yields the new chain's
+        blocks after the fork, even if blocks with the same numbers were previously yielded.
 
         **NOTE**: This is a daemon method; it does not terminate unless an exception occurs
         or a ``stop_block`` is given.
@@ -900,6 +1126,8 @@ class ProviderAPI(BaseInterfaceModel):
             new_block_timeout (Optional[float]): The amount of time to wait for a new block before
               timing out. Defaults to 10 seconds for local networks or ``50 * block_time`` for live
               networks.
+            on_rollback (Callable[[:class:`~ape.types.events.BlockRollback`], None] | None):
+              Optionally, a callback for when previously yielded blocks are orphaned.
 
         Returns:
             Iterator[:class:`~ape.api.providers.BlockAPI`]
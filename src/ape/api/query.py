@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from functools import cache, cached_property
 from typing import Any, TypeAlias
 
@@ -7,6 +7,7 @@ from ethpm_types.abi import EventABI, MethodABI
 from pydantic import NonNegativeInt, PositiveInt, model_validator
 
 from ape.api.transactions import ReceiptAPI, TransactionAPI
+from ape.exceptions import APINotImplementedError
 from ape.logging import logger
 from ape.types.address import AddressType
 from ape.utils.basemodel import BaseInterface, BaseInterfaceModel, BaseModel
@@ -84,6 +85,39 @@ def extract_fields(item: BaseInterfaceModel, columns: Sequence[str]) -> list[Any
     return [getattr(item, col, None) for col in columns]
 
 
+def extract_columns(
+    items: Iterable[BaseInterfaceModel], columns: Sequence[str]
+) -> dict[str, list[Any]]:
+    values: dict[str, list[Any]] = {col: [] for col in columns}
+    for item in items:
+        for col in columns:
+            values[col].append(getattr(item, col, None))
+
+    return values
+
+
+def concat_columns(
+    batches: Iterable[dict[str, Sequence[Any]]], columns: Sequence[str]
+) -> dict[str, Sequence[Any]]:
+    batches = list(batches)
+    if len(batches) == 1:
+        # NOTE: Use the columns as-is, e.g. to build a DataFrame without copying arrays.
+        return {col: batches[0][col] for col in columns}
+
+    values: dict[str, Sequence[Any]] = {}
+    for col in columns:
+        if all(isinstance(batch[col], list) for batch in batches):
+            values[col] = [value for batch in batches for value in batch[col]]
+
+        else:
+            # perf: numpy is only needed when engines return arrays.
+            import numpy as np
+
+            values[col] = np.concatenate([batch[col] for batch in batches])
+
+    return values
+
+
 class _BaseQuery(BaseModel):
     columns: Sequence[str]
 
@@ -279,6 +313,41 @@ class QueryAPI(BaseInterface):
             Iterator
         """
 
+    def perform_columnar_query(
+        self, query: QueryType, columns: Sequence[str]
+    ) -> Iterator[dict[str, Sequence[Any]]]:
+        """
+        Executes the query, returning batches of values by column (e.g. lists or NumPy
+        arrays) rather than models. Override when the engine can read columns directly.
+
+        Args:
+            query (``QueryType``): query to execute
+            columns (Sequence[str]): the (expanded) columns to return
+
+        Raises:
+            :class:`~ape.exceptions.APINotImplementedError`: When the engine cannot return
+              these columns directly, which is the default.
+
+        Returns:
+            Iterator[dict[str, Sequence[Any]]]
+        """
+        raise APINotImplementedError(f"Cannot perform columnar '{type(query).__name__}'.")
+
+    def get_cached_ranges(self, query: QueryType) -> list[tuple[int, int]]:
+        """
+        The block ranges of the query this engine can serve from its cache, allowing
+        the query manager to only fetch the rest of the query from other engines.
+        Defaults to no ranges, override to support partially cached queries.
+
+        Args:
+            query (``QueryType``): query to check
+
+        Returns:
+            list[tuple[int, int]]: Sorted, non-overlapping and inclusive
+            ``(start_block, stop_block)`` ranges within the query's range.
+        """
+        return []
+
     def update_cache(self, query: QueryType, result: Iterator[BaseInterfaceModel]):
         """
         Allows a query plugin the chance to update any cache using the results obtained
@@ -1,7 +1,8 @@
 import difflib
 import types
 from collections.abc import Callable, Iterator
-from functools import cached_property, partial, singledispatchmethod
+from contextvars import ContextVar
+from functools import cached_property, singledispatchmethod
 from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -16,7 +17,7 @@ from ape.api.address import Address, BaseAddress
 from ape.api.query import (
     ContractCreation,
     ContractEventQuery,
-    extract_fields,
+    concat_columns,
     validate_and_expand_columns,
 )
 from ape.exceptions import (
@@ -53,6 +54,7 @@ if TYPE_CHECKING:
     from ape.api.providers import CallResult
     from ape.api.transactions import ReceiptAPI, TransactionAPI
     from ape.types.address import AddressType
+    from ape_ethereum.multicall import CallBatch
 
 
 class ContractConstructor(ManagerAccessMixin):
@@ -290,9 +292,17 @@ class ContractMethodHandler(ManagerAccessMixin):
             )
 
 
+# NOTE: Set while inside `chain.batch_calls()`, so calls are collected instead of sent.
+_CALL_BATCH: ContextVar["CallBatch | None"] = ContextVar("call_batch", default=None)
+
+
 class ContractCallHandler(ContractMethodHandler):
     def __call__(self, *args, **kwargs) -> Any:
         self._validate_is_contract()
+        if (batch := _CALL_BATCH.get()) is not None and kwargs.keys() <= {"block_identifier"}:
+            # NOTE: Returns a future that resolves once the batch is flushed.
+            return batch.add(self, *args, **kwargs)
+
         selected_abi = _select_method_abi(self.abis, args)
         arguments = self.conversion_manager.convert_method_args(selected_abi, args)
 
@@ -757,12 +767,11 @@ class ContractEvent(BaseInterfaceModel):
             query["contract"] = self.contract.address
 
         contract_event_query = ContractEventQuery(**query)
-        contract_events = self.query_manager.query(
-            contract_event_query, engine_to_use=engine_to_use
-        )
         columns_ls = validate_and_expand_columns(columns, ContractLog)
-        data = map(partial(extract_fields, columns=columns_ls), contract_events)
-        return pd.DataFrame(columns=columns_ls, data=data)
+        batches = self.query_manager.query_columns(
+            contract_event_query, columns_ls, engine_to_use=engine_to_use
+        )
+        return pd.DataFrame(concat_columns(batches, columns_ls), columns=columns_ls)
 
     def range(
         self,
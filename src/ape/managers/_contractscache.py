@@ -1,10 +1,14 @@
+import hashlib
 import json
-from collections.abc import Collection
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+from weakref import WeakValueDictionary
 
 from ethpm_types import ABI, ContractType
 from ethpm_types.contract_type import ABIList
@@ -13,13 +17,20 @@ from pydantic import BaseModel
 from ape.api.networks import ProxyInfoAPI
 from ape.api.query import ContractCreation, ContractCreationQuery
 from ape.contracts.base import ContractContainer, ContractInstance
-from ape.exceptions import ApeException, ContractNotFoundError, ConversionError, CustomError
+from ape.exceptions import (
+    ApeException,
+    ContractNotFoundError,
+    ConversionError,
+    CustomError,
+    ProviderError,
+)
 from ape.logging import logger
 from ape.managers._deploymentscache import Deployment, DeploymentDiskCache
 from ape.managers.base import BaseManager
 from ape.types.address import AddressType
 from ape.utils.misc import nonreentrant
-from ape.utils.os import CacheDirectory
+from ape.utils.os import CacheDatabase, CacheDirectory
+from ape.utils.rpc import RateLimiter
 
 if TYPE_CHECKING:
     from eth_pydantic_types import HexBytes
@@ -28,12 +39,134 @@ if TYPE_CHECKING:
 
 
 _BASE_MODEL = TypeVar("_BASE_MODEL", bound=BaseModel)
+_CONTENT_ID_KEY = "content_id"
+
+
+def _get_content_id(data: dict) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf8")).hexdigest()
+
+
+def _get_content_reference(data: dict) -> str | None:
+    return data.get(_CONTENT_ID_KEY) if len(data) == 1 else None
+
+
+class MemoryCacheStats(BaseModel):
+    """
+    Statistics of the in-memory tier of an :class:`~ape.managers._contractscache.ApeDataCache`.
+    """
+
+    entries: int = 0
+    """The number of models in memory."""
+
+    size: int = 0
+    """The approximate size of the models in memory, in bytes (when bounded by size)."""
+
+    hits: int = 0
+    """The number of look-ups found in memory."""
+
+    misses: int = 0
+    """The number of look-ups not found in memory."""
+
+    evictions: int = 0
+    """The number of models evicted to stay within the bounds."""
+
+
+class _LRUMemory(OrderedDict[str, _BASE_MODEL]):
+    # NOTE: A dict of the models in memory that evicts the least-recently used
+    #   models once it holds more than `max_entries` or `max_bytes`.
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = MemoryCacheStats()
+        # key -> (model ID, size)
+        self._sizes: dict[str, tuple[int, int]] = {}
+        # model ID -> (size, number of keys), so shared models are only measured once.
+        self._model_sizes: dict[int, tuple[int, int]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: str, default=None):  # type: ignore[override]
+        with self._lock:
+            if key not in self:
+                self.stats.misses += 1
+                return default
+
+            self.stats.hits += 1
+            self.move_to_end(key)
+            return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: _BASE_MODEL):
+        with self._lock:
+            self._forget_size(key)
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if self.max_bytes is not None:
+                self._remember_size(key, value)
+
+            self._evict()
+
+    def __delitem__(self, key: str):
+        with self._lock:
+            super().__delitem__(key)
+            self._forget_size(key)
+
+    def pop(self, key: str, *args):  # type: ignore[override]
+        with self._lock:
+            self._forget_size(key)
+            return super().pop(key, *args)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._sizes.clear()
+            self._model_sizes.clear()
+            self.stats.size = 0
+
+    def _remember_size(self, key: str, value: _BASE_MODEL):
+        model_id = id(value)
+        if model_id in self._model_sizes:
+            size, num_keys = self._model_sizes[model_id]
+        else:
+            size, num_keys = len(value.model_dump_json(by_alias=True)), 0
+
+        self._model_sizes[model_id] = (size, num_keys + 1)
+        self._sizes[key] = (model_id, size)
+        self.stats.size += size
+
+    def _forget_size(self, key: str):
+        if key not in self._sizes:
+            return
+
+        model_id, size = self._sizes.pop(key)
+        self.stats.size -= size
+        _, num_keys = self._model_sizes[model_id]
+        if num_keys > 1:
+            self._model_sizes[model_id] = (size, num_keys - 1)
+        else:
+            del self._model_sizes[model_id]
+
+    def _evict(self):
+        while len(self) > 1 and (
+            (self.max_entries is not None and len(self) > self.max_entries)
+            or (self.max_bytes is not None and self.stats.size > self.max_bytes)
+        ):
+            key, _ = self.popitem(last=False)
+            self._forget_size(key)
+            self.stats.evictions += 1
 
 
 class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
     """
     A wrapper around some cached models in the data directory,
-    such as the cached contract types.
+    such as the cached contract types. By default, each model is stored
+    in its own JSON file. Pass in a ``storage``, such as a
+    :class:`~ape.utils.os.CacheDatabase`, to store them elsewhere.
+
+    Pass in a ``content_storage`` and ``deduplicate=True`` to store equal models
+    (e.g. the contract types of clones) once, by the hash of their content, rather
+    than once per key, and to share them as a single object in memory. Models
+    stored this way are read (and shared) whenever a ``content_storage`` is given.
+    Shared models must not be mutated.
     """
 
     def __init__(
@@ -43,33 +176,80 @@ class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
         network_key: str,
         key: str,
         model_type: type[_BASE_MODEL],
+        storage: CacheDirectory | CacheDatabase | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        content_storage: CacheDirectory | CacheDatabase | None = None,
+        deduplicate: bool = False,
     ):
+        if deduplicate and content_storage is None:
+            raise ValueError("Deduplicating requires a content storage.")
+
         data_folder = base_data_folder / ecosystem_key
         base_path = data_folder / network_key
         self._model_type = model_type
-        self.memory: dict[str, _BASE_MODEL] = {}
 
         # Only write if we are not testing!
         self._write_to_disk = not network_key.endswith("-fork") and network_key != "local"
         # Read from disk if using forks or live networks.
         self._read_from_disk = network_key.endswith("-fork") or network_key != "local"
 
+        # NOTE: Only bound the models in memory when evicted models can be read from disk again.
+        self.memory: dict[str, _BASE_MODEL] = (
+            _LRUMemory(max_entries=max_entries, max_bytes=max_bytes)
+            if self._write_to_disk and self._read_from_disk
+            else _LRUMemory()
+        )
+
         super().__init__(base_path / key)
+        self._storage: CacheDirectory | CacheDatabase = storage or self
+
+        self._content_storage = content_storage
+        self._deduplicate = deduplicate
+        # content ID -> model, shared by all the keys with equal models.
+        self._contents: WeakValueDictionary[str, _BASE_MODEL] = WeakValueDictionary()
+        # The content IDs known to be in the content storage.
+        self._stored_contents: set[str] = set()
 
     def __getitem__(self, key: str) -> _BASE_MODEL | None:  # type: ignore
         return self.get_type(key)
 
     def __setitem__(self, key: str, value: _BASE_MODEL):  # type: ignore
+        # NOTE: Serializing is costly, so only dump the model when hashing or writing it.
+        data = None
+        content_id = None
+        if self._deduplicate and self._content_storage is not None:
+            # NOTE: Only hash the content when storing it by reference.
+            data = value.model_dump(mode="json")
+            content_id = _get_content_id(data)
+            # Share the model with the other keys of equal models.
+            value = self._contents.setdefault(content_id, value)
+
         self.memory[key] = value
-        if self._write_to_disk:
-            # Cache to disk.
-            self.cache_data(key, value.model_dump(mode="json"))
+        if not self._write_to_disk:
+            return
+
+        if data is None:
+            data = value.model_dump(mode="json")
+
+        # Cache to disk.
+        if self._content_storage is not None and content_id:
+            if content_id not in self._stored_contents:
+                if not self._content_storage.has_data(content_id):
+                    self._content_storage.cache_data(content_id, data)
+
+                self._stored_contents.add(content_id)
+
+            self._storage.cache_data(key, {_CONTENT_ID_KEY: content_id})
+
+        else:
+            self._storage.cache_data(key, data)
 
     def __delitem__(self, key: str):
         self.memory.pop(key, None)
         if self._write_to_disk:
             # Delete the cache file.
-            self.delete_data(key)
+            self._storage.delete_data(key)
 
     def __contains__(self, key: str) -> bool:
         try:
@@ -82,15 +262,94 @@ class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
             return model
 
         elif fetch_from_disk and self._read_from_disk:
-            if data := self.get_data(key):
-                # Found on disk.
-                model = self._model_type.model_validate(data)
-                # Cache locally for next time.
+            if (data := self._storage.get_data(key)) and (model := self._load(data)):
+                # Found on disk. Cache locally for next time.
                 self.memory[key] = model
                 return model
 
         return None
 
+    def get_types(
+        self, keys: Iterable[str], fetch_from_disk: bool = True
+    ) -> dict[str, _BASE_MODEL]:
+        """
+        Get the cached models of many keys at once. Keys without a cached
+        model are not included in the result.
+        """
+        keys = list(keys)
+        models = {key: model for key in keys if (model := self.memory.get(key))}
+        if not fetch_from_disk or not self._read_from_disk:
+            return models
+
+        missing = [key for key in keys if key not in models]
+        found = self._storage.get_many(missing)
+        contents: dict[str, dict] = {}
+        if self._content_storage is not None:
+            # Read the contents referenced by many keys once.
+            content_ids = {
+                content_id
+                for data in found.values()
+                if (content_id := _get_content_reference(data)) and content_id not in self._contents
+            }
+            contents = self._content_storage.get_many(content_ids)
+
+        for key, data in found.items():
+            if model := self._load(data, contents=contents):
+                # Found on disk. Cache locally for next time.
+                models[key] = self.memory[key] = model
+
+        return {key: models[key] for key in keys if key in models}
+
+    def _load(self, data: dict, contents: dict[str, dict] | None = None) -> _BASE_MODEL | None:
+        if self._content_storage is None or not (content_id := _get_content_reference(data)):
+            # Stored in full.
+            return self._model_type.model_validate(data)
+
+        # Stored by reference to its content, shared by the keys with equal models.
+        if (model := self._contents.get(content_id)) is not None:
+            return model
+
+        content = (contents or {}).get(content_id) or self._content_storage.get_data(content_id)
+        if not content:
+            return None
+
+        model = self._model_type.model_validate(content)
+        self._contents[content_id] = model
+        return model
+
+    def prune_contents(self) -> int:
+        """
+        Delete the stored contents that no key references anymore, such as
+        after replacing or deleting deduplicated models.
+
+        Returns:
+            int: The number of deleted contents.
+        """
+        if self._content_storage is None:
+            return 0
+
+        referenced = {
+            content_id
+            for data in self._storage.get_many(self._storage.keys()).values()
+            if (content_id := _get_content_reference(data))
+        }
+        orphaned = [key for key in self._content_storage.keys() if key not in referenced]
+        for content_id in orphaned:
+            self._content_storage.delete_data(content_id)
+            self._stored_contents.discard(content_id)
+
+        return len(orphaned)
+
+    @property
+    def memory_stats(self) -> MemoryCacheStats:
+        """
+        Statistics of the models in memory, such as hits, misses and evictions.
+        """
+        if not isinstance(self.memory, _LRUMemory):
+            return MemoryCacheStats(entries=len(self.memory))
+
+        return self.memory.stats.model_copy(update={"entries": len(self.memory)})
+
 
 class ContractCache(BaseManager):
     """
@@ -141,11 +400,55 @@ class ContractCache(BaseManager):
         if cache := self._caches[ecosystem_name][network_name].get(key):
             return cache
 
+        storage = None
+        cache_config = self.config_manager.get_config("cache")
+        if cache_config.data_backend == "sqlite":
+            storage = CacheDatabase(
+                self.config_manager.DATA_FOLDER / ecosystem_name / network_name / "data.db",
+                key,
+                compress=cache_config.compress_data,
+            )
+
+        # NOTE: Contract types of clones and proxies are often equal,
+        #   so share them and (optionally) store them once by content.
+        content_storage: CacheDirectory | CacheDatabase | None = None
+        if issubclass(model_type, ContractType):
+            content_key = f"{key}_contents"
+            if storage is None:
+                network_folder = self.config_manager.DATA_FOLDER / ecosystem_name / network_name
+                content_storage = CacheDirectory(network_folder / content_key)
+            else:
+                content_storage = CacheDatabase(
+                    storage.path, content_key, compress=cache_config.compress_data
+                )
+
         self._caches[ecosystem_name][network_name][key] = ApeDataCache(
-            self.config_manager.DATA_FOLDER, ecosystem_name, network_name, key, model_type
+            self.config_manager.DATA_FOLDER,
+            ecosystem_name,
+            network_name,
+            key,
+            model_type,
+            storage=storage,
+            max_entries=cache_config.memory_max_entries,
+            max_bytes=cache_config.memory_max_bytes,
+            content_storage=content_storage,
+            deduplicate=cache_config.deduplicate_data,
         )
         return self._caches[ecosystem_name][network_name][key]
 
+    @property
+    def memory_stats(self) -> dict[str, MemoryCacheStats]:
+        """
+        Statistics of the contract data in memory, such as hits, misses and
+        evictions, by cache name.
+        """
+        return {
+            "contract_types": self.contract_types.memory_stats,
+            "proxy_infos": self.proxy_infos.memory_stats,
+            "blueprints": self.blueprints.memory_stats,
+            "contract_creations": self.contract_creations.memory_stats,
+        }
+
     @cached_property
     def deployments(self) -> DeploymentDiskCache:
         """A manager for contract deployments across networks."""
@@ -462,15 +765,25 @@ class ContractCache(BaseManager):
         return contract_type
 
     def get_multiple(
-        self, addresses: Collection[AddressType], concurrency: int | None = None
+        self,
+        addresses: Collection[AddressType],
+        concurrency: int | None = None,
+        explorer_rate_limit: float | None = None,
+        show_progress: bool = False,
     ) -> dict[AddressType, ContractType]:
         """
-        Get contract types for all given addresses.
+        Get contract types for all given addresses. First, all cached contract types
+        are looked up. Then, proxies are detected for the rest of the contracts at
+        once, before fetching their contract types from the explorer.
 
         Args:
             addresses (list[AddressType): A list of addresses to get contract types for.
             concurrency (int | None): The number of threads to use. Defaults to
               ``min(4, len(addresses))``.
+            explorer_rate_limit (float | None): The maximum number of explorer requests
+              per second, shared by all threads. Defaults to no limit.
+            show_progress (bool): Set to ``True`` to show a progress bar while
+              fetching contract types from the explorer.
 
         Returns:
             dict[AddressType, ContractType]: A mapping of addresses to their respective
@@ -480,9 +793,54 @@ class ContractCache(BaseManager):
             logger.debug("No addresses provided.")
             return {}
 
+        converted_addresses: list[AddressType] = []
+        for address in addresses:
+            if not self.conversion_manager.is_type(address, AddressType):
+                converted_address = self.conversion_manager.convert(address, AddressType)
+                converted_addresses.append(converted_address)
+            else:
+                converted_addresses.append(address)
+
+        converted_addresses = list(dict.fromkeys(converted_addresses))
+        contract_types = cast(
+            dict[AddressType, ContractType], self.contract_types.get_types(converted_addresses)
+        )
+        if not (missing := [a for a in converted_addresses if a not in contract_types]):
+            return contract_types
+
+        # Detect proxies of all the uncached contracts at once rather than one at a time.
+        proxy_infos = cast(
+            dict[AddressType, ProxyInfoAPI | None], self.proxy_infos.get_types(missing)
+        )
+        failures: dict[AddressType, Exception] = {}
+        if undetected := [address for address in missing if address not in proxy_infos]:
+            ecosystem = self.provider.network.ecosystem
+            detected = ecosystem.get_proxy_infos(undetected, raise_on_error=False)
+            for address, proxy_info in detected.items():
+                if isinstance(proxy_info, Exception):
+                    failures[address] = proxy_info
+                    continue
+
+                elif proxy_info:
+                    self.proxy_infos[address] = proxy_info
+
+                proxy_infos[address] = proxy_info
+
+        rate_limiter = RateLimiter(explorer_rate_limit) if explorer_rate_limit else None
+
         def get_contract_type(addr: AddressType):
-            addr = self.conversion_manager.convert(addr, AddressType)
-            ct = self.get(addr)
+            try:
+                ct = self.get(
+                    addr,
+                    proxy_info=proxy_infos[addr],
+                    detect_proxy=False,
+                    fetch_from_disk=False,
+                    rate_limiter=rate_limiter,
+                )
+            except ProviderError as err:
+                # NOTE: Explorer errors are already handled when fetching.
+                failures[addr] = err
+                return addr, None
 
             if not ct:
                 logger.debug(f"Failed to locate contract at '{addr}'.")
@@ -490,28 +848,34 @@ class ContractCache(BaseManager):
             else:
                 return addr, ct
 
-        converted_addresses: list[AddressType] = []
-        for address in converted_addresses:
-            if not self.conversion_manager.is_type(address, AddressType):
-                converted_address = self.conversion_manager.convert(address, AddressType)
-                converted_addresses.append(converted_address)
-            else:
-                converted_addresses.append(address)
-
-        contract_types = {}
         default_max_threads = 4
         max_threads = (
             concurrency
             if concurrency is not None
-            else min(len(addresses), default_max_threads) or default_max_threads
+            else min(len(missing), default_max_threads) or default_max_threads
         )
         with ThreadPoolExecutor(max_workers=max_threads) as pool:
-            for address, contract_type in pool.map(get_contract_type, addresses):
+            remaining = [address for address in missing if address not in failures]
+            results = pool.map(get_contract_type, remaining)
+            if show_progress:
+                from tqdm import tqdm  # type: ignore[import-untyped]
+
+                results = tqdm(results, total=len(remaining), desc="Fetching contract types")
+
+            for address, contract_type in results:
                 if contract_type is None:
                     continue
 
                 contract_types[address] = contract_type
 
+        if failures:
+            logger.warning(
+                f"Failed to get contract types for {len(failures)} of "
+                f"{len(converted_addresses)} addresses."
+            )
+            for address, err in failures.items():
+                logger.debug(f"Failed to get contract type for '{address}': {err}")
+
         return contract_types
 
     @nonreentrant(key_fn=lambda *args, **kwargs: args[1])
@@ -524,6 +888,7 @@ class ContractCache(BaseManager):
         proxy_info: ProxyInfoAPI | None = None,
         detect_proxy: bool = True,
         replace: bool = False,
+        rate_limiter: RateLimiter | None = None,
     ) -> ContractType | None:
         """
         Get a contract type by address.
@@ -550,6 +915,8 @@ class ContractCache(BaseManager):
               ``True``, the cache is replaced with the explorer result (or the
               merge of the explorer result and ``default``, when both are present).
               Defaults to ``False``.
+            rate_limiter (:class:`~ape.utils.RateLimiter` | None): Limit the explorer
+              requests, such as to share one request budget across threads.
 
         Returns:
             ContractType | None: The contract type if it was able to get one,
@@ -595,6 +962,7 @@ class ContractCache(BaseManager):
                 fetch_from_explorer=fetch_from_explorer,
                 default=default,
                 replace=replace,
+                rate_limiter=rate_limiter,
             ):
                 # `proxy_contract_type` is one of the following:
                 # 1. A ContractType with the combined proxy and implementation ABIs
@@ -605,7 +973,9 @@ class ContractCache(BaseManager):
         contract_type = None
         # Also gets cached to disk for faster lookup next time.
         if fetch_from_explorer:
-            contract_type = self._get_contract_type_from_explorer(address_key)
+            contract_type = self._get_contract_type_from_explorer(
+                address_key, rate_limiter=rate_limiter
+            )
 
         # When replacing with both an explorer result and a default, merge them
         # into the new cached value (rather than dropping the default).
@@ -628,6 +998,7 @@ class ContractCache(BaseManager):
         fetch_from_explorer: bool = True,
         default: ContractType | None = None,
         replace: bool = False,
+        rate_limiter: RateLimiter | None = None,
     ) -> ContractType | None:
         """
         Combines the discoverable ABIs from the proxy contract and its implementation.
@@ -637,9 +1008,13 @@ class ContractCache(BaseManager):
             fetch_from_explorer=fetch_from_explorer,
             default=default,
             replace=replace,
+            rate_limiter=rate_limiter,
         )
         proxy_contract_type = self._get_contract_type(
-            address, fetch_from_explorer=fetch_from_explorer, replace=replace
+            address,
+            fetch_from_explorer=fetch_from_explorer,
+            replace=replace,
+            rate_limiter=rate_limiter,
         )
         if proxy_contract_type is not None and implementation_contract_type is not None:
             combined_contract = _get_combined_contract_type(
@@ -670,6 +1045,7 @@ class ContractCache(BaseManager):
         fetch_from_explorer: bool = True,
         default: ContractType | None = None,
         replace: bool = False,
+        rate_limiter: RateLimiter | None = None,
     ) -> ContractType | None:
         """
         Get the _exact_ ContractType for a given address. For proxy contracts, returns
@@ -680,7 +1056,7 @@ class ContractCache(BaseManager):
                 return contract_type
 
         if fetch_from_explorer:
-            return self._get_contract_type_from_explorer(address)
+            return self._get_contract_type_from_explorer(address, rate_limiter=rate_limiter)
 
         return default
 
@@ -917,16 +1293,21 @@ class ContractCache(BaseManager):
                 self.contract_creations,
                 self.blueprints,
             ):
-                cache.memory = {}
+                cache.memory.clear()
 
         self.deployments.clear_local()
 
-    def _get_contract_type_from_explorer(self, address: AddressType) -> ContractType | None:
-        if not self.provider.network.explorer:
+    def _get_contract_type_from_explorer(
+        self, address: AddressType, rate_limiter: RateLimiter | None = None
+    ) -> ContractType | None:
+        if not (explorer := self.provider.network.explorer):
             return None
 
+        if rate_limiter:
+            rate_limiter.acquire()
+
         try:
-            contract_type = self.provider.network.explorer.get_contract_type(address)
+            contract_type = explorer.get_contract_type(address)
         except Exception as err:
             explorer_name = self.provider.network.explorer.name
             if "rate limit" in str(err).lower():
@@ -1,12 +1,15 @@
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from functools import cached_property, partial, singledispatchmethod
 from statistics import mean, median
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Any, ClassVar, cast
 
 import pandas as pd
+from hexbytes import HexBytes
+from pydantic import ValidationError
 from rich.box import SIMPLE
 from rich.table import Table
 
@@ -15,6 +18,7 @@ from ape.api.providers import BlockAPI
 from ape.api.query import (
     AccountTransactionQuery,
     BlockQuery,
+    concat_columns,
     extract_fields,
     validate_and_expand_columns,
 )
@@ -33,14 +37,22 @@ from ape.logging import get_rich_console, logger
 from ape.managers._contractscache import ContractCache
 from ape.managers.base import BaseManager
 from ape.types.address import AddressType
-from ape.utils.basemodel import BaseInterfaceModel
-from ape.utils.misc import ZERO_ADDRESS, is_evm_precompile, is_zero_hex, log_instead_of_fail
+from ape.utils.basemodel import BaseInterfaceModel, DiskCacheableModel
+from ape.utils.misc import (
+    ZERO_ADDRESS,
+    is_evm_precompile,
+    is_zero_hex,
+    log_instead_of_fail,
+    to_int,
+)
 
 if TYPE_CHECKING:
     from rich.console import Console as RichConsole
 
     from ape.api.providers import ProviderAPI
     from ape.types import BlockID, ContractCode, GasReport, SnapshotID, SourceTraceback
+    from ape.types.events import BlockRollback
+    from ape_ethereum.multicall import CallBatch
 
 
 class BlockContainer(BaseManager):
@@ -173,13 +185,11 @@ class BlockContainer(BaseManager):
             step=step,
         )
 
-        blocks = self.query_manager.query(query, engine_to_use=engine_to_use)
         columns: list[str] = validate_and_expand_columns(  # type: ignore
             columns, self.head.__class__
         )
-        extraction = partial(extract_fields, columns=columns)
-        data = map(lambda b: extraction(b), blocks)
-        return pd.DataFrame(columns=columns, data=data)
+        batches = self.query_manager.query_columns(query, columns, engine_to_use=engine_to_use)
+        return pd.DataFrame(concat_columns(batches, columns), columns=columns)
 
     def range(
         self,
@@ -247,13 +257,14 @@ class BlockContainer(BaseManager):
         stop_block: int | None = None,
         required_confirmations: int | None = None,
         new_block_timeout: int | None = None,
+        on_rollback: Callable[["BlockRollback"], None] | None = None,
     ) -> Iterator[BlockAPI]:
         """
         Poll new blocks. Optionally set a start block to include historical blocks.
 
-        **NOTE**: When a chain reorganization occurs, this method logs an error and
-        yields the missed blocks, even if they were previously yielded with different
-        block numbers.
+        **NOTE**: When a chain reorganization occurs, this method logs an error,
+        calls ``on_rollback`` with the orphaned blocks, and yields the new chain's
+        blocks after the fork, even if blocks with the same numbers were previously yielded.
 
         **NOTE**: This is a daemon method; it does not terminate unless an exception occurs
         or a ``stop_block`` is given.
@@ -276,6 +287,8 @@ class BlockContainer(BaseManager):
             new_block_timeout (float | None): The amount of time to wait for a new block before
               timing out. Defaults to 10 seconds for local networks or ``50 * block_time`` for live
               networks.
+            on_rollback (Callable[[:class:`~ape.types.events.BlockRollback`], None] | None):
+              Optionally, a callback for when previously yielded blocks are orphaned.
 
         Returns:
             Iterator[:class:`~ape.api.providers.BlockAPI`]
@@ -296,10 +309,13 @@ class BlockContainer(BaseManager):
             for block in self.range(start_block, head_minus_confirms + 1):
                 yield block
 
+        # NOTE: Only given when set, as providers may not support it.
+        poll_kwargs = {"on_rollback": on_rollback} if on_rollback is not None else {}
         yield from self.provider.poll_blocks(
             stop_block=stop_block,
             required_confirmations=required_confirmations,
             new_block_timeout=new_block_timeout,
+            **poll_kwargs,
         )
 
 
@@ -325,10 +341,9 @@ class AccountHistory(BaseInterfaceModel):
         """
 
         start_nonce = 0
-        stop_nonce = len(self) - 1  # just to cache this value
+        stop_nonce = len(self)  # NOTE: Only get the nonce once.
 
-        # TODO: Add ephemeral network sessional history to `ape-cache` instead,
-        #       and remove this (replace with `yield from iter(self[:len(self)])`)
+        # NOTE: Live networks also index the history in `ape-cache`, if initialized.
         for receipt in self.sessional:
             if receipt.nonce is None:
                 # Not an on-chain receipt? idk - has only seen as anomaly in tests.
@@ -339,14 +354,14 @@ class AccountHistory(BaseInterfaceModel):
 
             elif receipt.nonce > start_nonce:
                 # NOTE: There's a gap in our sessional history, so fetch from query engine
-                yield from iter(self[start_nonce : receipt.nonce + 1])
+                yield from self._get_range(start_nonce, receipt.nonce)
 
             yield receipt
             start_nonce = receipt.nonce + 1  # start next loop on the next item
 
-        if start_nonce != stop_nonce:
+        if start_nonce < stop_nonce:
             # NOTE: there is no more session history, so just return query engine iterator
-            yield from iter(self[start_nonce : stop_nonce + 1])
+            yield from self._get_range(start_nonce, stop_nonce)
 
     def query(
         self,
@@ -378,18 +393,19 @@ class AccountHistory(BaseInterfaceModel):
             pd.DataFrame
         """
 
+        nonce = len(self)
         if start_nonce < 0:
-            start_nonce = len(self) + start_nonce
+            start_nonce = nonce + start_nonce
 
         if stop_nonce is None:
-            stop_nonce = len(self)
+            stop_nonce = nonce
 
         elif stop_nonce < 0:
-            stop_nonce = len(self) + stop_nonce
+            stop_nonce = nonce + stop_nonce
 
-        elif stop_nonce > len(self):
+        elif stop_nonce > nonce:
             raise ChainError(
-                f"'stop={stop_nonce}' cannot be greater than account's current nonce ({len(self)})."
+                f"'stop={stop_nonce}' cannot be greater than account's current nonce ({nonce})."
             )
 
         query = AccountTransactionQuery(
@@ -443,23 +459,27 @@ class AccountHistory(BaseInterfaceModel):
 
     @__getitem__.register
     def __getitem_slice(self, indices: slice) -> list[ReceiptAPI]:
+        nonce = len(self)
         start, stop, step = (
             indices.start or 0,
-            indices.stop or len(self),
+            indices.stop or nonce,
             indices.step or 1,
         )
 
         if start < 0:
-            start += len(self)
+            start += nonce
 
         if stop < 0:
-            stop += len(self)
+            stop += nonce
 
-        elif stop > len(self):
+        elif stop > nonce:
             raise ChainError(
-                f"'stop={stop}' cannot be greater than account's current nonce ({len(self)})."
+                f"'stop={stop}' cannot be greater than account's current nonce ({nonce})."
             )
 
+        return self._get_range(start, stop, step=step)
+
+    def _get_range(self, start: int, stop: int, step: int = 1) -> list[ReceiptAPI]:
         if stop <= start:
             return []  # nothing to query
 
@@ -726,6 +746,68 @@ class ChainIdCache(dict):
         return self[key]
 
 
+class BlockTimestampIndex(DiskCacheableModel):
+    """
+    A sparse index of the timestamps of confirmed blocks, by block number.
+    """
+
+    timestamps: dict[int, int] = {}
+
+    max_size: ClassVar[int] = 10_000
+    """
+    The maximum number of indexed blocks. When exceeded, every other block is dropped,
+    so the index stays spread across the chain.
+    """
+
+    # NOTE: Sorted by number (and so by timestamp), for bisecting.
+    _numbers: list[int] = []
+    _times: list[int] = []
+
+    def model_post_init(self, context: Any) -> None:
+        super().model_post_init(context)
+        self._numbers = sorted(self.timestamps)
+        self._times = [self.timestamps[number] for number in self._numbers]
+
+    def add(self, number: int, timestamp: int):
+        """
+        Index the timestamp of a block.
+
+        Args:
+            number (int): The block number.
+            timestamp (int): The block's timestamp.
+        """
+        if number in self.timestamps:
+            return
+
+        position = bisect_left(self._numbers, number)
+        self._numbers.insert(position, number)
+        self._times.insert(position, timestamp)
+        self.timestamps[number] = timestamp
+        if len(self._numbers) > self.max_size:
+            self._numbers = self._numbers[::2]
+            self._times = self._times[::2]
+            self.timestamps = dict(zip(self._numbers, self._times))
+
+    def get_bounds(self, time: int) -> tuple[tuple[int, int] | None, tuple[int, int] | None]:
+        """
+        Get the closest indexed blocks before and at-or-after the given time.
+
+        Args:
+            time (int): The time to get the bounds of.
+
+        Returns:
+            tuple: The ``(number, timestamp)`` of each bound, or ``None`` if there isn't one.
+        """
+        position = bisect_left(self._times, time)
+        lower = (self._numbers[position - 1], self._times[position - 1]) if position else None
+        upper = (
+            (self._numbers[position], self._times[position])
+            if position < len(self._numbers)
+            else None
+        )
+        return lower, upper
+
+
 class ChainManager(BaseManager):
     """
     A class for managing the state of the active blockchain.
@@ -743,6 +825,7 @@ class ChainManager(BaseManager):
     _transaction_history_map: dict[int, TransactionHistory] = {}
     _reports: ReportManager = ReportManager()
     _code: dict[str, dict[str, dict[AddressType, "ContractCode"]]] = {}
+    _block_timestamp_indexes: dict[str, BlockTimestampIndex] = {}
 
     @cached_property
     def contracts(self) -> ContractCache:
@@ -831,13 +914,15 @@ class ChainManager(BaseManager):
     ) -> "BlockAPI":
         """
         Search for a block closest to time ``time``.
+        Uses an interpolation search over block timestamps, starting from the
+        closest blocks found by previous searches on the network.
 
         **IMPORTANT**: This method returns the closest block at or after ``time``.
 
         Args:
             time: (datetime | int): Time of block to search for.
             block_time_secs: (int | None):
-                The average amount of time between blocks. Influenced the search algorithm.
+                The average amount of time between blocks, used for the first guess.
                 Defaults to the configured block time for this chain.
 
         Returns:
@@ -847,35 +932,87 @@ class ChainManager(BaseManager):
         if isinstance(time, datetime):
             time = int(time.timestamp())
 
-        if time < (genesis := self.blocks[0]).timestamp:
-            return genesis
-
-        elif time > (head := self.blocks.head).timestamp:
-            raise ValueError(f"Time {time} is after head.")
+        head = self.blocks.head
         assert head.number is not None  # mypy happy
+        if time > head.timestamp:
+            raise ValueError(f"Time {time} is after head.")
 
-        # NOTE: This is only an estimate of the block time, used for the algorithm
-        block_time_secs = block_time_secs or self.network_manager.network.block_time or 1
+        index = self._get_block_timestamp_index()
+        confirmed_block = head.number - self.provider.network.required_confirmations
+        indexed = len(index.timestamps)
 
-        est_blocks = int((self.pending_timestamp - time) / block_time_secs)
-        block = self.blocks[max(head.number - est_blocks, 0)]
-        assert block.number is not None  # mypy happy
+        def get_timestamp(number: int) -> int:
+            # NOTE: Probe using only the block header, without its transactions.
+            try:
+                timestamp = to_int(next(self.provider.get_block_headers([number]))["timestamp"])
+            except APINotImplementedError:
+                timestamp = self.provider.get_block(number).timestamp
+
+            if number <= confirmed_block:
+                index.add(number, timestamp)
+
+            return timestamp
+
+        # NOTE: Search between blocks `lower` (before `time`) and `upper` (at or after `time`).
+        lower, upper = index.get_bounds(time)
+        upper = upper or (head.number, head.timestamp)
+        if lower is None:
+            if time <= (genesis_timestamp := get_timestamp(0)):
+                upper = (0, genesis_timestamp)
+
+            lower = (0, genesis_timestamp)
+
+        # NOTE: This is only an estimate of the block time, used for the first guess.
+        block_time_secs = block_time_secs or self.network_manager.network.block_time
+        guess = upper[0] - (upper[1] - time) // block_time_secs if block_time_secs else None
+        interpolate = True
+        while upper[0] - lower[0] > 1:
+            size = upper[0] - lower[0]
+            if guess is None:
+                if interpolate and upper[1] > lower[1]:
+                    guess = lower[0] + (time - lower[1]) * size // (upper[1] - lower[1])
+                else:
+                    guess = lower[0] + size // 2
+
+            number = min(max(guess, lower[0] + 1), upper[0] - 1)
+            if (timestamp := get_timestamp(number)) < time:
+                lower = (number, timestamp)
+            else:
+                upper = (number, timestamp)
 
-        # NOTE: Ordering here favors having a block with `.timestamp` that is after `time`
-        while time > block.timestamp and (
-            est_blocks := int((time - block.timestamp) / block_time_secs)
-        ):
-            block = self.blocks[min(block.number + est_blocks, head.number)]
-            assert block.number is not None  # mypy happy
+            # NOTE: Bisect next when interpolating didn't halve the range,
+            #   e.g. because of irregular block times.
+            interpolate = upper[0] - lower[0] <= size // 2
+            guess = None
 
-        assert block.number is not None  # mypy happy
-        while time < block.timestamp and (
-            est_blocks := int((block.timestamp - time) / block_time_secs)
-        ):
-            block = self.blocks[max(block.number - est_blocks, 0)]
-            assert block.number is not None  # mypy happy
+        if len(index.timestamps) > indexed and not self.provider.network.is_dev:
+            index.model_dump_file()
+
+        return self.blocks[upper[0]]
+
+    def _get_block_timestamp_index(self) -> BlockTimestampIndex:
+        network = self.provider.network
+        if network.is_dev:
+            # NOTE: Local networks can revert to snapshots and travel in time.
+            return BlockTimestampIndex()
+
+        key = f"{network.ecosystem.name}:{network.name}"
+        if key not in self._block_timestamp_indexes:
+            path = (
+                self.config_manager.DATA_FOLDER
+                / network.ecosystem.name
+                / network.name
+                / "block_timestamps.json"
+            )
+            try:
+                index = BlockTimestampIndex.model_validate_file(path)
+            except ValidationError:
+                path.unlink(missing_ok=True)
+                index = BlockTimestampIndex.model_validate_file(path)
 
-        return block
+            self._block_timestamp_indexes[key] = index
+
+        return self._block_timestamp_indexes[key]
 
     @log_instead_of_fail(default="<ChainManager>")
     def __repr__(self) -> str:
@@ -986,6 +1123,31 @@ class ChainManager(BaseManager):
             # Provider does not support time travel.
             pass
 
+    @contextmanager
+    def batch_calls(self, **kwargs) -> Iterator["CallBatch"]:
+        """
+        Collect the contract calls made in the context and perform them together using
+        Multicall3, one ``aggregate3`` call per block identifier. Calls made in the
+        context return a :class:`~ape_ethereum.multicall.CallFuture`, which resolves
+        once the context exits (or sooner, when its result is requested).
+
+        Usage example::
+
+            with chain.batch_calls():
+                supply = token.totalSupply()
+                balance = token.balanceOf(owner)
+
+            print(balance.result() / supply.result())
+
+        Args:
+            **kwargs: Additional kwargs for :class:`~ape_ethereum.multicall.CallBatch`,
+              such as the Multicall3 ``address``.
+        """
+        from ape_ethereum.multicall import CallBatch
+
+        with CallBatch(**kwargs) as batch:
+            yield batch
+
     def mine(
         self,
         num_blocks: int = 1,
@@ -1093,6 +1255,35 @@ class ChainManager(BaseManager):
         self._code[network.ecosystem.name][network.name][address] = code
         return code
 
+    def get_codes(self, addresses: Iterable[AddressType]) -> dict[AddressType, "ContractCode"]:
+        """
+        Get the code of many contracts, fetching any code not yet
+        cached in a single batch request when the provider supports it.
+
+        Args:
+            addresses (Iterable[AddressType]): The contract addresses.
+
+        Returns:
+            dict[AddressType, ContractCode]: The code of each contract.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        network = self.provider.network
+        if network.is_dev:
+            # NOTE: Same as `get_code()`, avoid caching on dev networks.
+            cache: dict[AddressType, "ContractCode"] = {}
+        else:
+            cache = self._code.setdefault(network.ecosystem.name, {}).setdefault(network.name, {})
+
+        if missing := [address for address in addresses if address not in cache]:
+            if len(missing) > 1 and self.provider.supports_batch_requests:
+                requests = [("eth_getCode", [address, "latest"]) for address in missing]
+                results = self.provider.make_batch_request(requests)
+                cache.update({a: HexBytes(code) for a, code in zip(missing, results)})
+            else:
+                cache.update({address: self.provider.get_code(address) for address in missing})
+
+        return {address: cache[address] for address in addresses}
+
     def get_delegate(self, address: AddressType) -> BaseAddress | None:
         ecosystem = self.provider.network.ecosystem
 
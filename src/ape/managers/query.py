@@ -1,9 +1,20 @@
+import atexit
 import difflib
+import json
+import os
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
 from functools import cached_property, singledispatchmethod
-from itertools import tee
+from itertools import islice
+from pathlib import Path
+from queue import Queue
+from tempfile import NamedTemporaryFile
+from threading import Event, Thread
+from typing import Any, ClassVar, cast
 
+from pydantic import ValidationError
+
+from ape.api.providers import ProviderAPI
 from ape.api.query import (
     AccountTransactionQuery,
     BaseInterfaceModel,
@@ -12,13 +23,15 @@ from ape.api.query import (
     ContractEventQuery,
     QueryAPI,
     QueryType,
+    extract_columns,
 )
 from ape.api.transactions import ReceiptAPI, TransactionAPI
 from ape.contracts.base import ContractLog, LogFilter
-from ape.exceptions import QueryEngineError
+from ape.exceptions import APINotImplementedError, QueryEngineError
 from ape.logging import logger
 from ape.plugins._utils import clean_plugin_name
-from ape.utils.basemodel import ManagerAccessMixin
+from ape.utils.basemodel import BaseModel, DiskCacheableModel, ManagerAccessMixin
+from ape.utils.process import concurrent_map
 
 
 class DefaultQueryProvider(QueryAPI):
@@ -61,12 +74,48 @@ class DefaultQueryProvider(QueryAPI):
 
     @perform_query.register
     def perform_block_query(self, query: BlockQuery) -> Iterator:
-        return map(
-            self.provider.get_block,
-            # NOTE: the range stop block is a non-inclusive stop.
-            #       Where the query method is an inclusive stop.
-            range(query.start_block, query.stop_block + 1, query.step),
-        )
+        # NOTE: the range stop block is a non-inclusive stop.
+        #       Where the query method is an inclusive stop.
+        block_ids = range(query.start_block, query.stop_block + 1, query.step)
+        page_size = max(self.provider.batch_size, 1)
+        if len(block_ids) <= page_size:
+            yield from self.provider.get_blocks(block_ids)
+            return
+
+        pages = (block_ids[idx : idx + page_size] for idx in range(0, len(block_ids), page_size))
+        # NOTE: Fetch pages concurrently (bounded by the provider's concurrency),
+        #   but still yield the blocks in order and only as they are consumed.
+        for page in concurrent_map(
+            lambda ids: list(self.provider.get_blocks(ids)), pages, self.provider.concurrency
+        ):
+            yield from page
+
+    def perform_columnar_query(
+        self, query: QueryType, columns: Sequence[str]
+    ) -> Iterator[dict[str, Sequence[Any]]]:
+        if not isinstance(query, BlockQuery):
+            raise APINotImplementedError(f"Cannot perform columnar '{type(query).__name__}'.")
+
+        elif type(self.provider).get_block_headers is ProviderAPI.get_block_headers:
+            raise APINotImplementedError("Provider cannot get block headers.")
+
+        # NOTE: Raises when the columns are not all in the block headers.
+        self.provider.network.ecosystem.decode_block_columns([], columns)
+        return self._perform_block_columnar_query(query, columns)
+
+    def _perform_block_columnar_query(
+        self, query: BlockQuery, columns: Sequence[str]
+    ) -> Iterator[dict[str, Sequence[Any]]]:
+        ecosystem = self.provider.network.ecosystem
+        block_ids = range(query.start_block, query.stop_block + 1, query.step)
+        page_size = max(self.provider.batch_size, 1)
+        pages = (block_ids[idx : idx + page_size] for idx in range(0, len(block_ids), page_size))
+
+        def get_page(ids: Sequence[int]) -> dict[str, Sequence[Any]]:
+            headers = list(self.provider.get_block_headers(ids))
+            return cast(dict[str, Sequence[Any]], ecosystem.decode_block_columns(headers, columns))
+
+        yield from concurrent_map(get_page, pages, self.provider.concurrency)
 
     @perform_query.register
     def perform_block_transaction_query(
@@ -98,6 +147,201 @@ class DefaultQueryProvider(QueryAPI):
         )
 
 
+class QueryEngineStats(BaseModel):
+    """
+    The observed performance of a query engine for a type of query on a network.
+    """
+
+    samples: int = 0
+    """
+    The number of completed queries.
+    """
+
+    results: int = 0
+    """
+    The total number of results returned.
+    """
+
+    total_time: float = 0.0
+    """
+    The total time spent in the engine, in milliseconds.
+    """
+
+    time_ratio: float = 1.0
+    """
+    The (exponentially weighted) ratio of the observed time to the engine's estimate.
+    """
+
+    @property
+    def time_per_result(self) -> float | None:
+        """
+        The average time per result, in milliseconds.
+        """
+        return self.total_time / self.results if self.results else None
+
+    def record(self, results: int, exec_time: float, est_time: int | None, weight: float):
+        self.samples += 1
+        self.results += results
+        self.total_time += exec_time
+        if est_time:
+            ratio = exec_time / est_time
+            self.time_ratio = (
+                ratio if self.samples == 1 else (weight * ratio + (1 - weight) * self.time_ratio)
+            )
+
+
+class QueryStatsMap(DiskCacheableModel):
+    """
+    Observed query engine performance, by network choice, engine name and query type.
+    """
+
+    networks: dict[str, dict[str, dict[str, QueryEngineStats]]] = {}
+
+    flush_interval: ClassVar[float] = 30.0
+    """
+    The minimum number of seconds between writes of the recorded stats to disk.
+    """
+
+    _dirty: bool = False
+    _last_flush: float | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, network: str, engine: str, query_type: str) -> QueryEngineStats | None:
+        return self.networks.get(network, {}).get(engine, {}).get(query_type)
+
+    def record(
+        self,
+        network: str,
+        engine: str,
+        query_type: str,
+        results: int,
+        exec_time: float,
+        est_time: int | None,
+        weight: float,
+    ):
+        stats = (
+            self.networks.setdefault(network, {})
+            .setdefault(engine, {})
+            .setdefault(query_type, QueryEngineStats())
+        )
+        stats.record(results, exec_time, est_time, weight)
+        self._dirty = True
+        # NOTE: Write periodically rather than after every query; ``flush()`` runs at exit.
+        if self._last_flush is None or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the recorded stats to disk, if any changed since the last write.
+        """
+        if not self._dirty:
+            return
+
+        # NOTE: Write to a temporary file first, so concurrent readers never see a partial file.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f".{self.path.name}.", delete=False
+        ) as file:
+            file.write(self.model_dump_json())
+
+        os.replace(file.name, self.path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+
+class _CacheWriteAborted(Exception):
+    """
+    Raised to a cache writer's ``update_cache`` when the result is not fully consumed.
+    """
+
+
+class _CacheWriter:
+    """
+    Feeds a query result to an engine's ``update_cache`` on a background thread,
+    through a bounded queue of chunks.
+    """
+
+    def __init__(self, engine: QueryAPI, query: QueryType, queue_size: int):
+        self.engine = engine
+        self.query = query
+        self.queue_size = max(queue_size, 1)
+        # NOTE: Reserve a slot for the final ``None``, so closing never blocks.
+        self._chunks: Queue[list[BaseInterfaceModel] | None] = Queue(maxsize=self.queue_size + 1)
+        self._aborted = Event()
+        self._finished = Event()
+        self.error: Exception | None = None
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def engine_name(self) -> str:
+        return type(self.engine).__name__
+
+    @property
+    def active(self) -> bool:
+        return not self._aborted.is_set() and not self._finished.is_set()
+
+    def put(self, chunk: list[BaseInterfaceModel]):
+        if not self.active:
+            return
+
+        elif self._chunks.qsize() >= self.queue_size:
+            # NOTE: Skip the cache update rather than stalling the consumer.
+            logger.warning(f"{self.engine_name}: Cache writer fell behind, skipping cache update.")
+            self.abort()
+
+        else:
+            self._chunks.put_nowait(chunk)
+
+    def close(self):
+        if self.active:
+            self._chunks.put_nowait(None)
+
+    def abort(self):
+        if self.active:
+            self._aborted.set()
+            self._chunks.put_nowait(None)
+
+    def wait(self, timeout: float | None = None):
+        """
+        Wait for the cache update to finish. Errors are logged, but not raised.
+        """
+        self._thread.join(timeout=timeout)
+
+    def join(self, timeout: float | None = None):
+        """
+        Wait for the cache update to finish, re-raising the error it failed with (if any).
+        """
+        self.wait(timeout=timeout)
+        if self.error is not None:
+            raise self.error
+
+    def _iter_chunks(self) -> Iterator[BaseInterfaceModel]:
+        while (chunk := self._chunks.get()) is not None:
+            yield from chunk
+
+        if self._aborted.is_set():
+            raise _CacheWriteAborted()
+
+    def _run(self):
+        try:
+            self.engine.update_cache(self.query, self._iter_chunks())
+        except _CacheWriteAborted:
+            logger.debug(f"{self.engine_name}: Cache update aborted.")
+        except QueryEngineError as err:
+            self.error = err
+            logger.warning(f"{self.engine_name}: Cache update failed: {err}")
+        except Exception as err:
+            # NOTE: Nothing else sees errors raised on this thread, so record them here.
+            self.error = err
+            logger.error_from_exception(err, f"{self.engine_name}: Cache update failed.")
+        finally:
+            self._finished.set()
+
+
 class QueryManager(ManagerAccessMixin):
     """
     A singleton that manages query engines and performs queries.
@@ -110,6 +354,26 @@ class QueryManager(ManagerAccessMixin):
          biggest_block_size = chain.blocks.query("size").max()
     """
 
+    cache_chunk_size: int = 1000
+    """
+    The number of results handed to the cache engines at a time.
+    """
+
+    cache_queue_size: int = 8
+    """
+    The number of chunks a cache engine may fall behind before its update is skipped.
+    """
+
+    min_stats_samples: int = 3
+    """
+    The number of observed queries needed before adjusting an engine's estimates.
+    """
+
+    stats_weight: float = 0.3
+    """
+    The weight of the latest observation when updating an engine's observed performance.
+    """
+
     @cached_property
     def engines(self) -> dict[str, QueryAPI]:
         """
@@ -120,7 +384,12 @@ class QueryManager(ManagerAccessMixin):
             dict[str, :class:`~ape.api.query.QueryAPI`]
         """
 
-        engines: dict[str, QueryAPI] = {"__default__": DefaultQueryProvider()}
+        from ape_cache.query import ContractLogCache
+
+        engines: dict[str, QueryAPI] = {
+            "__default__": DefaultQueryProvider(),
+            "__logs__": ContractLogCache(),
+        }
 
         for plugin_name, engine_class in self.plugin_manager.query_engines:
             engine_name = clean_plugin_name(plugin_name)
@@ -131,6 +400,189 @@ class QueryManager(ManagerAccessMixin):
     def _suggest_engines(self, engine_selection):
         return difflib.get_close_matches(engine_selection, list(self.engines), cutoff=0.6)
 
+    def _get_cached_segments(
+        self, query: BlockQuery | ContractEventQuery
+    ) -> list[tuple[QueryAPI | None, int, int]]:
+        # NOTE: Use the engine with the most of the query's range cached.
+        coverage = []
+        for engine in self.engines.values():
+            if ranges := engine.get_cached_ranges(query):
+                coverage.append((sum(1 + stop - start for start, stop in ranges), engine, ranges))
+
+        if not coverage:
+            return []
+
+        _, cache_engine, cached_ranges = max(coverage, key=lambda c: c[0])
+        # NOTE: Segments without an engine are the gaps between the cached ranges.
+        segments: list[tuple[QueryAPI | None, int, int]] = []
+        next_block = query.start_block
+        for start_block, stop_block in cached_ranges:
+            if start_block > next_block:
+                segments.append((None, next_block, start_block - 1))
+
+            segments.append((cache_engine, start_block, stop_block))
+            next_block = stop_block + 1
+
+        if next_block <= query.stop_block:
+            segments.append((None, next_block, query.stop_block))
+
+        return segments
+
+    def _query_segments(
+        self,
+        query: BlockQuery | ContractEventQuery,
+        segments: list[tuple[QueryAPI | None, int, int]],
+    ) -> Iterator[BaseInterfaceModel]:
+        for engine, start_block, stop_block in segments:
+            # NOTE: Keep the segment aligned with the steps of the whole query.
+            start_block += (query.start_block - start_block) % query.step
+            if start_block > stop_block:
+                continue
+
+            segment = query.model_copy(
+                update={"start_block": start_block, "stop_block": stop_block}
+            )
+            if engine is None:
+                yield from self.query(segment)
+            else:
+                yield from engine.perform_query(segment)
+
+    @cached_property
+    def engine_stats(self) -> QueryStatsMap:
+        """
+        The observed performance of each query engine, used to adjust their estimates.
+
+        Returns:
+            :class:`~ape.managers.query.QueryStatsMap`
+        """
+        path = self.config_manager.DATA_FOLDER / "query_stats.json"
+        try:
+            stats = QueryStatsMap.model_validate_file(path)
+        except (ValidationError, json.JSONDecodeError):
+            path.unlink(missing_ok=True)
+            stats = QueryStatsMap.model_validate_file(path)
+
+        atexit.register(stats.flush)
+        return stats
+
+    def reset_engine_stats(self):
+        """
+        Forget the observed performance of all query engines.
+        """
+        stats = self.engine_stats
+        atexit.unregister(stats.flush)
+        stats.path.unlink(missing_ok=True)
+        self.__dict__.pop("engine_stats", None)
+
+    @property
+    def _network_choice(self) -> str | None:
+        if not self.network_manager.connected:
+            return None
+
+        return self.provider.network.choice
+
+    def _estimate_query(self, engine_name: str, query: QueryType) -> int | None:
+        est_time = self.engines[engine_name].estimate_query(query)
+        return self._adjust_estimate(engine_name, query, est_time)
+
+    def _adjust_estimate(
+        self, engine_name: str, query: QueryType, est_time: int | None
+    ) -> int | None:
+        if (
+            est_time is None
+            or (network := self._network_choice) is None
+            or (stats := self.engine_stats.get(network, engine_name, type(query).__name__)) is None
+            or stats.samples < self.min_stats_samples
+        ):
+            return est_time
+
+        # NOTE: Adjust the estimate by how the engine actually performs on this network.
+        return int(est_time * stats.time_ratio)
+
+    def _select_engine(
+        self, query: QueryType, engine_to_use: str | None = None
+    ) -> tuple[str, QueryAPI, int | None]:
+        if engine_to_use:
+            if engine_to_use not in self.engines:
+                raise QueryEngineError(
+                    f"Query engine `{engine_to_use}` not found. "
+                    f"Did you mean {' or '.join(self._suggest_engines(engine_to_use))}?"
+                )
+
+            return (
+                engine_to_use,
+                self.engines[engine_to_use],
+                self.engines[engine_to_use].estimate_query(query),
+            )
+
+        # Get heuristics from all the query engines to perform this query
+        estimates = map(lambda name: (name, self.engines[name].estimate_query(query)), self.engines)
+
+        # Ignore query engines that can't perform this query
+        valid_estimates = filter(lambda qe: qe[1] is not None, estimates)
+
+        try:
+            # Find the "best" engine to perform the query
+            # NOTE: Sorted by fastest time heuristic, adjusted by the observed performance.
+            #   The engine's own estimate is returned, so the observed ratio is measured
+            #   against it rather than against an already-adjusted estimate.
+            sel_engine_name, est_time = min(
+                valid_estimates,
+                key=lambda qe: self._adjust_estimate(qe[0], query, qe[1]),  # type: ignore
+            )
+
+        except ValueError as e:
+            raise QueryEngineError("No query engines are available.") from e
+
+        return sel_engine_name, self.engines[sel_engine_name], est_time
+
+    def _measure(
+        self,
+        query: QueryType,
+        engine_name: str,
+        est_time: int | None,
+        result: Iterator,
+        count: Callable[[Any], int] = lambda _: 1,
+    ) -> Iterator:
+        # NOTE: Only count the time spent in the engine, not in the consumer.
+        exec_time = 0
+        results = 0
+        while True:
+            start_time = time.perf_counter_ns()
+            try:
+                item = next(result)
+            except StopIteration:
+                exec_time += time.perf_counter_ns() - start_time
+                break
+
+            exec_time += time.perf_counter_ns() - start_time
+            results += count(item)
+            yield item
+
+        exec_time_ms = exec_time / 1_000_000
+        logger.debug(
+            f"{engine_name}: {type(query).__name__} executed in {exec_time_ms:.2f} ms "
+            f"(expected: {est_time} ms)"
+        )
+        if network := self._network_choice:
+            self.engine_stats.record(
+                network,
+                engine_name,
+                type(query).__name__,
+                results,
+                exec_time_ms,
+                est_time,
+                self.stats_weight,
+            )
+
+    def _get_segments(
+        self, query: QueryType, engine_to_use: str | None = None
+    ) -> list[tuple[QueryAPI | None, int, int]]:
+        if engine_to_use or not isinstance(query, (BlockQuery, ContractEventQuery)):
+            return []
+
+        return self._get_cached_segments(query)
+
     def query(
         self,
         query: QueryType,
@@ -150,59 +602,116 @@ class QueryManager(ManagerAccessMixin):
             Iterator[``BaseInterfaceModel``]
         """
 
-        if engine_to_use:
-            if engine_to_use not in self.engines:
-                raise QueryEngineError(
-                    f"Query engine `{engine_to_use}` not found. "
-                    f"Did you mean {' or '.join(self._suggest_engines(engine_to_use))}?"
-                )
+        if segments := self._get_segments(query, engine_to_use):
+            # NOTE: Serve the cached parts of the range from cache, and only query the gaps.
+            logger.debug(f"Splitting query into {len(segments)} cached and uncached segments")
+            return self._query_segments(query, segments)  # type: ignore[arg-type]
 
-            sel_engine = self.engines[engine_to_use]
-            est_time = sel_engine.estimate_query(query)
+        sel_engine_name, sel_engine, est_time = self._select_engine(query, engine_to_use)
+        return self._perform_query(query, sel_engine_name, sel_engine, est_time)
 
-        else:
-            # Get heuristics from all the query engines to perform this query
-            estimates = map(lambda qe: (qe, qe.estimate_query(query)), self.engines.values())
+    def query_columns(
+        self,
+        query: QueryType,
+        columns: Sequence[str],
+        engine_to_use: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict[str, Sequence[Any]]]:
+        """
+        Like :meth:`~ape.managers.query.QueryManager.query`, but returns batches of
+        values by column, e.g. for building a ``DataFrame`` without a model per row.
+
+        Args:
+            query (``QueryType``): The type of query to execute
+            columns (Sequence[str]): The (expanded) columns to return
+            engine_to_use (str | None): Short-circuit selection logic using
+              a specific engine. Defaults is set by performance-based selection logic.
+            batch_size (int): The number of rows per batch, when the engine
+              does not return columns itself. Defaults to ``1000``.
+
+        Raises:
+            :class:`~ape.exceptions.QueryEngineError`: When given an invalid or
+          inaccessible ``engine_to_use`` value.
+
+        Returns:
+            Iterator[dict[str, Sequence[Any]]]
+        """
 
-            # Ignore query engines that can't perform this query
-            valid_estimates = filter(lambda qe: qe[1] is not None, estimates)
+        if segments := self._get_segments(query, engine_to_use):
+            models = self._query_segments(query, segments)  # type: ignore[arg-type]
 
+        else:
+            sel_engine_name, sel_engine, est_time = self._select_engine(query, engine_to_use)
             try:
-                # Find the "best" engine to perform the query
-                # NOTE: Sorted by fastest time heuristic
-                sel_engine, est_time = min(valid_estimates, key=lambda qe: qe[1])  # type: ignore
+                batches = sel_engine.perform_columnar_query(query, columns)
+            except APINotImplementedError:
+                models = self._perform_query(query, sel_engine_name, sel_engine, est_time)
+            else:
+                yield from self._measure(
+                    query,
+                    sel_engine_name,
+                    est_time,
+                    batches,
+                    count=lambda batch: len(next(iter(batch.values()), ())),
+                )
+                return
 
-            except ValueError as e:
-                raise QueryEngineError("No query engines are available.") from e
+        # NOTE: Adapt engines that only return models.
+        while batch := list(islice(models, batch_size)):
+            yield cast(dict[str, Sequence[Any]], extract_columns(batch, columns))
 
+    def _perform_query(
+        self, query: QueryType, sel_engine_name: str, sel_engine: QueryAPI, est_time: int | None
+    ) -> Iterator[BaseInterfaceModel]:
         # Go fetch the result from the engine
-        sel_engine_name = getattr(type(sel_engine), "__name__", None)
-        query_type_name = getattr(type(query), "__name__", None)
-        if not sel_engine_name:
-            logger.error("Engine type unknown")
-        if not query_type_name:
-            logger.error("Query type unknown")
-
-        if sel_engine_name and query_type_name:
-            logger.debug(f"{sel_engine_name}: {query_type_name}({query})")
-
-        start_time = time.time_ns()
-        result = sel_engine.perform_query(query)
-        exec_time = (time.time_ns() - start_time) // 1000
-
-        if sel_engine_name and query_type_name:
-            logger.debug(
-                f"{sel_engine_name}: {query_type_name}"
-                f" executed in {exec_time} ms (expected: {est_time} ms)"
-            )
+        logger.debug(f"{sel_engine_name}: {type(query).__name__}({query})")
+        result = self._measure(query, sel_engine_name, est_time, sel_engine.perform_query(query))
 
         # Update any caches
-        for engine in self.engines.values():
-            if not isinstance(engine, sel_engine.__class__):
-                result, cache_data = tee(result)
-                try:
-                    engine.update_cache(query, cache_data)
-                except QueryEngineError as err:
-                    logger.error(str(err))
+        cache_engines = [
+            engine
+            for engine in self.engines.values()
+            if not isinstance(engine, sel_engine.__class__)
+            # NOTE: Skip engines that don't cache anything.
+            and getattr(type(engine), "update_cache", None) is not QueryAPI.update_cache
+        ]
+        if cache_engines:
+            result = self._stream_to_caches(query, result, cache_engines)
 
         return result
+
+    def _stream_to_caches(
+        self, query: QueryType, result: Iterator[BaseInterfaceModel], engines: list[QueryAPI]
+    ) -> Iterator[BaseInterfaceModel]:
+        writers = [_CacheWriter(engine, query, self.cache_queue_size) for engine in engines]
+        completed = False
+        try:
+            chunk: list[BaseInterfaceModel] = []
+            for item in result:
+                chunk.append(item)
+                if len(chunk) >= self.cache_chunk_size:
+                    for writer in writers:
+                        writer.put(chunk)
+
+                    chunk = []
+
+                yield item
+
+            if chunk:
+                for writer in writers:
+                    writer.put(chunk)
+
+            completed = True
+
+        finally:
+            # NOTE: Only complete the cache updates when the whole result was consumed.
+            for writer in writers:
+                if completed:
+                    writer.close()
+                else:
+                    writer.abort()
+
+            # NOTE: The writers are daemon threads, so wait for the queued writes here
+            #   rather than losing them if the interpreter exits.
+            for writer in writers:
+                writer.wait()
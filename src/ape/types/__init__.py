@@ -44,7 +44,13 @@ def __getattr__(name: str):
 
         return getattr(coverage_module, name)
 
-    elif name in ("ContractLog", "ContractLogContainer", "LogFilter", "MockContractLog"):
+    elif name in (
+        "BlockRollback",
+        "ContractLog",
+        "ContractLogContainer",
+        "LogFilter",
+        "MockContractLog",
+    ):
         import ape.types.events as events_module
 
         return getattr(events_module, name)
@@ -101,6 +107,7 @@ __all__ = [
     "BaseInterfaceModel",
     "BaseModel",
     "BlockID",
+    "BlockRollback",
     "Bytecode",
     "Checksum",
     "Closure",
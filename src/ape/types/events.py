@@ -86,6 +86,35 @@ class LogFilter(BaseModel):
         )
 
 
+class BlockRollback(BaseModel):
+    """
+    A chain reorganization found while polling blocks. The yielded blocks after
+    the fork block are orphaned, and the new chain's blocks are yielded next.
+    """
+
+    number: int
+    """
+    The number of the last block both chains share.
+    """
+
+    hash: HexBytes
+    """
+    The hash of the last block both chains share.
+    """
+
+    orphaned: list[HexBytes]
+    """
+    The hashes of the yielded blocks that are no longer in the chain, in block order.
+    """
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of orphaned blocks.
+        """
+        return len(self.orphaned)
+
+
 class BaseContractLog(BaseInterfaceModel):
     """
     Base class representing information relevant to an event instance.
@@ -125,7 +154,8 @@ class BaseContractLog(BaseInterfaceModel):
             # Handle custom ints.
             return int(value)
 
-        elif isinstance(value, HexBytes):
+        elif isinstance(value, bytes):
+            # NOTE: Includes `HexBytes` from other libraries, e.g. from web3.py results.
             return to_hex(value) if info.mode == "json" else value
 
         elif isinstance(value, str):
@@ -79,7 +79,7 @@ def __getattr__(name: str):
 
         return getattr(os_module, name)
 
-    elif name in ("JoinableQueue", "spawn"):
+    elif name in ("JoinableQueue", "concurrent_map", "spawn"):
         import ape.utils.process as process_module
 
         return getattr(process_module, name)
@@ -87,7 +87,9 @@ def __getattr__(name: str):
     elif name in (
         "USER_AGENT",
         "RPCHeaders",
+        "RateLimiter",
         "allow_disconnected",
+        "async_request_with_retry",
         "request_with_retry",
         "stream_response",
     ):
@@ -150,6 +152,7 @@ __all__ = [
     "LogInputABICollection",
     "ManagerAccessMixin",
     "RPCHeaders",
+    "RateLimiter",
     "Struct",
     "StructParser",
     "TraceStyles",
@@ -157,6 +160,7 @@ __all__ = [
     "add_padding_to_strings",
     "allow_disconnected",
     "as_our_module",
+    "async_request_with_retry",
     "cached_property",
     "clean_path",
     "create_tempdir",
@@ -1,11 +1,13 @@
 import json
 import os
 import re
+import sqlite3
 import stat
 import sys
 import tarfile
 import zipfile
-from collections.abc import Callable, Iterator
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from fnmatch import fnmatch
 from importlib.metadata import PackageNotFoundError, distribution
@@ -446,6 +448,191 @@ class CacheDirectory:
         file = self.get_file(key)
         file.unlink(missing_ok=True)
 
+    def has_data(self, key: str) -> bool:
+        """
+        Whether there is data cached for the given key.
+        """
+        return self.get_file(key).is_file()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, dict]:
+        """
+        Get the data of many keys at once. Keys without data are not included.
+        """
+        return {key: data for key in keys if (data := self.get_data(key))}
+
+    def keys(self) -> Iterator[str]:
+        """
+        All the keys in the directory.
+        """
+        if self._path.is_dir():
+            yield from (file.stem for file in self._path.glob("*.json"))
+
+
+class CacheDatabase:
+    """
+    A table in a single SQLite file for caching data by key, as an
+    alternative to :class:`~ape.utils.os.CacheDirectory`, which uses a
+    file per key. Many tables may share the same file. Avoids touching the
+    filesystem for every key, which gets slow with many cached items.
+
+    Args:
+        path (Path): The path to the SQLite file.
+        table (str): The name of the table storing the data.
+        compress (bool): Set to ``True`` to compress newly cached data.
+          Data is always readable, regardless of this setting.
+    """
+
+    def __init__(self, path: Path, table: str, compress: bool = False):
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid table name '{table}'.")
+
+        self._path = path
+        self._table = table
+        self._compress = compress
+        self._created = False
+
+    def __getitem__(self, key: str) -> dict:
+        return self.get_data(key)
+
+    def __setitem__(self, key: str, value: dict):
+        self.cache_data(key, value)
+
+    def __delitem__(self, key: str):
+        self.delete_data(key)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @contextmanager
+    def _connect(self, create: bool = False) -> Iterator[sqlite3.Connection | None]:
+        if not create and not self._path.is_file():
+            # Don't create the file until there is data to write.
+            yield None
+            return
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: A connection per operation, so connections never cross threads or leak.
+        #   Operations are batched (e.g. `get_many()`), so connecting is rare.
+        connection = sqlite3.connect(self._path)
+        try:
+            # NOTE: In WAL mode, reading threads do not block each other or the writer.
+            connection.execute("PRAGMA journal_mode=WAL")
+            if not self._created:
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self._table} "
+                    "(key TEXT PRIMARY KEY, compressed INTEGER NOT NULL, data BLOB NOT NULL)"
+                )
+                self._created = True
+
+            with connection:
+                yield connection
+
+        finally:
+            connection.close()
+
+    def cache_data(self, key: str, data: dict):
+        self.cache_many({key: data})
+
+    def cache_many(self, data: dict[str, dict]):
+        """
+        Cache the data of many keys at once, in a single transaction.
+        """
+        rows = []
+        for key, value in data.items():
+            encoded = json.dumps(value).encode("utf8")
+            if self._compress:
+                encoded = zlib.compress(encoded)
+
+            rows.append((key, int(self._compress), encoded))
+
+        with self._connect(create=True) as connection:
+            assert connection is not None  # For mypy.
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self._table} (key, compressed, data) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def get_data(self, key: str) -> dict:
+        return self.get_many([key]).get(key, {})
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, dict]:
+        """
+        Get the data of many keys at once. Keys without data are not included.
+        """
+        keys = list(keys)
+        result: dict[str, dict] = {}
+        with self._connect() as connection:
+            if connection is None:
+                return result
+
+            # NOTE: Stay below SQLite's default limit of query parameters.
+            for idx in range(0, len(keys), 500):
+                chunk = keys[idx : idx + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                query = (
+                    f"SELECT key, compressed, data FROM {self._table} WHERE key IN ({placeholders})"
+                )
+                for key, compressed, data in connection.execute(query, chunk):
+                    result[key] = json.loads(zlib.decompress(data) if compressed else data)
+
+        return result
+
+    def delete_data(self, key: str):
+        with self._connect() as connection:
+            if connection is not None:
+                connection.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+    def has_data(self, key: str) -> bool:
+        """
+        Whether there is data cached for the given key.
+        """
+        with self._connect() as connection:
+            if connection is None:
+                return False
+
+            query = f"SELECT 1 FROM {self._table} WHERE key = ?"
+            return connection.execute(query, (key,)).fetchone() is not None
+
+    def keys(self) -> Iterator[str]:
+        """
+        All the keys in the table.
+        """
+        with self._connect() as connection:
+            if connection is None:
+                return
+
+            keys = [key for (key,) in connection.execute(f"SELECT key FROM {self._table}")]
+
+        yield from keys
+
+    def import_directory(self, directory: CacheDirectory) -> int:
+        """
+        Copy all the data of a cache directory into the table.
+
+        Args:
+            directory (:class:`~ape.utils.os.CacheDirectory`): The directory to import.
+
+        Returns:
+            int: The number of imported keys.
+        """
+        count = 0
+        batch: dict[str, dict] = {}
+        for key in directory.keys():
+            if data := directory.get_data(key):
+                batch[key] = data
+
+            if len(batch) >= 1000:
+                self.cache_many(batch)
+                count += len(batch)
+                batch = {}
+
+        if batch:
+            self.cache_many(batch)
+            count += len(batch)
+
+        return count
+
 
 @contextmanager
 def within_directory(directory: Path):
@@ -1,6 +1,10 @@
 import queue
 import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 from ape.exceptions import SubprocessTimeoutError
 
@@ -47,3 +51,45 @@ def spawn(target, *args, **kwargs):
     thread.daemon = True
     thread.start()
     return thread
+
+
+def concurrent_map(
+    fn: Callable[[Any], Any],
+    items: Iterable,
+    concurrency: int = 4,
+    prefetch: int | None = None,
+) -> Iterator:
+    """
+    Lazily map ``fn`` over ``items`` using a pool of threads, yielding results
+    in the same order as the items. At most ``prefetch`` results are computed ahead
+    of the consumer, so a slow consumer applies backpressure instead of results
+    piling up in memory.
+
+    Args:
+        fn (Callable): The function to call with each item.
+        items (Iterable): The items. Only consumed as needed.
+        concurrency (int): The number of threads to use. Defaults to ``4``.
+        prefetch (int | None): The maximum number of pending results.
+          Defaults to twice the concurrency.
+
+    Returns:
+        Iterator: The results, in order.
+    """
+    items = iter(items)
+    window = max(prefetch or 2 * concurrency, 1)
+    pool = ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    pending: deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) < window:
+                continue
+
+            yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+    finally:
+        # NOTE: Handles the consumer stopping early or an error from `fn`.
+        pool.shutdown(wait=False, cancel_futures=True)
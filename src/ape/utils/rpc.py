@@ -1,5 +1,7 @@
+import asyncio
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from io import BytesIO
 from random import randint
 
@@ -152,3 +154,104 @@ def request_with_retry(
 
     # If we get here, we over-waited. Raise custom exception.
     raise ProviderError(f"Rate limit retry-mechanism exceeded after '{max_retries}' attempts.")
+
+
+async def async_request_with_retry(
+    func: Callable[[], Awaitable],
+    min_retry_delay: int = 1_000,
+    retry_backoff_factor: int = 2,
+    max_retry_delay: int = 30_000,
+    max_retries: int = 10,
+    retry_jitter: int = 250,
+    is_rate_limit: Callable[[Exception], bool] | None = None,
+):
+    """
+    The asynchronous version of :meth:`~ape.utils.rpc.request_with_retry`.
+    Waiting between attempts does not block the event loop.
+
+    Args:
+        func (Callable[[], Awaitable]): A function returning the awaitable request.
+        min_retry_delay (int): The amount of milliseconds to wait before
+          retrying the request. Defaults to ``1_000`` (one second).
+        retry_backoff_factor (int): The multiplier applied to the retry delay
+          after each failed attempt. Defaults to ``2``.
+        max_retry_delay (int): The maximum length of the retry delay.
+          Defaults to ``30_000`` (30 seconds).
+        max_retries (int): The maximum number of retries.
+          Defaults to ``10``.
+        retry_jitter (int): A random number of milliseconds up to this limit
+          is added to each retry delay. Defaults to ``250`` milliseconds.
+        is_rate_limit (Callable[[Exception], bool] | None): A custom handler
+          for detecting rate-limits. Defaults to checking for a 429 status
+          code on the error.
+    """
+    if not is_rate_limit:
+        # Use default checker (handles both ``requests`` and ``aiohttp`` errors).
+        def checker(err: Exception) -> bool:
+            if isinstance(err, requests.HTTPError):
+                return err.response.status_code == 429
+
+            return getattr(err, "status", None) == 429
+
+        is_rate_limit = checker
+
+    for attempt in range(max_retries):
+        try:
+            return await func()
+        except Exception as err:
+            if not is_rate_limit(err):
+                raise
+
+            logger.warning("Request was rate-limited. Backing-off and then retrying...")
+            retry_interval = min(max_retry_delay, min_retry_delay * retry_backoff_factor**attempt)
+            delay = retry_interval + randint(0, retry_jitter)
+            await asyncio.sleep(delay / 1000)
+
+    raise ProviderError(f"Rate limit retry-mechanism exceeded after '{max_retries}' attempts.")
+
+
+class RateLimiter:
+    """
+    A thread-safe token-bucket rate-limiter, for sharing a request budget
+    across many threads.
+
+    Usage example::
+
+        from ape.utils import RateLimiter
+
+        limiter = RateLimiter(5)  # 5 requests per second.
+        limiter.acquire()  # Blocks until a request is allowed.
+
+    Args:
+        rate (float): The number of requests allowed per second.
+        burst (int | None): The maximum number of requests allowed at once.
+          Defaults to the rate (and at least ``1``).
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0.")
+
+        self.rate = rate
+        self.burst = burst or max(int(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request is allowed.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
@@ -11,6 +11,16 @@ from ape.logging import logger
 if TYPE_CHECKING:
     from ape_cache.query import CacheQueryProvider
 
+# The contract data caches stored in a folder per network.
+_DATA_CACHE_KEYS = (
+    "contract_types",
+    "contract_types_contents",
+    "proxy_info",
+    "blueprints",
+    "blueprints_contents",
+    "contract_creation",
+)
+
 
 def get_engine() -> "CacheQueryProvider":
     from ape.utils.basemodel import ManagerAccessMixin
@@ -41,6 +51,61 @@ def init(cli_ctx, ecosystem, network):
     logger.success(f"Caching database initialized for {ecosystem.name}:{network.name}.")
 
 
+@cli.command(short_help="Migrate a cache database to the latest schema")
+@ape_cli_context()
+@network_option(required=True)
+def migrate(cli_ctx, ecosystem, network):
+    """
+    Migrates an existing database to the latest schema in place,
+    e.g. converting hex string columns to more compact binary columns.
+
+    Note that an ecosystem name and network name are required to
+    migrate the database of choice.
+    """
+
+    get_engine().migrate_database(ecosystem.name, network.name)
+    logger.success(f"Caching database migrated for {ecosystem.name}:{network.name}.")
+
+
+@cli.command("migrate-data", short_help="Move cached contract data into a single file")
+@ape_cli_context()
+@network_option(required=True)
+@click.option("--compress", is_flag=True, help="Compress the migrated data.")
+@click.option("--delete", "delete_files", is_flag=True, help="Delete the migrated JSON files.")
+def migrate_data(cli_ctx, ecosystem, network, compress, delete_files):
+    """
+    Copies the cached contract types, proxy info and such of a network from
+    their JSON files (one per contract) into a single SQLite file. Afterward,
+    set ``data_backend: sqlite`` in the ``cache`` config to use it.
+
+    Note that an ecosystem name and network name are required to
+    migrate the data of choice.
+    """
+
+    from ape.utils.os import CacheDatabase, CacheDirectory
+
+    network_name = network.name.replace("-fork", "")
+    network_folder = cli_ctx.config_manager.DATA_FOLDER / ecosystem.name / network_name
+    if not network_folder.is_dir():
+        logger.warning(f"No cached data for {ecosystem.name}:{network_name}.")
+        return
+
+    for folder in sorted(p for p in network_folder.iterdir() if p.is_dir()):
+        if folder.name not in _DATA_CACHE_KEYS:
+            logger.warning(f"Skipping unknown cached data folder '{folder.name}'.")
+            continue
+
+        directory = CacheDirectory(folder)
+        database = CacheDatabase(network_folder / "data.db", folder.name, compress=compress)
+        count = database.import_directory(directory)
+        logger.info(f"Migrated {count} '{folder.name}' items.")
+        if delete_files:
+            for key in database.keys():
+                directory.delete_data(key)
+
+    logger.success(f"Cached data migrated for {ecosystem.name}:{network_name}.")
+
+
 @cli.command(
     cls=ConnectedProviderCommand,
     short_help="Call and print SQL statement to the cache database",
@@ -81,3 +146,39 @@ def purge(cli_ctx, ecosystem, network):
 
     get_engine().purge_database(ecosystem.name, network.name)
     logger.success(f"Caching database purged for {ecosystem.name}:{network.name}.")
+
+
+@cli.command(short_help="Show observed query engine performance")
+@ape_cli_context()
+@click.option("--reset", is_flag=True, help="Forget all observed performance.")
+def stats(cli_ctx, reset):
+    """
+    Shows how each query engine has performed for each type of query, by network.
+    Query engine selection adjusts the engines' estimates using these observations.
+    """
+
+    if reset:
+        cli_ctx.query_manager.reset_engine_stats()
+        logger.success("Query engine stats reset.")
+        return
+
+    engine_stats = cli_ctx.query_manager.engine_stats
+    if not engine_stats.networks:
+        click.echo("No query engine stats.")
+        return
+
+    for network, engines in sorted(engine_stats.networks.items()):
+        click.echo(f"{network}:")
+        for engine, query_types in sorted(engines.items()):
+            click.echo(f"  {engine}:")
+            for query_type, query_stats in sorted(query_types.items()):
+                time_per_result = (
+                    "-"
+                    if query_stats.time_per_result is None
+                    else f"{query_stats.time_per_result:.2f} ms"
+                )
+                click.echo(
+                    f"    {query_type}: samples={query_stats.samples}, "
+                    f"time_per_result={time_per_result}, "
+                    f"estimate_ratio={query_stats.time_ratio:.2f}"
+                )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import SettingsConfigDict
 
 from ape.api.config import PluginConfig
@@ -5,4 +7,15 @@ from ape.api.config import PluginConfig
 
 class CacheConfig(PluginConfig):
     size: int = 1024**3  # 1gb
+    batch_size: int = 1000  # rows per bulk insert
+    # Where to store cached contract types, proxy info and such: "json" (a file per
+    # contract) or "sqlite" (a single file per network). See `ape cache migrate-data`.
+    data_backend: Literal["json", "sqlite"] = "json"
+    compress_data: bool = False  # Compress data stored by the "sqlite" backend.
+    # Bounds of the cached contract data kept in memory, per cache (e.g. contract types).
+    # The least-recently used data is evicted and read from disk again when needed.
+    memory_max_entries: int | None = None
+    memory_max_bytes: int | None = None  # approximate, by the size of the JSON
+    # Store equal contract types (e.g. of clones) once, by hash, instead of once per address.
+    deduplicate_data: bool = False
     model_config = SettingsConfigDict(extra="allow", env_prefix="APE_CACHE_")
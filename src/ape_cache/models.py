@@ -3,10 +3,19 @@ from sqlalchemy.types import String, TypeDecorator
 
 from .base import Base
 
+SCHEMA_VERSION = 4
+"""
+The version of the cache database schema, stored as the SQLite ``user_version``.
+Version 1 (``0`` in the database) stored hashes and addresses as hex strings,
+version 2 did not track which block ranges are cached, and version 3 did not
+index account transactions.
+"""
+
 
 class HexByteString(TypeDecorator):
     """
     Convert Python bytestring to string with hexadecimal digits and back for storage.
+    Used by schema version 1; see :class:`~ape_cache.models.FixedBytes`.
     """
 
     impl = String
@@ -26,13 +35,49 @@ class HexByteString(TypeDecorator):
         return bytes.fromhex(value.replace("0x", "")) if value else None
 
 
+class FixedBytes(TypeDecorator):
+    """
+    Store Python bytestrings (or hex strings) of a fixed length as raw binary.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, length: int):
+        super().__init__(length=length)
+        self.length = length
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+
+        elif isinstance(value, str):
+            value = bytes.fromhex(value.replace("0x", ""))
+
+        elif not isinstance(value, bytes):
+            raise TypeError(f"FixedBytes columns support only bytes values: {value}")
+
+        if len(value) != self.length:
+            raise TypeError(f"Expected {self.length} bytes, got {len(value)}: {value.hex()}")
+
+        return bytes(value)
+
+    def process_result_value(self, value, dialect):
+        return bytes(value) if value else None
+
+
+Hash32 = FixedBytes(32)
+Address = FixedBytes(20)
+Signature = FixedBytes(65)
+
+
 class Blocks(Base):
     __tablename__ = "blocks"  # type: ignore
 
-    hash = Column(HexByteString, primary_key=True, nullable=False)
+    hash: Column[bytes] = Column(Hash32, primary_key=True, nullable=False)
     num_transactions = Column(Integer, nullable=False)
     number = Column(Integer, nullable=False, index=True)
-    parent_hash = Column(HexByteString, nullable=False)
+    parent_hash: Column[bytes] = Column(Hash32, nullable=False)
     size = Column(Integer, nullable=False)
     timestamp = Column(BigInteger, index=True)
     gas_limit = Column(Integer, nullable=False)
@@ -45,16 +90,16 @@ class Blocks(Base):
 class Transactions(Base):
     __tablename__ = "transactions"  # type: ignore
 
-    txn_hash = Column(HexByteString, primary_key=True, nullable=False)
-    sender = Column(HexByteString, nullable=True)
-    receiver = Column(HexByteString, nullable=True)
+    txn_hash: Column[bytes] = Column(Hash32, primary_key=True, nullable=False)
+    sender: Column[bytes] = Column(Address, nullable=True)
+    receiver: Column[bytes] = Column(Address, nullable=True)
     gas_limit = Column(Numeric(scale=0), nullable=True)
-    block_hash = Column(HexByteString, ForeignKey("blocks.hash", ondelete="CASCADE"))
+    block_hash: Column[bytes] = Column(Hash32, ForeignKey("blocks.hash", ondelete="CASCADE"))
     nonce = Column(Integer, nullable=True)
     value = Column(Numeric(scale=0), nullable=True)
     data = Column(LargeBinary, nullable=True)
     type = Column(String, nullable=True)
-    signature = Column(HexByteString, nullable=True)
+    signature: Column[bytes] = Column(Signature, nullable=True)
 
 
 class ContractEvents(Base):
@@ -62,10 +107,29 @@ class ContractEvents(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     event_name = Column(String, nullable=False, index=True)
-    contract_address = Column(HexByteString, nullable=False, index=True)
+    contract_address: Column[bytes] = Column(Address, nullable=False, index=True)
     event_arguments = Column(JSON, index=True)
-    transaction_hash = Column(HexByteString, nullable=False, index=True)
+    transaction_hash: Column[bytes] = Column(Hash32, nullable=False, index=True)
     block_number = Column(Integer, nullable=False, index=True)
-    block_hash = Column(HexByteString, nullable=False, index=True)
+    block_hash: Column[bytes] = Column(Hash32, nullable=False, index=True)
     log_index = Column(Integer, nullable=False, index=True)
     transaction_index = Column(Integer, nullable=False, index=True)
+
+
+class AccountTransactions(Base):
+    __tablename__ = "account_transactions"  # type: ignore
+
+    account: Column[bytes] = Column(Address, primary_key=True, nullable=False)
+    nonce = Column(Integer, primary_key=True, nullable=False)
+    block_number = Column(Integer, nullable=False, index=True)
+    txn_hash: Column[bytes] = Column(Hash32, nullable=False)
+
+
+class CachedRanges(Base):
+    __tablename__ = "cached_ranges"  # type: ignore
+
+    id = Column(Integer, primary_key=True)
+    table_name = Column(String, nullable=False, index=True)
+    key = Column(String, nullable=False, default="", index=True)
+    start_block = Column(Integer, nullable=False)
+    stop_block = Column(Integer, nullable=False)
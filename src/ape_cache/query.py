@@ -1,15 +1,24 @@
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from decimal import Decimal
 from functools import singledispatchmethod
+from itertools import islice
 from pathlib import Path
-from typing import Any, cast
-
-from sqlalchemy import create_engine, func
-from sqlalchemy.engine import CursorResult
-from sqlalchemy.sql import column, insert, select
+from typing import Any, ClassVar, cast
+
+from eth_abi import encode
+from eth_abi.exceptions import EncodingError
+from eth_abi.grammar import ABIType, BasicType, TupleType, parse
+from eth_pydantic_types import HexBytes
+from eth_utils import keccak, to_checksum_address, to_hex
+from ethpm_types.abi import EventABI
+from sqlalchemy import Numeric, create_engine, event, func, inspect, text
+from sqlalchemy.engine import CursorResult, Engine, Row
+from sqlalchemy.sql import column, delete, insert, select, table
 from sqlalchemy.sql.expression import Insert, Select
 
 from ape.api.providers import BlockAPI
 from ape.api.query import (
+    AccountTransactionQuery,
     BaseInterfaceModel,
     BlockQuery,
     BlockTransactionQuery,
@@ -17,14 +26,89 @@ from ape.api.query import (
     QueryAPI,
     QueryType,
 )
-from ape.api.transactions import TransactionAPI
-from ape.exceptions import QueryEngineError
+from ape.api.transactions import ReceiptAPI, TransactionAPI
+from ape.exceptions import APINotImplementedError, QueryEngineError
 from ape.logging import logger
+from ape.types.address import AddressType
 from ape.types.events import ContractLog
+from ape.utils.abi import is_dynamic_sized_type
 from ape.utils.misc import LOCAL_NETWORK_NAME
+from ape.utils.process import concurrent_map
 
 from . import models
-from .models import Blocks, ContractEvents, Transactions
+from .models import AccountTransactions, Blocks, CachedRanges, ContractEvents, Transactions
+
+
+def _row_to_dict(row: Row) -> dict[str, Any]:
+    # NOTE: Integer ``Numeric`` columns are loaded as ``Decimal``.
+    return {k: int(v) if isinstance(v, Decimal) else v for k, v in row._mapping.items()}
+
+
+def _intersect_ranges(
+    ranges: list[tuple[int, int]], other: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    intersection = []
+    for start, stop in ranges:
+        for other_start, other_stop in other:
+            if (lower := max(start, other_start)) <= (upper := min(stop, other_stop)):
+                intersection.append((lower, upper))
+
+    return sorted(intersection)
+
+
+def _to_abi_value(abi_type: ABIType, value: Any) -> Any:
+    # NOTE: Stored as JSON, where bytes are hex strings and tuples are lists or dicts.
+    if abi_type.is_array:
+        return [_to_abi_value(abi_type.item_type, v) for v in value]
+
+    elif isinstance(abi_type, TupleType):
+        values = value.values() if isinstance(value, dict) else value
+        return tuple(_to_abi_value(t, v) for t, v in zip(abi_type.components, values, strict=True))
+
+    elif isinstance(abi_type, BasicType) and abi_type.base == "bytes" and isinstance(value, str):
+        return HexBytes(value)
+
+    return value
+
+
+def _encode_log(event: EventABI, row: Row) -> dict[str, Any]:
+    """
+    Encode a stored log back into its raw form, so the ecosystem decodes its
+    event arguments to the same types as logs from the provider.
+    """
+    topics = [HexBytes(keccak(text=event.selector))]
+    data_types, data_values = [], []
+    for ipt in event.inputs:
+        value = row.event_arguments[ipt.name]
+        if ipt.indexed and is_dynamic_sized_type(ipt.type):
+            # NOTE: Indexed reference types are stored as their hash.
+            topics.append(HexBytes(value))
+
+        elif ipt.indexed:
+            abi_value = _to_abi_value(parse(ipt.canonical_type), value)
+            topics.append(HexBytes(encode([ipt.canonical_type], [abi_value])))
+
+        else:
+            data_types.append(ipt.canonical_type)
+            data_values.append(_to_abi_value(parse(ipt.canonical_type), value))
+
+    return {
+        **row._mapping,
+        "address": to_checksum_address(row.contract_address),
+        "topics": topics,
+        "data": HexBytes(encode(data_types, data_values)),
+    }
+
+
+def _convert_column(col, values: Sequence[Any]) -> list[Any]:
+    # NOTE: Return the same types as the models would.
+    if isinstance(col.type, models.FixedBytes):
+        return [None if v is None else HexBytes(v) for v in values]
+
+    elif isinstance(col.type, Numeric):
+        return [None if v is None else int(v) for v in values]
+
+    return list(values)
 
 
 class CacheQueryProvider(QueryAPI):
@@ -36,6 +120,18 @@ class CacheQueryProvider(QueryAPI):
     # Class var for tracking if we detect a scenario where the cache db isn't working
     database_bypass = False
 
+    # Class var for re-using database engines (and their connection pools), by database file
+    _engines: ClassVar[dict[Path, Engine]] = {}
+
+    # Class var for tracking which database files have a current schema, by database file
+    _schema_checked: ClassVar[set[Path]] = set()
+
+    # Class var for tracking the tables created in each database file
+    _table_names: ClassVar[dict[Path, set[str]]] = {}
+
+    # The tables the engine needs; the database is not initialized until they all exist
+    _required_tables: ClassVar[set[str]] = set(models.Base.metadata.tables)  # type: ignore
+
     def _get_database_file(self, ecosystem_name: str, network_name: str) -> Path:
         """
         Allows us to figure out what the file *will be*, mostly used for database management.
@@ -71,6 +167,68 @@ class CacheQueryProvider(QueryAPI):
 
         return f"sqlite:///{database_file}"
 
+    def _get_engine(self, database_file: Path) -> Engine:
+        """
+        Get the engine for the given database file, creating it on first use.
+        Connections use write-ahead logging so reads do not block on cache writes.
+
+        Args:
+            database_file (`pathlib.Path`): A path to the database file.
+
+        Returns:
+            `sqlalchemy.engine.Engine`
+        """
+
+        if engine := self._engines.get(database_file):
+            return engine
+
+        engine = create_engine(self._get_sqlite_uri(database_file), pool_pre_ping=True)
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        self._engines[database_file] = engine
+        return engine
+
+    def _dispose_engine(self, database_file: Path):
+        self._schema_checked.discard(database_file)
+        self._table_names.pop(database_file, None)
+        if engine := self._engines.pop(database_file, None):
+            engine.dispose()
+
+    def _get_schema_version(self, database_file: Path) -> int:
+        with self._get_engine(database_file).connect() as conn:
+            return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+    def _set_schema_version(self, conn):
+        conn.execute(text(f"PRAGMA user_version = {models.SCHEMA_VERSION}"))
+
+    def _has_tables(self, database_file: Path, tables: set[str]) -> bool:
+        if database_file not in self._table_names:
+            with self._get_engine(database_file).connect() as conn:
+                self._table_names[database_file] = set(inspect(conn).get_table_names())
+
+        return tables <= self._table_names[database_file]
+
+    def _create_tables(self, database_file: Path, tables: set[str] | None = None):
+        # NOTE: Make sure database folder location has been created
+        database_file.parent.mkdir(exist_ok=True, parents=True)
+
+        metadata = models.Base.metadata  # type: ignore
+        with self._get_engine(database_file).begin() as conn:
+            # NOTE: Existing tables are skipped.
+            metadata.create_all(
+                bind=conn,
+                tables=None if tables is None else [metadata.tables[name] for name in tables],
+            )
+            self._set_schema_version(conn)
+
+        self._table_names.pop(database_file, None)
+
     def init_database(self, ecosystem_name: str, network_name: str):
         """
         Initialize the SQLite database for caching of provider data.
@@ -84,14 +242,125 @@ class CacheQueryProvider(QueryAPI):
         """
 
         database_file = self._get_database_file(ecosystem_name, network_name)
-        if database_file.is_file():
+        all_tables = CacheQueryProvider._required_tables
+        if database_file.is_file() and self._has_tables(database_file, all_tables):
             raise QueryEngineError("Database has already been initialized")
 
-        # NOTE: Make sure database folder location has been created
-        database_file.parent.mkdir(exist_ok=True, parents=True)
+        # NOTE: The file may already exist with only the tables of the contract logs.
+        self._create_tables(database_file)
+
+    def migrate_database(self, ecosystem_name: str, network_name: str):
+        """
+        Migrate the SQLite database to the latest schema in place,
+        e.g. converting hex string columns to binary columns.
+
+        Args:
+            ecosystem_name (str): Name of the ecosystem to store data for (ex: ethereum)
+            network_name (str): name of the network to store data for (ex: mainnet)
+
+        Raises:
+            :class:`~ape.exceptions.QueryEngineError`: When the database has not been initialized
+        """
+
+        database_file = self._get_database_file(ecosystem_name, network_name)
+        if not database_file.is_file():
+            raise QueryEngineError("Database must be initialized")
+
+        schema_version = self._get_schema_version(database_file)
+        if schema_version >= models.SCHEMA_VERSION:
+            logger.info("Database is already up-to-date.")
+            return
 
-        models.Base.metadata.create_all(  # type: ignore
-            bind=create_engine(self._get_sqlite_uri(database_file), pool_pre_ping=True)
+        engine = self._get_engine(database_file)
+        with engine.begin() as conn:
+            if schema_version < 2:
+                self._migrate_binary_columns(conn)
+
+            models.Base.metadata.create_all(bind=conn)  # type: ignore
+            if schema_version < 3:
+                self._migrate_cached_ranges(conn)
+
+            self._set_schema_version(conn)
+
+        self._table_names.pop(database_file, None)
+        if schema_version < 2:
+            # NOTE: Reclaim the space freed by the smaller columns.
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("VACUUM"))
+
+        self._schema_checked.add(database_file)
+
+    def _migrate_binary_columns(self, conn):
+        batch_size = max(self.config_manager.get_config("cache").batch_size, 1)
+        tables = [
+            tbl for tbl in models.Base.metadata.sorted_tables if inspect(conn).has_table(tbl.name)
+        ]
+        for tbl in tables:
+            conn.execute(text(f"ALTER TABLE {tbl.name} RENAME TO _legacy_{tbl.name}"))
+
+        # NOTE: Renamed tables keep their index names, which the new tables need.
+        indexes = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+        ).scalars()
+        for index in list(indexes):
+            conn.execute(text(f"DROP INDEX {index}"))
+
+        models.Base.metadata.create_all(bind=conn)  # type: ignore
+        for tbl in tables:
+            # NOTE: Read the binary columns using the legacy hex string type.
+            legacy_table = table(
+                f"_legacy_{tbl.name}",
+                *(
+                    column(
+                        c.name,
+                        models.HexByteString() if isinstance(c.type, models.FixedBytes) else c.type,
+                    )
+                    for c in tbl.columns
+                ),
+            )
+            result = conn.execute(select(legacy_table)).mappings()
+            while batch := result.fetchmany(batch_size):
+                conn.execute(insert(tbl), [dict(row) for row in batch])
+
+        for tbl in reversed(tables):
+            conn.execute(text(f"DROP TABLE _legacy_{tbl.name}"))
+
+    def _migrate_cached_ranges(self, conn):
+        # NOTE: Cached blocks are contiguous by number, so their ranges can be recovered
+        #   by grouping consecutive numbers. Events can't be recovered and are re-fetched.
+        islands = select(
+            Blocks.number,
+            (Blocks.number - func.row_number().over(order_by=Blocks.number)).label("island"),
+        ).subquery()
+        ranges = select(func.min(islands.c.number), func.max(islands.c.number)).group_by(
+            islands.c.island
+        )
+        for start_block, stop_block in conn.execute(ranges):
+            self._record_cached_range(conn, "blocks", "", start_block, stop_block)
+
+    def _record_cached_range(
+        self, conn, table_name: str, key: str, start_block: int, stop_block: int
+    ):
+        # NOTE: Merge with any overlapping or adjacent ranges, so ranges never overlap.
+        overlapping = (
+            CachedRanges.table_name == table_name,
+            CachedRanges.key == key,
+            CachedRanges.start_block <= stop_block + 1,
+            CachedRanges.stop_block >= start_block - 1,
+        )
+        min_start, max_stop = conn.execute(
+            select(func.min(CachedRanges.start_block), func.max(CachedRanges.stop_block)).where(
+                *overlapping
+            )
+        ).one()
+        conn.execute(delete(CachedRanges).where(*overlapping))
+        conn.execute(
+            insert(CachedRanges).values(
+                table_name=table_name,
+                key=key,
+                start_block=min(start_block, min_start if min_start is not None else start_block),
+                stop_block=max(stop_block, max_stop if max_stop is not None else stop_block),
+            )
         )
 
     def purge_database(self, ecosystem_name: str, network_name: str):
@@ -110,7 +379,11 @@ class CacheQueryProvider(QueryAPI):
         if not database_file.is_file():
             raise QueryEngineError("Database must be initialized")
 
+        self._dispose_engine(database_file)
         database_file.unlink()
+        for suffix in ("-wal", "-shm"):
+            # NOTE: Write-ahead log files only exist while connections are open.
+            database_file.with_name(f"{database_file.name}{suffix}").unlink(missing_ok=True)
 
     @property
     def database_connection(self):
@@ -142,8 +415,24 @@ class CacheQueryProvider(QueryAPI):
             return None
 
         try:
-            sqlite_uri = self._get_sqlite_uri(database_file)
-            return create_engine(sqlite_uri, pool_pre_ping=True).connect()
+            if database_file not in self._schema_checked:
+                if self._get_schema_version(database_file) < models.SCHEMA_VERSION:
+                    logger.warning(
+                        "`ape-cache` database schema is out-of-date. "
+                        "Run `ape cache migrate` to upgrade it."
+                    )
+                    self.database_bypass = True
+                    return None
+
+                self._schema_checked.add(database_file)
+
+            if not self._has_tables(database_file, self._required_tables):
+                # NOTE: Only the tables of other engines exist, e.g. the contract logs.
+                logger.debug("`ape-cache` database has not been initialized")
+                self.database_bypass = True
+                return None
+
+            return self._get_engine(database_file).connect()
 
         except QueryEngineError as e:
             logger.debug(f"Exception when querying:\n{e}")
@@ -185,7 +474,7 @@ class CacheQueryProvider(QueryAPI):
             .select_from(Blocks)
             .where(Blocks.number >= query.start_block)
             .where(Blocks.number <= query.stop_block)
-            .where(Blocks.number % query.step == 0)
+            .where((Blocks.number - query.start_block) % query.step == 0)
         )
 
     @_estimate_query_clause.register
@@ -197,13 +486,13 @@ class CacheQueryProvider(QueryAPI):
         )
 
     @_estimate_query_clause.register
-    def _contract_events_estimate_query_clause(self, query: ContractEventQuery) -> Select:
+    def _account_transactions_estimate_query_clause(self, query: AccountTransactionQuery) -> Select:
         return (
             select(func.count())
-            .select_from(ContractEvents)
-            .where(ContractEvents.block_number >= query.start_block)
-            .where(ContractEvents.block_number <= query.stop_block)
-            .where(ContractEvents.block_number % query.step == 0)
+            .select_from(AccountTransactions)
+            .where(AccountTransactions.account == query.account)
+            .where(AccountTransactions.nonce >= query.start_nonce)
+            .where(AccountTransactions.nonce <= query.stop_nonce)
         )
 
     @singledispatchmethod
@@ -245,17 +534,16 @@ class CacheQueryProvider(QueryAPI):
         return None
 
     @_compute_estimate.register
-    def _compute_estimate_contract_events_query(
+    def _compute_estimate_account_transactions_query(
         self,
-        query: ContractEventQuery,
+        query: AccountTransactionQuery,
         result: CursorResult,
     ) -> int | None:
-        if result.scalar() == (query.stop_block - query.start_block) // query.step:
-            # NOTE: Assume 200 msec to get data from database
-            return 200
+        if (count := result.scalar()) == 1 + query.stop_nonce - query.start_nonce:
+            # NOTE: Receipts are still fetched by hash, assume 100 msec each
+            return 100 * count
 
         # Can't handle this query
-        # TODO: Allow partial queries
         return None
 
     def estimate_query(self, query: QueryType) -> int | None:
@@ -291,6 +579,46 @@ class CacheQueryProvider(QueryAPI):
             #       estimation phase does not fail in `QueryManager`.
             return None
 
+    @singledispatchmethod
+    def _get_cached_ranges_key(self, query: QueryType) -> tuple[str, str]:
+        """
+        A singledispatchmethod that returns the table and key to track cached block ranges by.
+
+        Raises:
+            :class:`~ape.exceptions.QueryEngineError`: When given an
+                incompatible QueryType.
+
+        Returns:
+            tuple[str, str]
+        """
+
+        raise QueryEngineError(f"Cannot track cached ranges for '{type(query)}'.")
+
+    @_get_cached_ranges_key.register
+    def _get_block_cached_ranges_key(self, query: BlockQuery) -> tuple[str, str]:
+        return Blocks.__tablename__, ""
+
+    def get_cached_ranges(self, query: QueryType) -> list[tuple[int, int]]:
+        try:
+            table_name, key = self._get_cached_ranges_key(query)
+        except QueryEngineError:
+            return []
+
+        if self.database_bypass or (connection := self.database_connection) is None:
+            return []
+
+        start_block, stop_block = query.start_block, query.stop_block  # type: ignore
+        with connection as conn:
+            result = conn.execute(
+                select(CachedRanges.start_block, CachedRanges.stop_block)
+                .where(CachedRanges.table_name == table_name)
+                .where(CachedRanges.key == key)
+                .where(CachedRanges.start_block <= stop_block)
+                .where(CachedRanges.stop_block >= start_block)
+                .order_by(CachedRanges.start_block)
+            )
+            return [(max(start, start_block), min(stop, stop_block)) for start, stop in result]
+
     @singledispatchmethod
     def perform_query(self, query: QueryType) -> Iterator:  # type: ignore
         """
@@ -315,52 +643,115 @@ class CacheQueryProvider(QueryAPI):
             "exceptions.html#ape.exceptions.QueryEngineError"
         )
 
+    def _block_query_clause(self, query: BlockQuery, *columns) -> Select:
+        return (
+            select(*columns)
+            .where(Blocks.number >= query.start_block)
+            .where(Blocks.number <= query.stop_block)
+            .where((Blocks.number - query.start_block) % query.step == 0)
+            .order_by(Blocks.number)
+        )
+
     @perform_query.register
     def _perform_block_query(self, query: BlockQuery) -> Iterator[BlockAPI]:
         with self.database_connection as conn:
-            result = conn.execute(
-                select([column(c) for c in query.columns])
-                .where(Blocks.number >= query.start_block)
-                .where(Blocks.number <= query.stop_block)
-                .where(Blocks.number % query.step == 0)
-            )
+            result = conn.execute(self._block_query_clause(query, Blocks))
 
             if not result:
                 # NOTE: Should be unreachable if estimated correctly
                 raise QueryEngineError(f"Could not perform query:\n{query}")
 
             yield from map(
-                lambda row: self.provider.network.ecosystem.decode_block(dict(row.items())), result
+                lambda row: self.provider.network.ecosystem.decode_block(_row_to_dict(row)), result
             )
 
+    def perform_columnar_query(
+        self, query: QueryType, columns: Sequence[str]
+    ) -> Iterator[dict[str, Sequence[Any]]]:
+        if not isinstance(query, BlockQuery):
+            raise APINotImplementedError(f"Cannot perform columnar '{type(query).__name__}'.")
+
+        table_columns = Blocks.__table__.columns  # type: ignore
+        if missing := set(columns) - set(table_columns.keys()):
+            raise APINotImplementedError(f"Columns '{', '.join(sorted(missing))}' are not cached.")
+
+        return self._perform_block_columnar_query(query, [table_columns[c] for c in columns])
+
+    def _perform_block_columnar_query(
+        self, query: BlockQuery, columns: list
+    ) -> Iterator[dict[str, Sequence[Any]]]:
+        batch_size = max(self.config_manager.get_config("cache").batch_size, 1)
+        with self.database_connection as conn:
+            result = conn.execute(self._block_query_clause(query, *columns))
+            while rows := result.fetchmany(batch_size):
+                yield {
+                    col.name: _convert_column(col, values)
+                    for col, values in zip(columns, zip(*rows))
+                }
+
     @perform_query.register
     def _perform_transaction_query(self, query: BlockTransactionQuery) -> Iterator[dict]:
         with self.database_connection as conn:
             result = conn.execute(
-                select([Transactions]).where(Transactions.block_hash == query.block_id)
+                select(Transactions).where(Transactions.block_hash == query.block_id)
             )
 
             if not result:
                 # NOTE: Should be unreachable if estimated correctly
                 raise QueryEngineError(f"Could not perform query:\n{query}")
 
-            yield from map(lambda row: dict(row.items()), result)
+            yield from map(_row_to_dict, result)
 
     @perform_query.register
     def _perform_contract_events_query(self, query: ContractEventQuery) -> Iterator[ContractLog]:
         with self.database_connection as conn:
+            addresses = query.contract if isinstance(query.contract, list) else [query.contract]
             result = conn.execute(
-                select([column(c) for c in query.columns])
+                select(*(c for c in ContractEvents.__table__.columns if c.name != "id"))
+                .where(ContractEvents.contract_address.in_(addresses))
+                .where(ContractEvents.event_name == query.event.name)
                 .where(ContractEvents.block_number >= query.start_block)
                 .where(ContractEvents.block_number <= query.stop_block)
-                .where(ContractEvents.block_number % query.step == 0)
+                .where((ContractEvents.block_number - query.start_block) % query.step == 0)
+                .order_by(ContractEvents.block_number, ContractEvents.log_index)
             )
 
             if not result:
                 # NOTE: Should be unreachable if estimated correctly
                 raise QueryEngineError(f"Could not perform query:\n{query}")
 
-            yield from map(lambda row: ContractLog.model_validate(dict(row.items())), result)
+            ecosystem = self.provider.network.ecosystem
+            for row in result:
+                try:
+                    log = _encode_log(query.event, row)
+                except (EncodingError, KeyError):
+                    # NOTE: Arguments that failed to decode originally are kept as stored.
+                    yield ContractLog.model_validate(
+                        {
+                            **row._mapping,
+                            "contract_address": to_checksum_address(row.contract_address),
+                        }
+                    )
+                else:
+                    yield from ecosystem.decode_logs([log], query.event)
+
+    @perform_query.register
+    def _perform_account_transactions_query(
+        self, query: AccountTransactionQuery
+    ) -> Iterator[ReceiptAPI]:
+        with self.database_connection as conn:
+            result = conn.execute(
+                select(AccountTransactions.txn_hash)
+                .where(AccountTransactions.account == query.account)
+                .where(AccountTransactions.nonce >= query.start_nonce)
+                .where(AccountTransactions.nonce <= query.stop_nonce)
+                .order_by(AccountTransactions.nonce)
+            )
+            txn_hashes = [to_hex(txn_hash) for txn_hash in result.scalars()]
+
+        yield from concurrent_map(
+            self.chain_manager.get_receipt, txn_hashes, self.provider.concurrency
+        )
 
     @singledispatchmethod
     def _cache_update_clause(self, query: QueryType) -> Insert:
@@ -397,8 +788,8 @@ class CacheQueryProvider(QueryAPI):
     #    return insert(Transactions)  # type: ignore
 
     @_cache_update_clause.register
-    def _cache_update_events_clause(self, query: ContractEventQuery) -> Insert:
-        return insert(ContractEvents)
+    def _cache_update_account_transactions_clause(self, query: AccountTransactionQuery) -> Insert:
+        return insert(AccountTransactions)
 
     @singledispatchmethod
     def _get_cache_data(
@@ -433,12 +824,8 @@ class CacheQueryProvider(QueryAPI):
             for col in table_columns:
                 if col == "txn_hash":
                     new_dict["txn_hash"] = val.txn_hash
-                elif col == "sender":
-                    new_dict["sender"] = new_dict["sender"].encode()
-                elif col == "receiver" and "receiver" in new_dict:
-                    new_dict["receiver"] = new_dict["receiver"].encode()
                 elif col == "receiver" and "receiver" not in new_dict:
-                    new_dict["receiver"] = b""
+                    new_dict["receiver"] = None
                 elif col == "block_hash":
                     new_dict["block_hash"] = query.block_id
                 elif col == "signature" and val.signature is not None:
@@ -449,10 +836,23 @@ class CacheQueryProvider(QueryAPI):
         return new_result
 
     @_get_cache_data.register
-    def _get_cache_events_data(
-        self, query: ContractEventQuery, result: Iterator[BaseInterfaceModel]
+    def _get_account_transactions_data(
+        self, query: AccountTransactionQuery, result: Iterator[BaseInterfaceModel]
     ) -> list[dict[str, Any]] | None:
-        return [m.model_dump(mode="json", by_alias=False) for m in result]
+        # NOTE: Only index confirmed transactions, so reorgs can't leave stale entries.
+        head = self.chain_manager.blocks.head.number or 0
+        confirmed_block = head - self.provider.network.required_confirmations
+        receipts = cast(list[ReceiptAPI], result)
+        return [
+            {
+                "account": query.account,
+                "nonce": receipt.nonce,
+                "block_number": receipt.block_number,
+                "txn_hash": receipt.txn_hash,
+            }
+            for receipt in receipts
+            if receipt.block_number <= confirmed_block
+        ]
 
     def update_cache(self, query: QueryType, result: Iterator[BaseInterfaceModel]):
         try:
@@ -463,15 +863,158 @@ class CacheQueryProvider(QueryAPI):
 
         # NOTE: Because of Python shortcircuiting, the first time `database_connection` is missing
         #       this will lock the class var `database_bypass` in place for the rest of the session
-        if not self.database_bypass and self.database_connection is not None:
-            logger.debug(f"Caching query: {query}")
-            with self.database_connection as conn:
-                try:
-                    conn.execute(
-                        clause.values(  # type: ignore
-                            self._get_cache_data(query, result)
-                        ).prefix_with("OR IGNORE")
-                    )
+        if self.database_bypass or (connection := self.database_connection) is None:
+            return
+
+        logger.debug(f"Caching query: {query}")
+        batch_size = max(self.config_manager.get_config("cache").batch_size, 1)
+        result = iter(result)
+        # NOTE: Insert all rows in a single transaction, in chunks of ``batch_size``
+        #   using ``executemany`` rather than one statement per query.
+        with connection as conn, conn.begin():
+            try:
+                while batch := list(islice(result, batch_size)):
+                    if rows := self._get_cache_data(query, iter(batch)):
+                        conn.execute(clause.prefix_with("OR IGNORE"), rows)
+
+            except QueryEngineError as err:
+                logger.warning(f"Database corruption: {err}")
+                return
+
+            try:
+                table_name, key = self._get_cached_ranges_key(query)
+            except QueryEngineError:
+                return
+
+            # NOTE: Skipped blocks are not cached, so the range is only covered without steps.
+            if query.step == 1:  # type: ignore
+                self._record_cached_range(
+                    conn,
+                    table_name,
+                    key,
+                    query.start_block,  # type: ignore
+                    query.stop_block,  # type: ignore
+                )
+
+
+class ContractLogCache(CacheQueryProvider):
+    """
+    A query engine that stores the logs of contract events in the cache database, along
+    with which block ranges have been scanned for each contract address and event.
+    Repeat event queries are served from the stored logs, and only the block ranges
+    not yet scanned are queried from other engines. Unlike the rest of the cache, its
+    tables are created on first use, without initializing the rest of the cache. Blocks
+    within the network's ``required_confirmations`` are never stored, so reorgs can't
+    leave stale logs.
+    """
+
+    _required_tables: ClassVar[set[str]] = {
+        ContractEvents.__tablename__,
+        CachedRanges.__tablename__,
+    }
+
+    @property
+    def _enabled(self) -> bool:
+        # NOTE: Local networks and forks can revert to snapshots.
+        return self.network_manager.connected and not self.provider.network.is_dev
+
+    @property
+    def database_connection(self):
+        return super().database_connection if self._enabled else None
+
+    def _ensure_database(self):
+        ecosystem_name = self.provider.network.ecosystem.name
+        network_name = self.provider.network.name
+        database_file = self._get_database_file(ecosystem_name, network_name)
+        if not database_file.is_file():
+            self._create_tables(database_file, self._required_tables)
+
+    def _get_keys(self, query: ContractEventQuery) -> dict[AddressType, str]:
+        if query.search_topics:
+            # NOTE: Filtered logs don't cover the range for other filters.
+            return {}
+
+        addresses = query.contract if isinstance(query.contract, list) else [query.contract]
+        return {address: f"{address}:{query.event.selector}" for address in addresses}
+
+    def estimate_query(self, query: QueryType) -> int | None:
+        # NOTE: Scanned ranges are served via `get_cached_ranges()`.
+        return None
+
+    def get_cached_ranges(self, query: QueryType) -> list[tuple[int, int]]:
+        if not isinstance(query, ContractEventQuery) or not (keys := self._get_keys(query)):
+            return []
+
+        elif (connection := self.database_connection) is None:
+            return []
+
+        with connection as conn:
+            result = conn.execute(
+                select(CachedRanges.key, CachedRanges.start_block, CachedRanges.stop_block)
+                .where(CachedRanges.table_name == ContractEvents.__tablename__)
+                .where(CachedRanges.key.in_(keys.values()))
+                .where(CachedRanges.start_block <= query.stop_block)
+                .where(CachedRanges.stop_block >= query.start_block)
+            )
+            ranges: dict[str, list[tuple[int, int]]] = {key: [] for key in keys.values()}
+            for key, start_block, stop_block in result:
+                ranges[key].append((start_block, stop_block))
+
+        # NOTE: A range is only scanned when it is scanned for every address.
+        scanned = [(query.start_block, query.stop_block)]
+        for key_ranges in ranges.values():
+            scanned = _intersect_ranges(scanned, key_ranges)
+
+        return scanned
+
+    def perform_query(self, query: QueryType) -> Iterator[ContractLog]:  # type: ignore[override]
+        if not isinstance(query, ContractEventQuery) or not self._get_keys(query):
+            raise QueryEngineError(f"Cannot handle '{type(query)}'.")
+
+        return self._perform_contract_events_query(query)
+
+    def update_cache(self, query: QueryType, result: Iterator[BaseInterfaceModel]):
+        if not isinstance(query, ContractEventQuery) or not (keys := self._get_keys(query)):
+            return
+
+        elif query.step != 1:
+            # NOTE: Skipped blocks are not scanned.
+            return
+
+        # NOTE: Only store confirmed blocks, which can't be re-organized.
+        confirmed_block = (
+            self.chain_manager.blocks.height - self.provider.network.required_confirmations
+        )
+        stop_block = min(query.stop_block, confirmed_block)
+        if stop_block < query.start_block or not self._enabled:
+            return
+
+        self._ensure_database()
+        if (connection := self.database_connection) is None:
+            return
+
+        logger.debug(f"Caching logs: {query}")
+        batch_size = max(self.config_manager.get_config("cache").batch_size, 1)
+        rows = (
+            log.model_dump(mode="json", by_alias=False)
+            for log in result
+            if isinstance(log, ContractLog)
+            and log.block_number <= stop_block
+            and log.contract_address in keys
+        )
+        with connection as conn, conn.begin():
+            # NOTE: Replace any logs stored by an earlier scan of the same blocks.
+            conn.execute(
+                delete(ContractEvents)
+                .where(ContractEvents.contract_address.in_(list(keys)))
+                .where(ContractEvents.event_name == query.event.name)
+                .where(ContractEvents.block_number >= query.start_block)
+                .where(ContractEvents.block_number <= stop_block)
+            )
+            while batch := list(islice(rows, batch_size)):
+                conn.execute(insert(ContractEvents), batch)
 
-                except QueryEngineError as err:
-                    logger.warning(f"Database corruption: {err}")
+            for key in keys.values():
+                self._record_cached_range(
+                    conn, ContractEvents.__tablename__, key, query.start_block, stop_block
+                )
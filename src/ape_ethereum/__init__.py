@@ -56,6 +56,7 @@ def __getattr__(name):
         return getattr(ecosystem_module, name)
 
     elif name in (
+        "AsyncWeb3Provider",
         "EthereumNodeProvider",
         "Web3Provider",
         "assert_web3_provider_uri_env_var_not_set",
@@ -92,6 +93,7 @@ def __getattr__(name):
 
 __all__ = [
     "AccessListTransaction",
+    "AsyncWeb3Provider",
     "Authorization",
     "BaseEthereumConfig",
     "BaseTransaction",
@@ -1,7 +1,7 @@
 import re
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from decimal import Decimal
-from functools import cached_property
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import rlp  # type: ignore
@@ -26,7 +26,7 @@ from pydantic import Field, computed_field, field_validator, model_validator
 from pydantic_settings import SettingsConfigDict
 
 from ape.api.config import PluginConfig
-from ape.api.networks import EcosystemAPI
+from ape.api.networks import EcosystemAPI, ProxyInfoAPI
 from ape.api.providers import BlockAPI
 from ape.contracts.base import ContractCall
 from ape.exceptions import (
@@ -56,6 +56,7 @@ from ape.utils.misc import (
     EMPTY_BYTES32,
     LOCAL_NETWORK_NAME,
     ZERO_ADDRESS,
+    to_int,
 )
 from ape_ethereum.proxies import (
     GET_APP_ABI,
@@ -95,6 +96,65 @@ NETWORKS = {
 }
 BLUEPRINT_HEADER = HexBytes("0xfe71")
 
+# NOTE: Runtime bytecode (hex) patterns of proxies that hard-code their target.
+_PROXY_BYTECODE_PATTERN_STRS = {
+    ProxyType.Minimal: r"^363d3d373d3d3d363d73(.{40})5af43d82803e903d91602b57fd5bf3",
+    ProxyType.ZeroAge: r"^3d3d3d3d363d3d37363d73(.{40})5af43d3d93803e602a57fd5bf3",
+    ProxyType.Clones: r"^36603057343d52307f830d2d700a97af574b186c80d40429385d24241565b08a7c559ba283a964d9b160203da23d3df35b3d3d3d3d363d3d37363d73(.{40})5af43d3d93803e605b57fd5bf3",
+    ProxyType.Vyper: r"^366000600037611000600036600073(.{40})5af4602c57600080fd5b6110006000f3",
+    ProxyType.VyperBeta: r"^366000600037611000600036600073(.{40})5af41558576110006000f3",
+    ProxyType.CWIA: r"^3d3d3d3d363d3d3761.{4}603736393661.{4}013d73(.{40})5af43d3d93803e603557fd5bf3.*",
+    ProxyType.OldCWIA: r"^363d3d3761.{4}603836393d3d3d3661.{4}013d73(.{40})5af43d82803e903d91603657fd5bf3.*",
+    ProxyType.SudoswapCWIA: r"^3d3d3d3d363d3d37605160353639366051013d73(.{40})5af43d3d93803e603357fd5bf3.*",
+    ProxyType.SoladyCWIA: r"36602c57343d527f9e4ac34f21c619cefc926c8bd93b54bf5a39c7ab2127a895af1cc0691d7e3dff593da1005b363d3d373d3d3d3d61.{4}806062363936013d73(.{40})5af43d3d93803e606057fd5bf3.*",
+    ProxyType.SplitsCWIA: r"36602f57343d527f9e4ac34f21c619cefc926c8bd93b54bf5a39c7ab2127a895af1cc0691d7e3dff60203da13d3df35b3d3d3d3d363d3d3761.{4}606736393661.{4}013d73(.{40})5af43d3d93803e606557fd5bf3.*",
+    ProxyType.SoladyPush0: r"^5f5f365f5f37365f73(.{40})5af43d5f5f3e6029573d5ffd5b3d5ff3",
+    ProxyType.SetCode: r"^ef0100(.{40})$",
+}
+_PROXY_BYTECODE_PATTERNS = {
+    proxy_type: re.compile(pattern) for proxy_type, pattern in _PROXY_BYTECODE_PATTERN_STRS.items()
+}
+_SEQUENCE_PROXY_PATTERN = re.compile(r"363d3d373d3d3d363d30545af43d82803e903d91601857fd5bf3")
+
+
+def _str_to_slot(text: str) -> int:
+    return int(to_hex(keccak(text=text)), 16)
+
+
+# NOTE: Storage slots holding the targets of proxies, in order of detection.
+_PROXY_STORAGE_SLOTS = {
+    ProxyType.Standard: _str_to_slot("eip1967.proxy.implementation") - 1,
+    ProxyType.Beacon: _str_to_slot("eip1967.proxy.beacon") - 1,
+    ProxyType.OpenZeppelin: _str_to_slot("org.zeppelinos.proxy.implementation"),
+    ProxyType.UUPS: _str_to_slot("PROXIABLE"),
+}
+_ARAGON_STORAGE_SLOTS = (
+    _str_to_slot("aragonOS.appStorage.kernel"),
+    _str_to_slot("aragonOS.appStorage.appId"),
+)
+
+
+# NOTE: Safe proxies store their target in slot 0.
+_PROXY_DETECTION_SLOTS = (0, *_PROXY_STORAGE_SLOTS.values(), *_ARAGON_STORAGE_SLOTS)
+
+
+def _get_proxy_storage_requests(address: AddressType) -> list[tuple[str, list]]:
+    return [
+        ("eth_getStorageAt", [address, to_hex(slot), "latest"]) for slot in _PROXY_DETECTION_SLOTS
+    ]
+
+
+def _parse_proxy_storages(results: list) -> dict[int, HexBytes] | Exception | None:
+    if any(isinstance(value, APINotImplementedError) for value in results):
+        # Storage lookups are not supported by this provider.
+        return None
+
+    elif err := next((value for value in results if isinstance(value, Exception)), None):
+        # NOTE: Return other errors so a failed lookup is not mistaken for "not a proxy".
+        return err
+
+    return {slot: HexBytes(value) for slot, value in zip(_PROXY_DETECTION_SLOTS, results)}
+
 
 class NetworkConfig(PluginConfig):
     """
@@ -369,6 +429,22 @@ class EthereumConfig(BaseEthereumConfig):
     sepolia: NetworkConfig = create_network_config(block_time=15)
 
 
+# NOTE: The block fields that can be decoded from a raw block header,
+#   by their header key, converter and default value.
+_BLOCK_HEADER_FIELDS: dict[str, tuple[str, Callable[[Any], Any], Any]] = {
+    "number": ("number", to_int, None),
+    "hash": ("hash", HexBytes, None),
+    "parent_hash": ("parentHash", HexBytes, EMPTY_BYTES32),
+    "timestamp": ("timestamp", to_int, None),
+    "gas_limit": ("gasLimit", to_int, None),
+    "gas_used": ("gasUsed", to_int, None),
+    "base_fee": ("baseFeePerGas", to_int, 0),
+    "difficulty": ("difficulty", to_int, 0),
+    "total_difficulty": ("totalDifficulty", to_int, 0),
+    "size": ("size", to_int, None),
+}
+
+
 class Block(BlockAPI):
     """
     Class for representing a block on a chain.
@@ -487,29 +563,85 @@ class Ethereum(EcosystemAPI):
         )
 
     def get_proxy_info(self, address: AddressType) -> ProxyInfo | None:
-        contract_code = self.chain_manager.get_code(address)
-        code_bytes = HexBytes(contract_code)
+        return cast(ProxyInfo | None, self.get_proxy_infos([address])[address])
+
+    def get_proxy_infos(
+        self, addresses: Iterable[AddressType], raise_on_error: bool = True
+    ) -> dict[AddressType, ProxyInfoAPI | ApeException | None]:
+        addresses = list(dict.fromkeys(addresses))
+        if not addresses:
+            return {}
+
+        codes = self.chain_manager.get_codes(addresses)
+        proxy_infos: dict[AddressType, ProxyInfoAPI | ApeException | None] = {}
+        storage_proxies: dict[AddressType, HexBytes] = {}
+        for address in addresses:
+            code_bytes = HexBytes(codes[address])
+            if not code_bytes:
+                proxy_infos[address] = None
+
+            elif proxy_info := self._get_proxy_info_from_code(address, code_bytes):
+                proxy_infos[address] = proxy_info
+
+            # Remaining proxy types delegate calls to their implementation. If
+            # runtime bytecode has no executable DELEGATECALL opcode, avoid storage
+            # probes and calls entirely.
+            elif 0xF4 in strip_push_data(strip_compiler_metadata(code_bytes)):
+                storage_proxies[address] = code_bytes
 
-        if not code_bytes:
-            return None
+            else:
+                proxy_infos[address] = None
+
+        # NOTE: When requests cannot be batched, the slots are read one at a time
+        #   instead, so detection stops at the first slot identifying the proxy.
+        storage_values = (
+            self._get_proxy_storages(list(storage_proxies))
+            if storage_proxies and self.provider.supports_batch_requests
+            else {}
+        )
+        for address, code_bytes in storage_proxies.items():
+            get_slot: Callable[[int], HexBytes] | None
+            try:
+                if address not in storage_values:
+                    get_slot = partial(self.provider.get_storage, address)
+                elif isinstance(values := storage_values[address], Exception):
+                    raise values
+                else:
+                    get_slot = None if values is None else values.__getitem__
 
-        code = code_bytes.hex()
-        patterns = {
-            ProxyType.Minimal: r"^363d3d373d3d3d363d73(.{40})5af43d82803e903d91602b57fd5bf3",
-            ProxyType.ZeroAge: r"^3d3d3d3d363d3d37363d73(.{40})5af43d3d93803e602a57fd5bf3",
-            ProxyType.Clones: r"^36603057343d52307f830d2d700a97af574b186c80d40429385d24241565b08a7c559ba283a964d9b160203da23d3df35b3d3d3d3d363d3d37363d73(.{40})5af43d3d93803e605b57fd5bf3",
-            ProxyType.Vyper: r"^366000600037611000600036600073(.{40})5af4602c57600080fd5b6110006000f3",
-            ProxyType.VyperBeta: r"^366000600037611000600036600073(.{40})5af41558576110006000f3",
-            ProxyType.CWIA: r"^3d3d3d3d363d3d3761.{4}603736393661.{4}013d73(.{40})5af43d3d93803e603557fd5bf3.*",
-            ProxyType.OldCWIA: r"^363d3d3761.{4}603836393d3d3d3661.{4}013d73(.{40})5af43d82803e903d91603657fd5bf3.*",
-            ProxyType.SudoswapCWIA: r"^3d3d3d3d363d3d37605160353639366051013d73(.{40})5af43d3d93803e603357fd5bf3.*",
-            ProxyType.SoladyCWIA: r"36602c57343d527f9e4ac34f21c619cefc926c8bd93b54bf5a39c7ab2127a895af1cc0691d7e3dff593da1005b363d3d373d3d3d3d61.{4}806062363936013d73(.{40})5af43d3d93803e606057fd5bf3.*",
-            ProxyType.SplitsCWIA: r"36602f57343d527f9e4ac34f21c619cefc926c8bd93b54bf5a39c7ab2127a895af1cc0691d7e3dff60203da13d3df35b3d3d3d3d363d3d3761.{4}606736393661.{4}013d73(.{40})5af43d3d93803e606557fd5bf3.*",
-            ProxyType.SoladyPush0: r"^5f5f365f5f37365f73(.{40})5af43d5f5f3e6029573d5ffd5b3d5ff3",
-            ProxyType.SetCode: r"^ef0100(.{40})$",
+                proxy_infos[address] = self._get_proxy_info_from_storage(
+                    address, code_bytes, get_slot
+                )
+
+            except NotImplementedError:
+                # Storage lookups are not supported by this provider.
+                proxy_infos[address] = None
+
+            except ApeException as err:
+                if raise_on_error:
+                    raise
+
+                proxy_infos[address] = err
+
+        return {address: proxy_infos[address] for address in addresses}
+
+    def _get_proxy_storages(
+        self, addresses: list[AddressType]
+    ) -> dict[AddressType, dict[int, HexBytes] | Exception | None]:
+        requests = [req for address in addresses for req in _get_proxy_storage_requests(address)]
+        results = self.provider.make_batch_request(requests, raise_on_error=False)
+        num_slots = len(_PROXY_DETECTION_SLOTS)
+        return {
+            address: _parse_proxy_storages(results[idx * num_slots : (idx + 1) * num_slots])
+            for idx, address in enumerate(addresses)
         }
-        for type_, pattern in patterns.items():
-            if match := re.match(pattern, code):
+
+    def _get_proxy_info_from_code(
+        self, address: AddressType, code_bytes: HexBytes
+    ) -> ProxyInfo | None:
+        code = code_bytes.hex()
+        for type_, pattern in _PROXY_BYTECODE_PATTERNS.items():
+            if match := pattern.match(code):
                 target = self.conversion_manager.convert(match.group(1), AddressType)
                 return ProxyInfo(type=type_, target=target)
 
@@ -531,22 +663,27 @@ class Ethereum(EcosystemAPI):
             except (ApeException, ValueError):
                 pass
 
-        # Remaining proxy types delegate calls to their implementation. If
-        # runtime bytecode has no executable DELEGATECALL opcode, avoid storage
-        # probes and calls entirely.
-        opcodes = strip_push_data(strip_compiler_metadata(code_bytes))
-        if 0xF4 not in opcodes:
-            return None
+        return None
 
-        sequence_pattern = r"363d3d373d3d3d363d30545af43d82803e903d91601857fd5bf3"
-        if re.match(sequence_pattern, code):
+    def _get_proxy_info_from_storage(
+        self,
+        address: AddressType,
+        code_bytes: HexBytes,
+        get_slot: Callable[[int], HexBytes] | None,
+    ) -> ProxyInfo | None:
+        code = code_bytes.hex()
+        if _SEQUENCE_PROXY_PATTERN.match(code):
             # the implementation is stored in the slot matching proxy address
             slot = self.provider.get_storage(address, address)
             target = self.conversion_manager.convert(slot[-20:], AddressType)
             return ProxyInfo(type=ProxyType.Sequence, target=target)
 
+        if get_slot is None:
+            # Storage lookups are not supported by this provider.
+            return None
+
         # Safe >1.0.0 provides `masterCopy()`, which is also stored in slot 0.
-        # Check the bytecode marker first to avoid unrelated storage checks and calls.
+        # Check the bytecode marker first to avoid unrelated calls.
         master_copy_selector = self.get_method_selector(MASTER_COPY_ABI).hex()
         safe_master_copy_markers = (
             # Safe v1.1.0 through v1.4.1 compares calldata against a padded PUSH32.
@@ -558,8 +695,7 @@ class Ethereum(EcosystemAPI):
         )
         if any(marker in code for marker in safe_master_copy_markers):
             try:
-                slot_0 = self.provider.get_storage(address, 0)
-                target = self.conversion_manager.convert(slot_0[-20:], AddressType)
+                target = self.conversion_manager.convert(get_slot(0)[-20:], AddressType)
                 # NOTE: `target` is set in initialized proxies
                 if target != ZERO_ADDRESS and target == ContractCall(MASTER_COPY_ABI, address)(
                     skip_trace=True
@@ -569,30 +705,11 @@ class Ethereum(EcosystemAPI):
             except ApeException:
                 pass
 
-        def str_to_slot(text):
-            return int(to_hex(keccak(text=text)), 16)
-
-        slots = {
-            ProxyType.Standard: str_to_slot("eip1967.proxy.implementation") - 1,
-            ProxyType.Beacon: str_to_slot("eip1967.proxy.beacon") - 1,
-            ProxyType.OpenZeppelin: str_to_slot("org.zeppelinos.proxy.implementation"),
-            ProxyType.UUPS: str_to_slot("PROXIABLE"),
-        }
-        get_storage_supported = True
-        for _type, slot in slots.items():
-            try:
-                # TODO perf: use a batch call here when ape adds support
-                storage = self.provider.get_storage(address, slot)
-            except NotImplementedError:
-                # Break early on not-implemented error rather than attempting
-                # to try more proxy types.
-                get_storage_supported = False
-                break
-
-            if sum(storage) == 0:
+        for _type, slot in _PROXY_STORAGE_SLOTS.items():
+            if sum(value := get_slot(slot)) == 0:
                 continue
 
-            target = self.conversion_manager.convert(storage[-20:], AddressType)
+            target = self.conversion_manager.convert(value[-20:], AddressType)
             # read `target.implementation()`
             if _type == ProxyType.Beacon:
                 target = ContractCall(IMPLEMENTATION_ABI, target)(skip_trace=True)
@@ -601,28 +718,24 @@ class Ethereum(EcosystemAPI):
 
         # aragonOS AppProxyUpgradeable: kernel + appId stored at fixed slots; the
         # implementation is resolved through Kernel.getApp(APP_BASES_NAMESPACE, appId).
-        if get_storage_supported:
-            kernel_storage = self.provider.get_storage(
-                address, str_to_slot("aragonOS.appStorage.kernel")
-            )
-            if sum(kernel_storage) != 0:
-                kernel = self.conversion_manager.convert(kernel_storage[-20:], AddressType)
-                app_id = self.provider.get_storage(
-                    address, str_to_slot("aragonOS.appStorage.appId")
+        kernel_slot, app_id_slot = _ARAGON_STORAGE_SLOTS
+        if (
+            sum(kernel_storage := get_slot(kernel_slot)) != 0
+            and sum(app_id := get_slot(app_id_slot)) != 0
+        ):
+            kernel = self.conversion_manager.convert(kernel_storage[-20:], AddressType)
+            try:
+                target = ContractCall(GET_APP_ABI, kernel)(
+                    keccak(text="base"), bytes(app_id), skip_trace=True
                 )
-                if sum(app_id) != 0:
-                    try:
-                        target = ContractCall(GET_APP_ABI, kernel)(
-                            keccak(text="base"), bytes(app_id), skip_trace=True
-                        )
-                        if target != ZERO_ADDRESS:
-                            return ProxyInfo(
-                                type=ProxyType.AragonAppUpgradeable,
-                                target=target,
-                                abi=GET_APP_ABI,
-                            )
-                    except ApeException:
-                        pass
+                if target != ZERO_ADDRESS:
+                    return ProxyInfo(
+                        type=ProxyType.AragonAppUpgradeable,
+                        target=target,
+                        abi=GET_APP_ABI,
+                    )
+            except ApeException:
+                pass
 
         return None
 
@@ -707,6 +820,28 @@ class Ethereum(EcosystemAPI):
 
         return Block.model_validate(data)
 
+    def decode_block_columns(
+        self, headers: Sequence[dict], columns: Sequence[str]
+    ) -> dict[str, list[Any]]:
+        if missing := set(columns) - {*_BLOCK_HEADER_FIELDS, "num_transactions"}:
+            raise APINotImplementedError(
+                f"Columns '{', '.join(sorted(missing))}' are not in block headers."
+            )
+
+        values: dict[str, list[Any]] = {}
+        for column in columns:
+            if column == "num_transactions":
+                values[column] = [len(header.get("transactions") or []) for header in headers]
+                continue
+
+            key, convert, default = _BLOCK_HEADER_FIELDS[column]
+            values[column] = [
+                default if (value := header.get(key)) is None else convert(value)
+                for header in headers
+            ]
+
+        return values
+
     def _python_type_for_abi_type(self, abi_type: ABIType) -> type | Sequence:
         # NOTE: An array can be an array of tuples, so we start with an array check
         if str(abi_type.type).endswith("]"):
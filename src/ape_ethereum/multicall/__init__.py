@@ -1,7 +1,9 @@
-from .handlers import BaseMulticall, Call, Transaction
+from .handlers import BaseMulticall, Call, CallBatch, CallFuture, Transaction
 
 __all__ = [
     "BaseMulticall",
     "Call",
+    "CallBatch",
+    "CallFuture",
     "Transaction",
 ]
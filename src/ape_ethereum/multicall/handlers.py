@@ -1,3 +1,4 @@
+import re
 from collections.abc import Iterator
 from functools import cached_property
 from types import ModuleType
@@ -6,16 +7,19 @@ from typing import TYPE_CHECKING, Any
 from ethpm_types import ContractType
 
 from ape.contracts.base import (
+    _CALL_BATCH,
+    ContractCall,
     ContractCallHandler,
     ContractInstance,
     ContractMethodHandler,
     ContractTransactionHandler,
     _select_method_abi,
 )
-from ape.exceptions import ChainError, DecodingError
+from ape.exceptions import ChainError, DecodingError, ProviderError, VirtualMachineError
 from ape.logging import logger
 from ape.utils.abi import MethodABI
 from ape.utils.basemodel import ManagerAccessMixin
+from ape.utils.process import concurrent_map
 
 from .constants import (
     MULTICALL3_ADDRESS,
@@ -29,8 +33,22 @@ if TYPE_CHECKING:
     from eth_pydantic_types import HexBytes
 
     from ape.api.transactions import ReceiptAPI, TransactionAPI
+    from ape.types import BlockID
     from ape.types.address import AddressType
 
+# NOTE: Errors nodes give when an `eth_call` is too large to execute or return.
+_CALL_SIZE_ERROR_PATTERN = re.compile(
+    r"out of gas|gas required exceeds|exceeds (block )?gas (limit|cap)|"
+    r"gas (limit|cap) (reached|exceeded)|"
+    r"response size (exceeded|is too (large|big))|"
+    r"(request|payload|body|entity) (is )?too large|"
+    r"exceeds (the )?max(imum)? (request|payload|response) size",
+    re.IGNORECASE,
+)
+
+# NOTE: The ABI-encoded size of a `Call3` struct, excluding its call data.
+_CALL3_ENCODED_SIZE = 7 * 32
+
 
 class BaseMulticall(ManagerAccessMixin):
     def __init__(
@@ -168,10 +186,27 @@ class Call(BaseMulticall):
         self,
         address: "AddressType" = MULTICALL3_ADDRESS,
         supported_chains: list[int] | None = None,
+        max_calldata_size: int = 128 * 1024,
+        max_gas: int = 25_000_000,
+        gas_per_call: int = 50_000,
     ) -> None:
+        """
+        Initialize a new Multicall session object. Calls are split into chunks, each
+        sent as its own ``eth_call``, so large sessions stay within the node's limits.
+
+        Args:
+            address (AddressType): The address of the Multicall3 contract.
+            supported_chains (list[int] | None): Chain IDs with a Multicall3 contract.
+            max_calldata_size (int): The maximum size of the encoded calls per chunk.
+            max_gas (int): The maximum estimated gas per chunk.
+            gas_per_call (int): The estimated gas of each call.
+        """
         super().__init__(address=address, supported_chains=supported_chains)
 
         self.abis: list[MethodABI] = []
+        self.max_calldata_size = max_calldata_size
+        self.max_gas = max_gas
+        self.gas_per_call = gas_per_call
         self._result: list[tuple[bool, HexBytes]] | None = None
 
     @property
@@ -229,9 +264,57 @@ class Call(BaseMulticall):
             Iterator[Any]: the sequence of values produced by performing each call stored
               by this instance.
         """
-        self._result = self.handler(self.calls, **call_kwargs)
+        handler = self.handler
+        chunks = list(self._get_chunks())
+        if len(chunks) <= 1:
+            self._result = self._call_chunk(handler, self.calls, **call_kwargs)
+
+        else:
+            # NOTE: Results are re-assembled in the order of the calls.
+            results = concurrent_map(
+                lambda chunk: self._call_chunk(handler, chunk, **call_kwargs),
+                chunks,
+                self.provider.concurrency,
+            )
+            self._result = [result for chunk_results in results for result in chunk_results]
+
         return self._decode_results()
 
+    def _get_chunks(self) -> Iterator[list[dict]]:
+        chunk: list[dict] = []
+        chunk_size = 0
+        for call in self.calls:
+            call_size = _CALL3_ENCODED_SIZE + len(call["callData"])
+            if chunk and (
+                chunk_size + call_size > self.max_calldata_size
+                or (len(chunk) + 1) * self.gas_per_call > self.max_gas
+            ):
+                yield chunk
+                chunk = []
+                chunk_size = 0
+
+            chunk.append(call)
+            chunk_size += call_size
+
+        if chunk:
+            yield chunk
+
+    def _call_chunk(self, handler: ContractCallHandler, calls: list[dict], **call_kwargs) -> list:
+        try:
+            return list(handler(calls, **call_kwargs))
+
+        except (ProviderError, VirtualMachineError) as err:
+            if len(calls) <= 1 or not _CALL_SIZE_ERROR_PATTERN.search(str(err)):
+                raise
+
+            # NOTE: The chunk is too large for the node, so split it in half and retry.
+            logger.debug(f"Splitting multicall of {len(calls)} calls: {err}")
+            middle = len(calls) // 2
+            return [
+                *self._call_chunk(handler, calls[:middle], **call_kwargs),
+                *self._call_chunk(handler, calls[middle:], **call_kwargs),
+            ]
+
     def as_transaction(self, **txn_kwargs) -> "TransactionAPI":
         """
         Encode the Multicall transaction as a ``TransactionAPI`` object, but do not execute it.
@@ -242,6 +325,175 @@ class Call(BaseMulticall):
         return self.handler.as_transaction(self.calls, **txn_kwargs)
 
 
+class CallFuture:
+    """
+    The pending result of a contract call made inside of a :class:`CallBatch`.
+    """
+
+    def __init__(self, batch: "CallBatch") -> None:
+        self._batch = batch
+        self._done = False
+        self._value: Any = None
+        self._error: Exception | None = None
+
+    def __repr__(self) -> str:
+        state = "done" if self._done else "pending"
+        return f"<CallFuture {state}>"
+
+    def done(self) -> bool:
+        """
+        Whether the call has been performed.
+        """
+        return self._done
+
+    def result(self) -> Any:
+        """
+        The decoded result of the call. Flushes the batch if it has not been flushed yet.
+
+        Raises:
+            Exception: The error the call raised, such as a
+              :class:`~ape.exceptions.ContractLogicError`.
+        """
+        if not self._done:
+            # NOTE: Errors of other calls in the batch are recorded on their own futures.
+            self._batch._flush()
+
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+    def _set_result(self, value: Any) -> None:
+        self._value = value
+        self._done = True
+
+    def _set_error(self, error: Exception) -> None:
+        self._error = error
+        self._done = True
+
+
+class CallBatch(ManagerAccessMixin):
+    """
+    Collect view calls made within the context and perform them using as few
+    Multicall3 ``aggregate3`` calls as possible, one group per block identifier.
+    Each call returns a :class:`CallFuture` instead of its result.
+
+    Usage example::
+
+        with chain.batch_calls():
+            balances = [token.balanceOf(account) for account in accounts]
+
+        balances = [balance.result() for balance in balances]
+    """
+
+    def __init__(self, address: "AddressType" = MULTICALL3_ADDRESS, **call_kwargs) -> None:
+        """
+        Args:
+            address (AddressType): The address of the Multicall3 contract.
+            **call_kwargs: Additional kwargs for each :class:`Call`, such as
+              ``max_calldata_size``.
+        """
+        self.address = address
+        self.call_kwargs = call_kwargs
+        self._pending: dict[
+            "BlockID | None", list[tuple[ContractCallHandler, tuple, CallFuture]]
+        ] = {}
+        self._tokens: list = []
+
+    def __enter__(self) -> "CallBatch":
+        self._tokens.append(_CALL_BATCH.set(self))
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+
+        finally:
+            _CALL_BATCH.reset(self._tokens.pop())
+
+    def add(
+        self, handler: ContractCallHandler, *args, block_identifier: "BlockID | None" = None
+    ) -> CallFuture:
+        """
+        Add a call to the batch.
+
+        Args:
+            handler (:class:`~ape.contracts.base.ContractCallHandler`): The method to call.
+            *args: The arguments to invoke the method with.
+            block_identifier (BlockID | None): The block to perform the call at.
+
+        Returns:
+            :class:`CallFuture`
+        """
+        future = CallFuture(self)
+        self._pending.setdefault(block_identifier, []).append((handler, args, future))
+        return future
+
+    def flush(self) -> None:
+        """
+        Perform all pending calls and resolve their futures.
+
+        Raises:
+            Exception: The first error a group of calls failed with. The error
+              is also set on each future of that group.
+        """
+        if errors := self._flush():
+            raise errors[0]
+
+    def _flush(self) -> list[Exception]:
+        pending, self._pending = self._pending, {}
+        errors: list[Exception] = []
+
+        # NOTE: Disable batching so the calls made here are sent.
+        token = _CALL_BATCH.set(None)
+        try:
+            # NOTE: Flush each group on its own, so one failing group leaves no future pending.
+            for block_id, calls in pending.items():
+                call_kwargs = {} if block_id is None else {"block_identifier": block_id}
+                try:
+                    self._flush_calls(calls, call_kwargs)
+                except Exception as err:
+                    errors.append(err)
+
+        finally:
+            _CALL_BATCH.reset(token)
+
+        return errors
+
+    def _flush_calls(
+        self, calls: list[tuple[ContractCallHandler, tuple, CallFuture]], call_kwargs: dict
+    ) -> None:
+        multicall = Call(address=self.address, **self.call_kwargs)
+        try:
+            for handler, args, _ in calls:
+                multicall.add(handler, *args)
+
+            multicall(**call_kwargs)
+        except UnsupportedChainError:
+            logger.debug("Multicall3 not available. Performing batched calls individually.")
+            returndata: list = [None] * len(calls)
+        except Exception as err:
+            for *_, future in calls:
+                future._set_error(err)
+
+            raise
+        else:
+            returndata = multicall.returnData
+
+        for (handler, args, future), abi, data in zip(calls, multicall.abis, returndata):
+            if data is None:
+                # NOTE: Perform failed calls on their own so they raise as usual.
+                try:
+                    future._set_result(handler(*args, **call_kwargs))
+                except Exception as err:
+                    future._set_error(err)
+
+            else:
+                contract_call = ContractCall(abi=abi, address=handler.contract.address)
+                future._set_result(contract_call._decode_returndata(data))
+
+
 class Transaction(BaseMulticall):
     """
     Create a sequence of calls to execute at once using ``eth_sendTransaction``
@@ -1,15 +1,20 @@
+import asyncio
 import json
 import os
 import re
 import sys
+import threading
 import time
 from abc import ABC
-from collections.abc import Callable, Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy
-from functools import cached_property, wraps
+from functools import cached_property, partial, wraps
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from queue import Empty, Queue
+from typing import TYPE_CHECKING, Any, NoReturn, cast
 
 import ijson  # type: ignore
 import requests
@@ -19,15 +24,16 @@ from eth_utils import add_0x_prefix, is_hex, to_hex
 from evmchains import PUBLIC_CHAIN_META, get_random_rpc
 from pydantic.dataclasses import dataclass
 from requests import HTTPError
-from web3 import HTTPProvider, IPCProvider, Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3, HTTPProvider, IPCProvider, Web3
 from web3 import __version__ as web3_version
-from web3.exceptions import ContractLogicError as Web3ContractLogicError
 from web3.exceptions import (
+    BlockNotFound,
     ExtraDataLengthError,
     MethodUnavailable,
     TimeExhausted,
     TransactionNotFound,
 )
+from web3.exceptions import ContractLogicError as Web3ContractLogicError
 
 from ape.types.private_mempool import Bundle, SimulationReport
 
@@ -64,12 +70,13 @@ from ape.exceptions import (
     VirtualMachineError,
 )
 from ape.logging import logger, sanitize_url
-from ape.types.events import ContractLog, LogFilter
+from ape.types.events import BlockRollback, ContractLog, LogFilter
 from ape.types.gas import AutoGasLimit
 from ape.types.trace import SourceTraceback
 from ape.utils.basemodel import ManagerAccessMixin
 from ape.utils.misc import DEFAULT_MAX_RETRIES_TX, gas_estimation_error_message, to_int
-from ape.utils.rpc import request_with_retry
+from ape.utils.process import concurrent_map
+from ape.utils.rpc import async_request_with_retry, request_with_retry
 from ape_ethereum._print import CONSOLE_ADDRESS, console_contract
 from ape_ethereum.trace import CallTrace, TraceApproach, TransactionTrace
 from ape_ethereum.transactions import AccessList, AccessListTransaction, TransactionStatusEnum
@@ -89,6 +96,50 @@ DEFAULT_HOSTNAME = "localhost"
 DEFAULT_HTTP_URI = f"http://{DEFAULT_HOSTNAME}:{DEFAULT_PORT}"
 DEFAULT_SETTINGS = {"uri": DEFAULT_HTTP_URI}
 
+# NOTE: Errors nodes give when an `eth_getLogs` range has too many results or blocks.
+_LOG_LIMIT_ERROR_PATTERN = re.compile(
+    r"returned more than [\d,]+ results|"
+    r"(log )?response size (exceeded|is too (large|big))|"
+    r"exceeds? (the )?max(imum)? (results|block range)|"
+    r"(block )?range (is )?too (large|wide)|"
+    r"block range limit exceeded|"
+    r"limited to a [\d,]+ (block )?range",
+    re.IGNORECASE,
+)
+
+# NOTE: Rate-limit errors are retried as-is rather than splitting the range.
+_RATE_LIMIT_ERROR_PATTERN = re.compile(r"rate.?limit|too many requests|\b429\b", re.IGNORECASE)
+
+
+def _is_log_limit_error(err: Exception) -> bool:
+    message = str(err)
+    return bool(
+        _LOG_LIMIT_ERROR_PATTERN.search(message) and not _RATE_LIMIT_ERROR_PATTERN.search(message)
+    )
+
+
+# NOTE: How much larger than `block_page_size` log pages may grow when they are empty.
+_MAX_LOG_PAGE_GROWTH = 32
+
+# NOTE: How many recently yielded blocks `poll_blocks()` keeps for finding re-org forks.
+_REORG_BUFFER_SIZE = 128
+
+# NOTE: How long to wait (in seconds) for a WebSocket subscription to start or stop.
+_SUBSCRIBE_TIMEOUT = 10
+_SUBSCRIPTION_CLOSED = object()
+
+
+def _split_runs(values: list[int]) -> list[list[int]]:
+    # Split sorted integers into runs of consecutive values.
+    runs: list[list[int]] = []
+    for value in values:
+        if runs and runs[-1][-1] == value - 1:
+            runs[-1].append(value)
+        else:
+            runs.append([value])
+
+    return runs
+
 
 def _sanitize_web3_url(msg: str) -> str:
     """Sanitize RPC URI from given log string"""
@@ -143,6 +194,11 @@ class Web3Provider(ProviderAPI, ABC):
 
     _supports_debug_trace_call: bool | None = None
 
+    _supports_batch_requests: bool | None = None
+    """
+    Is ``None`` until a batch request is attempted.
+    """
+
     _transaction_trace_cache: dict[str, TransactionTrace] = {}
 
     def __new__(cls, *args, **kwargs):
@@ -638,6 +694,45 @@ class Web3Provider(ProviderAPI, ABC):
 
         return self.network.ecosystem.decode_block(block_data)
 
+    def get_blocks(self, block_ids: Iterable["BlockID"]) -> Iterator[BlockAPI]:
+        if not self.supports_batch_requests:
+            # NOTE: No benefit from batching; use the regular lookup instead.
+            yield from super().get_blocks(block_ids)
+            return
+
+        for block_data in self._get_block_data(block_ids):
+            yield self.network.ecosystem.decode_block(block_data)
+
+    def get_block_headers(self, block_ids: Iterable["BlockID"]) -> Iterator[dict]:
+        if self.supports_batch_requests:
+            yield from self._get_block_data(block_ids)
+            return
+
+        for block_id in block_ids:
+            if isinstance(block_id, str) and block_id.isnumeric():
+                block_id = int(block_id)
+
+            try:
+                yield dict(self.web3.eth.get_block(block_id))
+            except BlockNotFound as err:
+                raise BlockNotFoundError(block_id, reason=str(err)) from err
+
+    def _get_block_data(self, block_ids: Iterable["BlockID"]) -> Iterator[dict]:
+        # NOTE: The requests do not include full transactions. If the node turns out
+        #   not to support batches, `make_batch_request()` makes them one at a time.
+        block_ids = iter(block_ids)
+        while page := list(islice(block_ids, self.batch_size)):
+            requests = [_get_block_request(block_id) for block_id in page]
+            results = self.make_batch_request(requests, raise_on_error=False)
+            for block_id, block_data in zip(page, results):
+                if isinstance(block_data, Exception):
+                    raise BlockNotFoundError(block_id, reason=str(block_data)) from block_data
+
+                elif not block_data:
+                    raise BlockNotFoundError(block_id)
+
+                yield block_data
+
     def _get_latest_block(self) -> BlockAPI:
         # perf: By-pass as much as possible since this is a common action.
         data = self._get_latest_block_rpc()
@@ -666,6 +761,20 @@ class Web3Provider(ProviderAPI, ABC):
 
             raise  # Raise original error
 
+    def get_storages(
+        self, address: "AddressType", slots: Iterable[int], block_id: "BlockID | None" = None
+    ) -> list[HexBytes]:
+        if not self.supports_batch_requests:
+            return super().get_storages(address, slots, block_id=block_id)
+
+        if block_id is None:
+            block_id = "latest"
+        elif isinstance(block_id, (int, bytes)):
+            block_id = to_hex(block_id)
+
+        requests = [("eth_getStorageAt", [address, to_hex(slot), block_id]) for slot in slots]
+        return [HexBytes(value) for value in self.make_batch_request(requests)]
+
     def get_transaction_trace(self, transaction_hash: str, **kwargs) -> "TraceAPI":
         if transaction_hash in self._transaction_trace_cache:
             return self._transaction_trace_cache[transaction_hash]
@@ -754,15 +863,7 @@ class Web3Provider(ProviderAPI, ABC):
     def _eth_call(
         self, arguments: list, raise_on_revert: bool = True, skip_trace: bool = False
     ) -> HexBytes:
-        # Force the usage of hex-type to support a wider-range of nodes.
-        txn_dict = copy(arguments[0])
-        if isinstance(txn_dict.get("type"), int):
-            txn_dict["type"] = to_hex(txn_dict["type"])
-
-        # Remove unnecessary values to support a wider-range of nodes.
-        txn_dict.pop("chainId", None)
-
-        arguments[0] = txn_dict
+        arguments[0] = _prepare_call_dict(arguments[0])
         try:
             result = self.make_request("eth_call", arguments)
         except Exception as err:
@@ -936,71 +1037,98 @@ class Web3Provider(ProviderAPI, ABC):
         if start_nonce > stop_nonce:
             raise ValueError("Starting nonce cannot be greater than stop nonce for search")
 
-        if not self.network.is_local and (stop_nonce - start_nonce) > 2:
+        nonces = list(range(start_nonce, stop_nonce + 1))
+        if not self.network.is_local and len(nonces) > 2:
             # NOTE: RPC usage might be acceptable to find 1 or 2 transactions reasonably quickly
             logger.warning(
                 "Performing this action is likely to be very slow and may "
-                f"use {20 * (stop_nonce - start_nonce)} or more RPC calls. "
+                f"use {2 * len(nonces)} or more RPC calls. "
                 "Consider installing an alternative data query provider plugin."
             )
 
-        yield from self._find_txn_by_account_and_nonce(
-            account,
-            start_nonce,
-            stop_nonce,
-            0,  # first block
-            self.chain_manager.blocks.head.number or 0,  # last block (or 0 if genesis-only chain)
-        )
+        found = self._find_txns_by_account_and_nonce(account, nonces)
+        txn_hashes = [found[nonce][1] for nonce in nonces if nonce in found]
+        yield from concurrent_map(self.get_receipt, txn_hashes, self.concurrency)
+
+    def _find_txns_by_account_and_nonce(
+        self, account: "AddressType", nonces: list[int]
+    ) -> dict[int, tuple[int, str]]:
+        # Binary search for the blocks containing the given nonces, splitting each
+        # `(start_nonce, stop_nonce, start_block, stop_block)` range at a nonce-count probe.
+        # The probes of every range are made concurrently each round, and nonces in the
+        # same range share them.
+        head = self.chain_manager.blocks.head.number or 0  # (or 0 if genesis-only chain)
+        ranges = [(run[0], run[-1], 0, head) for run in _split_runs(nonces)]
+        counts: dict[int, int] = {}
+        blocks: set[int] = set()
+
+        def get_count(block_number: int) -> int:
+            return self.web3.eth.get_transaction_count(account, block_number)
+
+        def get_txns(block_number: int) -> list[TransactionAPI]:
+            return list(self.get_transactions_by_block(block_number))
+
+        while ranges:
+            probes = sorted(
+                {start + (stop - start) // 2 for _, _, start, stop in ranges if start < stop}
+                - counts.keys()
+            )
+            counts.update(zip(probes, concurrent_map(get_count, probes, self.concurrency)))
+
+            next_ranges = []
+            for start_nonce, stop_nonce, start_block, stop_block in ranges:
+                if start_block == stop_block:
+                    # Honed in on one block where there's a delta in nonce
+                    blocks.add(stop_block)
+                    continue
+
+                block_number = start_block + (stop_block - start_block) // 2
+                txn_count = counts[block_number]
+                if start_nonce < txn_count:
+                    # NOTE: In case >1 txn in block
+                    next_ranges.append(
+                        (start_nonce, min(txn_count - 1, stop_nonce), start_block, block_number)
+                    )
 
-    def _find_txn_by_account_and_nonce(
-        self,
-        account: "AddressType",
-        start_nonce: int,
-        stop_nonce: int,
-        start_block: int,
-        stop_block: int,
-    ) -> Iterator[ReceiptAPI]:
-        # binary search between `start_block` and `stop_block` to yield txns from account,
-        # ordered from `start_nonce` to `stop_nonce`
+                if txn_count <= stop_nonce:
+                    next_ranges.append(
+                        (max(start_nonce, txn_count), stop_nonce, block_number + 1, stop_block)
+                    )
 
-        if start_block == stop_block:
-            # Honed in on one block where there's a delta in nonce, so must be the right block
-            for txn in self.get_transactions_by_block(stop_block):
-                assert isinstance(txn.nonce, int)  # NOTE: just satisfying mypy here
-                if txn.sender == account and txn.nonce >= start_nonce:
-                    yield self.get_receipt(to_hex(txn.txn_hash))
+            ranges = next_ranges
 
-            # Nothing else to search for
+        found: dict[int, tuple[int, str]] = {}
+        block_numbers = sorted(blocks)
+        wanted = set(nonces)
+        for block_number, txns in zip(
+            block_numbers, concurrent_map(get_txns, block_numbers, self.concurrency)
+        ):
+            for txn in txns:
+                if txn.sender == account and txn.nonce in wanted:
+                    found[cast(int, txn.nonce)] = (block_number, to_hex(txn.txn_hash))
 
-        else:
-            # Break up into smaller chunks
-            # NOTE: biased to `stop_block`
-            block_number = start_block + (stop_block - start_block) // 2 + 1
-            txn_count_prev_to_block = self.web3.eth.get_transaction_count(account, block_number - 1)
-
-            if start_nonce < txn_count_prev_to_block:
-                yield from self._find_txn_by_account_and_nonce(
-                    account,
-                    start_nonce,
-                    min(txn_count_prev_to_block - 1, stop_nonce),  # NOTE: In case >1 txn in block
-                    start_block,
-                    block_number - 1,
-                )
+        return found
 
-            if txn_count_prev_to_block <= stop_nonce:
-                yield from self._find_txn_by_account_and_nonce(
-                    account,
-                    max(start_nonce, txn_count_prev_to_block),  # NOTE: In case >1 txn in block
-                    stop_nonce,
-                    block_number,
-                    stop_block,
-                )
+    def _subscribe(self, subscription_type: str, *params: Any) -> "_Subscription | None":
+        # NOTE: Returns `None` when not able to subscribe, so callers can poll instead.
+        if not (ws_uri := self.ws_uri):
+            return None
+
+        subscription = _Subscription(ws_uri, subscription_type, *params)
+        try:
+            subscription.start()
+        except ProviderError as err:
+            logger.warning(f"Unable to subscribe to '{subscription_type}', polling instead: {err}")
+            return None
+
+        return subscription
 
     def poll_blocks(
         self,
         stop_block: int | None = None,
         required_confirmations: int | None = None,
         new_block_timeout: int | None = None,
+        on_rollback: Callable[[BlockRollback], None] | None = None,
     ) -> Iterator[BlockAPI]:
         # Wait half the time as the block time
         # to get data faster.
@@ -1037,69 +1165,154 @@ class Web3Provider(ProviderAPI, ABC):
             if time_waiting > timeout:
                 raise ProviderError("Timed out waiting for next block.")
 
-        # Begin the daemon.
-        while True:
-            # The next block we want is simply 1 after the last.
-            next_block = last.number + 1
-            head = self._get_latest_block()
-            try:
-                if head.number is None or head.hash is None:
-                    raise ProviderError("Head block has no number or hash.")
+        # NOTE: The most recently yielded blocks as `(number, hash, parent_hash)`, so the
+        #   fork point of a re-org is found by walking parent hashes instead of re-fetching.
+        recent: deque[tuple[int, Any, Any]] = deque(maxlen=_REORG_BUFFER_SIZE)
+        recent.append((last_num, last_hash, fake_last_block.parent_hash))
+
+        def rollback(block: BlockAPI) -> deque[BlockAPI]:
+            # Walk the parent hashes back from the given block of the new chain until
+            # reaching a buffered block; that is the fork. Returns the new chain's blocks
+            # after the fork, so only the divergent suffix is fetched.
+            orphaned: list[Any] = []
+            new_blocks: deque[BlockAPI] = deque()
+            while recent and recent[-1][0] > (block.number or 0):
+                orphaned.insert(0, recent.pop()[1])
+
+            while not (recent and recent[-1][1] == block.hash):
+                if recent and recent[-1][0] == block.number:
+                    orphaned.insert(0, recent.pop()[1])
+
+                new_blocks.appendleft(block)
+                if recent and recent[-1][1] == block.parent_hash:
+                    break
 
-                # Use an "adjusted" head, based on the required confirmations.
-                adjusted_head = self.get_block(head.number - required_confirmations)
-                if adjusted_head.number is None or adjusted_head.hash is None:
-                    raise ProviderError("Adjusted head block has no number or hash.")
+                parent = self.get_block(block.parent_hash)
+                if not recent:
+                    # NOTE: Deeper than the buffer; assume older blocks are unchanged.
+                    recent.append((parent.number or 0, parent.hash, parent.parent_hash))
+                    break
 
-            except Exception:
-                # TODO: I did encounter this sometimes in a re-org, needs better handling
-                # and maybe bubbling up the block number/hash exceptions above.
-                assert_chain_activity()
-                continue
+                block = parent
 
-            if adjusted_head.number == last.number and adjusted_head.hash == last.hash:
-                # The chain has not moved! Verify we have activity.
-                assert_chain_activity()
-                time.sleep(wait_time)
-                continue
+            logger.error(
+                "Chain has reorganized since returning the last block. "
+                "Try adjusting the required network confirmations."
+            )
+            fork_number, fork_hash, _ = recent[-1]
+            if on_rollback is not None:
+                on_rollback(BlockRollback(number=fork_number, hash=fork_hash, orphaned=orphaned))
 
-            elif adjusted_head.number < last.number or (
-                adjusted_head.number == last.number and adjusted_head.hash != last.hash
-            ):
-                # Re-org detected! Error and catch up the chain.
-                logger.error(
-                    "Chain has reorganized since returning the last block. "
-                    "Try adjusting the required network confirmations."
-                )
-                # Catch up the chain by setting the "next" to this tiny head.
-                next_block = adjusted_head.number
+            return new_blocks
+
+        # NOTE: When subscribed to new heads, wait for the node to push them
+        #   rather than polling for the head block.
+        heads = self._subscribe("newHeads")
+        head: BlockAPI | None = None
+
+        def get_head() -> BlockAPI:
+            if heads is None or head is None:
+                return self._get_latest_block()
+
+            try:
+                head_data = heads.get(timeout=max(timeout - (time.time() - last.time), 0))
+            except Empty:
+                raise ProviderError("Timed out waiting for next block.")
 
-                last.time = time.time()
-                # NOTE: Drop down to code outside switch-of-ifs
+            # Skip to the newest head when several arrived at once.
+            while (newer_head := heads.get_nowait()) is not None:
+                head_data = newer_head
 
-            elif adjusted_head.number < next_block:
-                # Wait for the next block.
-                # But first, let's make sure the chain is still active.
-                assert_chain_activity()
+            return self.network.ecosystem.decode_block(dict(head_data))
+
+        def wait():
+            if heads is None:
                 time.sleep(wait_time)
-                continue
 
-            # NOTE: Should only get here if yielding blocks!
-            #  Either because it is finally time or because a re-org allows us.
-            for block_idx in range(next_block, adjusted_head.number + 1):
-                block = self.get_block(block_idx)
-                if block.number is None or block.hash is None:
-                    raise ProviderError("Block has no number or hash.")
+        # Begin the daemon.
+        try:
+            while True:
+                # The next block we want is simply 1 after the last.
+                next_block = last.number + 1
+                try:
+                    head = get_head()
+                    if head.number is None or head.hash is None:
+                        raise ProviderError("Head block has no number or hash.")
+
+                    # Use an "adjusted" head, based on the required confirmations.
+                    adjusted_head = (
+                        head
+                        if required_confirmations == 0
+                        else self.get_block(head.number - required_confirmations)
+                    )
+                    if adjusted_head.number is None or adjusted_head.hash is None:
+                        raise ProviderError("Adjusted head block has no number or hash.")
+
+                except Exception as err:
+                    if heads is not None:
+                        # NOTE: Fall back to polling when the subscription fails.
+                        logger.warning(f"Subscription to new heads failed, polling instead: {err}")
+                        heads.close()
+                        heads = None
+
+                    # TODO: I did encounter this sometimes in a re-org, needs better handling
+                    # and maybe bubbling up the block number/hash exceptions above.
+                    assert_chain_activity()
+                    continue
+
+                if adjusted_head.number == last.number and adjusted_head.hash == last.hash:
+                    # The chain has not moved! Verify we have activity.
+                    assert_chain_activity()
+                    wait()
+                    continue
+
+                elif adjusted_head.number < last.number or (
+                    adjusted_head.number == last.number and adjusted_head.hash != last.hash
+                ):
+                    # Re-org detected! Roll back to where the chains fork.
+                    pending = rollback(adjusted_head)
+                    fork_number, fork_hash, _ = recent[-1]
+                    last = YieldAction(number=fork_number, hash=fork_hash, time=time.time())
+                    # NOTE: Drop down to code outside switch-of-ifs
+
+                elif adjusted_head.number < next_block:
+                    # Wait for the next block.
+                    # But first, let's make sure the chain is still active.
+                    assert_chain_activity()
+                    wait()
+                    continue
 
-                # Set the last action, used for checking timeouts and re-orgs.
-                last = YieldAction(number=block.number, hash=block.hash, time=time.time())
+                else:
+                    pending = deque()
+
+                # NOTE: Should only get here if yielding blocks!
+                #  Either because it is finally time or because a re-org allows us.
+                while pending or last.number < adjusted_head.number:
+                    block = pending.popleft() if pending else self.get_block(last.number + 1)
+                    if block.number is None or block.hash is None:
+                        raise ProviderError("Block has no number or hash.")
+
+                    elif block.parent_hash != last.hash:
+                        # Re-org detected beneath the head! Roll back to where the chains fork.
+                        pending = rollback(block)
+                        fork_number, fork_hash, _ = recent[-1]
+                        last = YieldAction(number=fork_number, hash=fork_hash, time=time.time())
+                        continue
+
+                    # Set the last action, used for checking timeouts and re-orgs.
+                    last = YieldAction(number=block.number, hash=block.hash, time=time.time())
+                    recent.append((block.number, block.hash, block.parent_hash))
 
-                yield block
+                    yield block
 
-                # This is the point at which the daemon will end,
-                # provided the user passes in a `stop_block` arg.
-                if stop_block is not None and block.number >= stop_block:
-                    return
+                    # This is the point at which the daemon will end,
+                    # provided the user passes in a `stop_block` arg.
+                    if stop_block is not None and block.number >= stop_block:
+                        return
+
+        finally:
+            if heads is not None:
+                heads.close()
 
     def poll_logs(
         self,
@@ -1118,22 +1331,74 @@ class Web3Provider(ProviderAPI, ABC):
             if stop_block <= (self._get_latest_block().number or 0):
                 raise ValueError("'stop' argument must be in the future.")
 
-        for block in self.poll_blocks(stop_block, required_confirmations, new_block_timeout):
-            if block.number is None:
-                raise ValueError("Block number cannot be None")
-
-            log_params: dict[str, Any] = {
-                "start_block": block.number,
-                "stop_block": block.number,
-                "events": events,
-            }
+        # NOTE: When subscribed to logs, they are held until their block is confirmed
+        #   and yielded by `poll_blocks()`, so no request is needed per block. Only
+        #   trusted after a confirmation, as a block's logs may arrive after its head.
+        subscription = None
+        if required_confirmations > 0:
+            subscription_filter: dict = {}
             if address is not None:
-                log_params["addresses"] = [address]
+                subscription_filter["address"] = address
             if topics is not None:
-                log_params["topic_filter"] = topics
+                subscription_filter["topics"] = topics
 
-            log_filter = LogFilter(**log_params)
-            yield from self.get_contract_logs(log_filter)
+            subscription = self._subscribe("logs", subscription_filter)
+
+        # NOTE: Blocks before the subscription started must still be requested.
+        subscribed_at = self.web3.eth.block_number if subscription else None
+        pending_logs: dict[int, list] = {}
+
+        try:
+            for block in self.poll_blocks(stop_block, required_confirmations, new_block_timeout):
+                if block.number is None:
+                    raise ValueError("Block number cannot be None")
+
+                if subscription is not None and subscribed_at is not None:
+                    try:
+                        while (log := subscription.get_nowait()) is not None:
+                            pending_logs.setdefault(log["blockNumber"], []).append(log)
+
+                    except ProviderError as err:
+                        # NOTE: Fall back to requesting the logs of each block, starting
+                        #   with this block, as its logs may not have all arrived.
+                        logger.warning(f"Subscription to logs failed, polling instead: {err}")
+                        subscription.close()
+                        subscription = None
+                        pending_logs.clear()
+
+                    else:
+                        if block.number > subscribed_at:
+                            # NOTE: Logs from orphaned blocks have a different block hash.
+                            logs = sorted(
+                                (
+                                    log
+                                    for log in pending_logs.pop(block.number, [])
+                                    if not log.get("removed") and log["blockHash"] == block.hash
+                                ),
+                                key=lambda log: log["logIndex"],
+                            )
+                            for number in [n for n in pending_logs if n < block.number]:
+                                del pending_logs[number]
+
+                            yield from self.network.ecosystem.decode_logs(logs, *events)
+                            continue
+
+                log_params: dict[str, Any] = {
+                    "start_block": block.number,
+                    "stop_block": block.number,
+                    "events": events,
+                }
+                if address is not None:
+                    log_params["addresses"] = [address]
+                if topics is not None:
+                    log_params["topic_filter"] = topics
+
+                log_filter = LogFilter(**log_params)
+                yield from self.get_contract_logs(log_filter)
+
+        finally:
+            if subscription is not None:
+                subscription.close()
 
     def block_ranges(self, start: int = 0, stop: int | None = None, page: int | None = None):
         if stop is None:
@@ -1150,21 +1415,54 @@ class Web3Provider(ProviderAPI, ABC):
         start_block = log_filter.start_block
         stop_block_arg = log_filter.stop_block if log_filter.stop_block is not None else height
         stop_block = min(stop_block_arg, height)
-        block_ranges = self.block_ranges(start_block, stop_block, self.block_page_size)
 
-        def fetch_log_page(block_range):
+        def fetch_log_page(block_range: tuple[int, int]) -> list[dict]:
             start, stop = block_range
             update = {"start_block": start, "stop_block": stop}
             page_filter = log_filter.model_copy(update=update)
 
             # NOTE: Using JSON mode since used as request data.
             filter_params = page_filter.model_dump(mode="json")
-            logs = self.make_request("eth_getLogs", [filter_params])
-            return self.network.ecosystem.decode_logs(logs, *log_filter.events)
+            return self.make_request("eth_getLogs", [filter_params])
+
+        # NOTE: Pages adapt to the results: pages that exceed the node's limits are split
+        #   in half and retried, and empty pages make the next pages larger. At most
+        #   `concurrency` pages are in-flight, and logs are yielded in block order.
+        page_size = max(self.block_page_size, 1)
+        max_page_size = page_size * _MAX_LOG_PAGE_GROWTH
+        next_block = start_block
+        pending: deque[tuple[tuple[int, int], Future]] = deque()
+        pool = ThreadPoolExecutor(max(self.concurrency, 1))
+        try:
+            while pending or next_block <= stop_block:
+                while len(pending) < max(self.concurrency, 1) and next_block <= stop_block:
+                    block_range = (next_block, min(stop_block, next_block + page_size - 1))
+                    pending.append((block_range, pool.submit(fetch_log_page, block_range)))
+                    next_block = block_range[1] + 1
+
+                block_range, future = pending.popleft()
+                try:
+                    logs = future.result()
+                except ProviderError as err:
+                    start, stop = block_range
+                    if start == stop or not _is_log_limit_error(err):
+                        raise
+
+                    middle = (start + stop) // 2
+                    logger.debug(f"Splitting log page {start}-{stop}: {err}")
+                    page_size = max(min(page_size, middle - start + 1), 1)
+                    for half in ((middle + 1, stop), (start, middle)):
+                        pending.appendleft((half, pool.submit(fetch_log_page, half)))
 
-        with ThreadPoolExecutor(self.concurrency) as pool:
-            for page in pool.map(fetch_log_page, block_ranges):
-                yield from page
+                    continue
+
+                if not logs:
+                    page_size = min(page_size * 2, max_page_size)
+
+                yield from self.network.ecosystem.decode_logs(logs, *log_filter.events)
+
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def prepare_transaction(self, txn: TransactionAPI) -> TransactionAPI:
         # NOTE: Use "expected value" for Chain ID, so if it doesn't match actual, we raise
@@ -1357,20 +1655,84 @@ class Web3Provider(ProviderAPI, ABC):
         try:
             result = self.web3.provider.make_request(RPCEndpoint(rpc), parameters)
         except HTTPError as err:
-            if "method not allowed" in str(err).lower():
-                raise APINotImplementedError(
-                    f"RPC method '{rpc}' is not implemented by this node instance."
+            self._handle_http_error(rpc, err)
+
+        return self._get_rpc_result(rpc, result)
+
+    @property
+    def supports_batch_requests(self) -> bool:
+        return self._supports_batch_requests is not False and hasattr(
+            self.web3.provider, "make_batch_request"
+        )
+
+    def make_batch_request(
+        self,
+        requests: Iterable[tuple[str, Iterable | None]],
+        raise_on_error: bool = True,
+    ) -> list[Any]:
+        rpc_requests = [(rpc, list(parameters or [])) for rpc, parameters in requests]
+        if self._supports_batch_requests is False:
+            return super().make_batch_request(rpc_requests, raise_on_error=raise_on_error)
+
+        results: list[Any] = []
+        for idx in range(0, len(rpc_requests), self.batch_size):
+            chunk = rpc_requests[idx : idx + self.batch_size]
+            responses = request_with_retry(partial(self._make_batch_request, chunk))
+            if responses is None:
+                # NOTE: Batching is not supported; make the remaining requests one by one.
+                remaining = rpc_requests[idx:]
+                return results + super().make_batch_request(
+                    remaining, raise_on_error=raise_on_error
                 )
 
-            elif err.response.status_code == 429:
-                raise  # Raise as-is so rate-limit handling picks it up.
+            for (rpc, _), response in zip(chunk, responses):
+                try:
+                    results.append(self._get_rpc_result(rpc, response))
+                except (ProviderError, APINotImplementedError) as err:
+                    if raise_on_error:
+                        raise
 
-            elif json_data := err.response.json():
-                message = json_data.get("error", json_data).get("message", json_data)
-                raise ProviderError(message) from err
+                    results.append(err)
 
-            raise ProviderError(str(err)) from err
+        return results
+
+    def _make_batch_request(self, requests: list[tuple[str, list]]) -> list[dict] | None:
+        batch = [(RPCEndpoint(rpc), parameters) for rpc, parameters in requests]
+        try:
+            responses = self.web3.provider.make_batch_request(batch)  # type: ignore[attr-defined]
+        except (AttributeError, NotImplementedError):
+            # The underlying web3 provider (e.g. EthereumTester) cannot batch.
+            self._supports_batch_requests = False
+            return None
+
+        except HTTPError as err:
+            self._handle_http_error("batch", err)
+
+        if isinstance(responses, dict):
+            # NOTE: Nodes that do not allow batches reply with a single error.
+            logger.debug(f"Batch request failed: {responses.get('error', responses)}")
+            self._supports_batch_requests = False
+            return None
+
+        self._supports_batch_requests = True
+        return cast(list[dict], responses)
+
+    def _handle_http_error(self, rpc: str, err: HTTPError) -> NoReturn:
+        if "method not allowed" in str(err).lower():
+            raise APINotImplementedError(
+                f"RPC method '{rpc}' is not implemented by this node instance."
+            )
+
+        elif err.response.status_code == 429:
+            raise err  # Raise as-is so rate-limit handling picks it up.
+
+        elif json_data := err.response.json():
+            message = json_data.get("error", json_data).get("message", json_data)
+            raise ProviderError(message) from err
 
+        raise ProviderError(str(err)) from err
+
+    def _get_rpc_result(self, rpc: str, result: Any) -> Any:
         if "error" in result:
             error = result["error"]
             message = (
@@ -1572,6 +1934,30 @@ def _get_trace_from_revert_kwargs(**kwargs) -> "TraceAPI | None":
     return trace
 
 
+def _prepare_call_dict(txn_dict: dict) -> dict:
+    # Force the usage of hex-type to support a wider-range of nodes.
+    txn_dict = copy(txn_dict)
+    if isinstance(txn_dict.get("type"), int):
+        txn_dict["type"] = to_hex(txn_dict["type"])
+
+    # Remove unnecessary values to support a wider-range of nodes.
+    txn_dict.pop("chainId", None)
+    return txn_dict
+
+
+def _get_block_request(block_id: "BlockID") -> tuple[str, list]:
+    if isinstance(block_id, str) and block_id.isnumeric():
+        block_id = int(block_id)
+
+    if isinstance(block_id, int):
+        return "eth_getBlockByNumber", [to_hex(block_id), False]
+
+    elif isinstance(block_id, bytes) or (isinstance(block_id, str) and len(block_id) == 66):
+        return "eth_getBlockByHash", [to_hex(block_id), False]
+
+    return "eth_getBlockByNumber", [block_id, False]
+
+
 class EthereumNodeProvider(Web3Provider, ABC):
     # optimal values for geth
     block_page_size: int = 5000
@@ -1769,6 +2155,319 @@ class EthereumNodeProvider(Web3Provider, ABC):
         return SimulationReport.model_validate(result)
 
 
+class AsyncWeb3Provider:
+    """
+    An asynchronous interface to a :class:`~ape_ethereum.provider.Web3Provider`.
+    All requests share one pooled ``aiohttp`` session (or a persistent websocket
+    connection when the provider only has a WebSocket URI) and results are decoded
+    the same way the synchronous provider decodes them. The synchronous API is
+    unaffected.
+
+    Usage example::
+
+        from ape_ethereum import AsyncWeb3Provider
+
+        async with AsyncWeb3Provider(chain.provider) as provider:
+            blocks = await asyncio.gather(*(provider.get_block(n) for n in range(10)))
+    """
+
+    def __init__(self, provider: Web3Provider):
+        self.sync_provider = provider
+        self._web3: AsyncWeb3 | None = None
+
+    async def __aenter__(self) -> "AsyncWeb3Provider":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.disconnect()
+
+    @property
+    def web3(self) -> AsyncWeb3:
+        """
+        The connected ``AsyncWeb3`` instance.
+        """
+        if self._web3 is None:
+            raise ProviderNotConnectedError()
+
+        return self._web3
+
+    @property
+    def is_connected(self) -> bool:
+        return self._web3 is not None
+
+    async def connect(self):
+        """
+        Open the pooled session to the provider's HTTP URI, or else its WebSocket URI.
+        """
+        if self._web3 is not None:
+            return
+
+        if http_uri := self.sync_provider.http_uri:
+            from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+            web3_provider = AsyncHTTPProvider(endpoint_uri=http_uri)
+            # NOTE: Connections are pooled and at most `concurrency` are open at once.
+            session = ClientSession(
+                connector=TCPConnector(limit=max(self.sync_provider.concurrency, 1)),
+                timeout=ClientTimeout(total=30 * 60),
+            )
+            await web3_provider.cache_async_session(session)
+            self._web3 = AsyncWeb3(web3_provider, middleware=[])
+
+        elif ws_uri := self.sync_provider.ws_uri:
+            ws_provider = WebsocketProvider(ws_uri)
+            await ws_provider.connect()
+            self._web3 = AsyncWeb3(ws_provider, middleware=[])
+
+        else:
+            raise ProviderError(
+                "This provider has no HTTP or WebSocket URI and is unable to make async requests."
+            )
+
+    async def disconnect(self):
+        """
+        Close the pooled session.
+        """
+        if self._web3 is None:
+            return
+
+        web3, self._web3 = self._web3, None
+        await web3.provider.disconnect()
+
+    async def make_request(self, rpc: str, parameters: Iterable | None = None) -> Any:
+        """
+        The asynchronous version of :meth:`~ape_ethereum.provider.Web3Provider.make_request`.
+        """
+        return await async_request_with_retry(partial(self._make_request, rpc, parameters))
+
+    async def _make_request(self, rpc: str, parameters: Iterable | None = None) -> Any:
+        from aiohttp import ClientResponseError
+
+        try:
+            result = await self.web3.provider.make_request(RPCEndpoint(rpc), list(parameters or []))
+        except ClientResponseError as err:
+            if err.status == 429:
+                raise  # Raise as-is so rate-limit handling picks it up.
+
+            elif err.status == 405:
+                raise APINotImplementedError(
+                    f"RPC method '{rpc}' is not implemented by this node instance."
+                ) from err
+
+            raise ProviderError(str(err)) from err
+
+        return self.sync_provider._get_rpc_result(rpc, result)
+
+    async def get_block(self, block_id: "BlockID") -> BlockAPI:
+        """
+        The asynchronous version of :meth:`~ape_ethereum.provider.Web3Provider.get_block`.
+        """
+        if isinstance(block_id, str) and block_id.isnumeric():
+            block_id = int(block_id)
+
+        try:
+            block_data = dict(await self.web3.eth.get_block(block_id))
+        except Exception as err:
+            raise BlockNotFoundError(block_id, reason=str(err)) from err
+
+        return self.sync_provider.network.ecosystem.decode_block(block_data)
+
+    async def send_call(
+        self,
+        txn: TransactionAPI,
+        block_id: "BlockID | None" = None,
+        state: dict | None = None,
+        **kwargs: Any,
+    ) -> HexBytes | CallResult:
+        """
+        The asynchronous version of :meth:`~ape_ethereum.provider.Web3Provider.send_call`.
+        Call traces (gas reports, coverage, and ``show_trace``) are not supported.
+        When using ``raise_on_revert=False``, a reverted call returns a
+        :class:`~ape.api.providers.CallResult` instead.
+        """
+        if block_id is not None:
+            kwargs["block_identifier"] = block_id
+
+        if state is not None:
+            kwargs["state_override"] = state
+
+        raise_on_revert = kwargs.pop("raise_on_revert", txn.raise_on_revert)
+        arguments = self.sync_provider._prepare_call(txn, **kwargs)
+        arguments[0] = _prepare_call_dict(arguments[0])
+        try:
+            result = await self.make_request("eth_call", arguments)
+        except Exception as err:
+            vm_err = self.sync_provider.get_virtual_machine_error(
+                err, contract_address=arguments[0].get("to"), set_ape_traceback=False
+            )
+            if raise_on_revert:
+                raise vm_err from err
+
+            logger.error(vm_err)
+            return (
+                CallResult.from_revert(vm_err)
+                if isinstance(vm_err, ContractLogicError)
+                else HexBytes("0x")
+            )
+
+        return HexBytes(result)
+
+    async def get_receipt(
+        self, txn_hash: str, required_confirmations: int = 0, timeout: int | None = None
+    ) -> ReceiptAPI:
+        """
+        The asynchronous version of :meth:`~ape_ethereum.provider.Web3Provider.get_receipt`.
+        Waiting for the receipt and its confirmations does not block the event loop.
+        """
+        if required_confirmations < 0:
+            raise TransactionError("Required confirmations cannot be negative.")
+
+        network = self.sync_provider.network
+        timeout = timeout if timeout is not None else network.transaction_acceptance_timeout
+        try:
+            receipt_data = dict(
+                await self.web3.eth.wait_for_transaction_receipt(
+                    HexBytes(txn_hash), timeout=timeout
+                )
+            )
+        except TimeExhausted as err:
+            raise TransactionNotFoundError(
+                transaction_hash=txn_hash, error_message=str(err)
+            ) from err
+
+        txn = dict(await self.web3.eth.get_transaction(HexStr(txn_hash)))
+        confirmed_block = to_int(receipt_data["blockNumber"]) + required_confirmations
+        while await self.web3.eth.block_number < confirmed_block:
+            await asyncio.sleep(max(network.block_time / 2, 1))
+
+        data = {"required_confirmations": required_confirmations, **txn, **receipt_data}
+        return self.sync_provider._create_receipt(**data)
+
+    async def get_contract_logs(self, log_filter: LogFilter) -> AsyncIterator[ContractLog]:
+        """
+        The asynchronous version of
+        :meth:`~ape_ethereum.provider.Web3Provider.get_contract_logs`.
+        """
+        height = await self.web3.eth.block_number
+        stop_block_arg = log_filter.stop_block if log_filter.stop_block is not None else height
+        stop_block = min(stop_block_arg, height)
+        block_ranges = list(self.sync_provider.block_ranges(log_filter.start_block, stop_block))
+        concurrency = max(self.sync_provider.concurrency, 1)
+        ecosystem = self.sync_provider.network.ecosystem
+
+        # NOTE: Fetch `concurrency` pages at a time and yield the logs in block order.
+        for idx in range(0, len(block_ranges), concurrency):
+            pages = await asyncio.gather(
+                *(
+                    self._get_log_page(log_filter, block_range)
+                    for block_range in block_ranges[idx : idx + concurrency]
+                )
+            )
+            for logs in pages:
+                for log in ecosystem.decode_logs(logs, *log_filter.events):
+                    yield log
+
+    async def _get_log_page(self, log_filter: LogFilter, block_range: tuple[int, int]) -> list:
+        start, stop = block_range
+        page_filter = log_filter.model_copy(update={"start_block": start, "stop_block": stop})
+        try:
+            # NOTE: Using JSON mode since used as request data.
+            return await self.make_request("eth_getLogs", [page_filter.model_dump(mode="json")])
+        except ProviderError as err:
+            if start == stop or not _is_log_limit_error(err):
+                raise
+
+            logger.debug(f"Splitting log page {start}-{stop}: {err}")
+
+        middle = (start + stop) // 2
+        lower, upper = await asyncio.gather(
+            self._get_log_page(log_filter, (start, middle)),
+            self._get_log_page(log_filter, (middle + 1, stop)),
+        )
+        return [*lower, *upper]
+
+
+class _Subscription:
+    """
+    An ``eth_subscribe`` subscription over a WebSocket. The subscription runs in
+    a background thread, so synchronous code can wait on its results.
+    """
+
+    def __init__(self, ws_uri: str, subscription_type: str, *params: Any):
+        self.ws_uri = ws_uri
+        self.subscription_type = subscription_type
+        self.params = params
+        self._results: Queue = Queue()
+        self._subscribed = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._task: asyncio.Task | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._error: Exception | None = None
+
+    def start(self):
+        self._thread.start()
+        if not self._subscribed.wait(timeout=_SUBSCRIBE_TIMEOUT):
+            self.close()
+            raise ProviderError(f"Timed out subscribing to '{self.subscription_type}'.")
+
+        elif self._error is not None:
+            raise ProviderError(str(self._error)) from self._error
+
+    def close(self):
+        if self._task is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass  # Already stopped.
+
+        self._thread.join(timeout=_SUBSCRIBE_TIMEOUT)
+
+    def get(self, timeout: float | None = None) -> Any:
+        """
+        Wait for the next result.
+
+        Raises:
+            ``queue.Empty``: When no result arrives in time.
+            :class:`~ape.exceptions.ProviderError`: When the subscription failed.
+        """
+        result = self._results.get(timeout=timeout)
+        if result is _SUBSCRIPTION_CLOSED:
+            self._results.put(result)  # Keep raising on later calls.
+            raise ProviderError(f"Subscription '{self.subscription_type}' closed: {self._error}")
+
+        return result
+
+    def get_nowait(self) -> Any:
+        """
+        Get the next result, or ``None`` when there are no more results yet.
+        """
+        try:
+            return self.get(timeout=0)
+        except Empty:
+            return None
+
+    def _run(self):
+        self._task = self._loop.create_task(self._subscribe())
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as err:
+            self._error = err
+        finally:
+            self._results.put(_SUBSCRIPTION_CLOSED)
+            self._subscribed.set()
+            self._loop.close()
+
+    async def _subscribe(self):
+        async with AsyncWeb3(WebsocketProvider(self.ws_uri)) as web3:
+            await web3.eth.subscribe(self.subscription_type, *self.params)
+            self._subscribed.set()
+            async for message in web3.socket.process_subscriptions():
+                self._results.put(message["result"])
+
+
 def _create_web3(
     http_uri: str | None = None,
     ipc_path: Path | None = None,
@@ -4,6 +4,7 @@ from functools import singledispatchmethod
 from ape.api.query import ContractCreation, ContractCreationQuery, QueryAPI, QueryType
 from ape.exceptions import APINotImplementedError, ProviderError, QueryEngineError
 from ape.types.address import AddressType
+from ape.utils.process import concurrent_map
 
 
 class EthereumQueryProvider(QueryAPI):
@@ -11,8 +12,12 @@ class EthereumQueryProvider(QueryAPI):
     Implements more advanced queries specific to Ethereum clients.
     """
 
-    def __init__(self):
-        self.supports_contract_creation = None  # will be set after we try for the first time
+    def __init__(self, search_width: int | None = None):
+        # NOTE: Set after trying for the first time.
+        self.supports_contract_creation: bool | None = None
+        # NOTE: The number of blocks to check at once while searching for a contract's
+        #   creation block. Defaults to the provider's concurrency.
+        self.search_width = search_width
 
     @singledispatchmethod
     def estimate_query(self, query: QueryType) -> int | None:  # type: ignore[override]
@@ -26,7 +31,9 @@ class EthereumQueryProvider(QueryAPI):
     def estimate_contract_creation_query(self, query: ContractCreationQuery) -> int | None:
         # NOTE: Extremely expensive query, involves binary search of all blocks in a chain
         #       Very loose estimate of 5s per transaction for this query.
-        if self.supports_contract_creation is False:
+        if self.chain_manager.contracts.contract_creations[query.contract]:
+            return 1
+        elif self.supports_contract_creation is False:
             return None
         return 5000
 
@@ -35,47 +42,70 @@ class EthereumQueryProvider(QueryAPI):
         self, query: ContractCreationQuery
     ) -> Iterator[ContractCreation]:
         """
-        Find when a contract was deployed using binary search and block tracing.
+        Find when a contract was deployed using a parallel k-ary search and block tracing.
+        Found creations are cached in ``chain.contracts.contract_creations``.
         """
-        # skip the search if there is still no code at address at head
-        if not self.chain_manager.get_code(query.contract):
+        if creation := self.chain_manager.contracts.contract_creations[query.contract]:
+            yield creation
             return None
 
-        def find_creation_block(lo, hi):
-            # perform a binary search to find the block when the contract was deployed.
-            # takes log2(height), doesn't work with contracts that have been reinit.
-            while hi - lo > 1:
-                mid = (lo + hi) // 2
-                code = self.chain_manager.get_code(query.contract, block_id=mid)
-                if not code:
-                    lo = mid
-                else:
-                    hi = mid
-
-            if self.chain_manager.get_code(query.contract, block_id=hi):
-                return hi
-
+        # skip the search if there is still no code at address at head
+        if not self.chain_manager.get_code(query.contract):
             return None
 
         try:
-            block = find_creation_block(0, self.chain_manager.blocks.height)
+            block = self._find_creation_block(query.contract, 0, self.chain_manager.blocks.height)
         except ProviderError:
             self.supports_contract_creation = False
             return None
 
+        if block is None:
+            return None
+
         # iterate over block transaction traces to find the deployment call
         # this method also supports contracts created by factories
         try:
             if "geth" in self.provider.client_version.lower():
-                yield from self._find_creation_in_block_via_geth(block, query.contract)
+                creations = self._find_creation_in_block_via_geth(block, query.contract)
             else:
-                yield from self._find_creation_in_block_via_parity(block, query.contract)
+                creations = self._find_creation_in_block_via_parity(block, query.contract)
+
+            for creation in creations:
+                self.chain_manager.contracts.cache_contract_creation(query.contract, creation)
+                yield creation
+
         except (ProviderError, APINotImplementedError):
             self.supports_contract_creation = False
             return None
 
         self.supports_contract_creation = True
 
+    def _find_creation_block(self, address: AddressType, lo: int, hi: int) -> int | None:
+        # Split the range into ``width + 1`` parts and check the code at each split
+        # concurrently, which takes log(height, width + 1) rounds instead of log2(height).
+        # NOTE: Doesn't work with contracts that have been re-initialized.
+        width = max(self.search_width or self.provider.concurrency, 1)
+
+        def has_code(block_id: int) -> bool:
+            return bool(self.chain_manager.get_code(address, block_id=block_id))
+
+        while hi - lo > 1:
+            probes = sorted({lo + (hi - lo) * idx // (width + 1) for idx in range(1, width + 1)})
+            probes = [probe for probe in probes if lo < probe < hi]
+            results = (
+                concurrent_map(has_code, probes, len(probes))
+                if len(probes) > 1
+                else map(has_code, probes)
+            )
+            for probe, deployed in zip(probes, results):
+                if deployed:
+                    hi = probe
+                    break
+
+                lo = probe
+
+        return hi if has_code(hi) else None
+
     def _find_creation_in_block_via_parity(self, block, contract_address):
         # NOTE requires `trace_` namespace
         traces = self.provider.make_request("trace_replayBlockTransactions", [block, ["trace"]])
@@ -5,6 +5,7 @@ import pytest
 from eth_pydantic_types import HexBytes
 
 from ape.exceptions import ChainError, ProviderError
+from ape.managers.chain import BlockTimestampIndex, ChainManager
 
 
 def test_iterate_blocks(chain_that_mined_5):
@@ -195,6 +196,51 @@ def test_poll_blocks_future(chain_that_mined_5, eth_tester_provider, owner, Poll
     assert second == third - 1
 
 
+def test_poll_blocks_rollback(mocker, chain_that_mined_5, eth_tester_provider):
+    chain = chain_that_mined_5
+    start = chain.blocks.height
+    snapshot = chain.snapshot()
+
+    def mine_fork():
+        # Replace the 2 yielded blocks with a longer chain.
+        chain.restore(snapshot)
+        chain.mine(3, deltatime=100)
+
+    steps = iter((lambda: chain.mine(2), mine_fork))
+    heads = mocker.MagicMock()
+    heads.get.side_effect = lambda timeout: (
+        next(steps)() or eth_tester_provider.web3.eth.get_block("latest")
+    )
+    heads.get_nowait.return_value = None
+    mocker.patch.object(type(eth_tester_provider), "_subscribe", return_value=heads)
+    rollbacks: list = []
+
+    poller = chain.blocks.poll_blocks(
+        stop_block=start + 3, required_confirmations=0, on_rollback=rollbacks.append
+    )
+    blocks = []
+    for block in poller:
+        blocks.append(block)
+        if len(blocks) == 2:
+            get_block = mocker.spy(type(eth_tester_provider), "get_block")
+
+    fetched = [c.args[1] for c in get_block.call_args_list]
+    assert [b.number for b in blocks] == [start + 1, start + 2, start + 1, start + 2, start + 3]
+    assert len(rollbacks) == 1
+    assert rollbacks[0].number == start
+    assert rollbacks[0].hash == chain.blocks[start].hash
+    assert rollbacks[0].orphaned == [b.hash for b in blocks[:2]]
+    assert rollbacks[0].depth == 2
+    assert [b.hash for b in blocks[2:]] == [
+        chain.blocks[n].hash for n in range(start + 1, start + 4)
+    ]
+
+    # The fork is found from the buffered blocks, so only the new blocks are fetched.
+    assert [HexBytes(b) for b in fetched if isinstance(b, bytes)] == [
+        b.hash for b in reversed(blocks[2:4])
+    ]
+
+
 @pytest.mark.parametrize("delta", range(1, 5))
 def test_find_block_at_time(chain, delta):
     for _ in range(delta):
@@ -205,3 +251,56 @@ def test_find_block_at_time(chain, delta):
         == chain.get_block_at(delta_block.timestamp)
         == delta_block
     )
+
+
+def test_get_block_at_irregular_block_times(chain):
+    for deltatime in (1, 1, 30, 1, 5, 100, 1, 2):
+        chain.mine(deltatime=deltatime)
+
+    for block in chain.blocks.range(chain.blocks.height - 8, chain.blocks.height + 1):
+        assert chain.get_block_at(block.timestamp) == block
+        # Times between blocks resolve to the next block.
+        assert chain.get_block_at(block.timestamp - 1).number in (block.number, block.number - 1)
+
+
+def test_get_block_at_uses_index(mocker, tmp_path, chain, eth_tester_provider):
+    for deltatime in (1, 30, 1, 5, 100, 1):
+        chain.mine(deltatime=deltatime)
+
+    network = eth_tester_provider.network
+    mocker.patch.object(
+        type(network), "is_dev", new_callable=mocker.PropertyMock, return_value=False
+    )
+    path = tmp_path / "block_timestamps.json"
+    key = f"{network.ecosystem.name}:{network.name}"
+    mocker.patch.object(
+        ChainManager, "_block_timestamp_indexes", {key: BlockTimestampIndex(path=path)}
+    )
+    get_block_headers = mocker.spy(type(eth_tester_provider), "get_block_headers")
+    expected = chain.blocks[-3]
+
+    assert chain.get_block_at(expected.timestamp) == expected
+    assert path.is_file()
+    # Probes only fetch block headers.
+    assert get_block_headers.call_count > 0
+
+    # The indexed blocks bound the search, so nothing is probed.
+    get_block_headers.reset_mock()
+    assert chain.get_block_at(expected.timestamp) == expected
+    assert get_block_headers.call_count == 0
+
+
+def test_block_timestamp_index(mocker):
+    mocker.patch.object(BlockTimestampIndex, "max_size", 4)
+    index = BlockTimestampIndex(timestamps={10: 100, 2: 20})
+    index.add(5, 50)
+    assert index.get_bounds(50) == ((2, 20), (5, 50))
+    assert index.get_bounds(51) == ((5, 50), (10, 100))
+    assert index.get_bounds(1) == (None, (2, 20))
+    assert index.get_bounds(101) == ((10, 100), None)
+
+    # Every other block is dropped when the index is full.
+    index.add(7, 70)
+    index.add(8, 80)
+    assert index.timestamps == {2: 20, 7: 70, 10: 100}
+    assert index.get_bounds(75) == ((7, 70), (10, 100))
@@ -0,0 +1,336 @@
+import pytest
+from eth_abi import encode
+from eth_utils import keccak
+from ethpm_types.abi import EventABI
+from hexbytes import HexBytes
+from sqlalchemy import inspect, select, text
+
+from ape.api.query import AccountTransactionQuery, BlockQuery, ContractEventQuery
+from ape.exceptions import APINotImplementedError
+from ape.types.events import ContractLog
+from ape_cache import models
+from ape_cache.query import CacheQueryProvider, ContractLogCache
+
+
+@pytest.fixture
+def cache_engine(mocker, tmp_path):
+    engine = CacheQueryProvider()
+    database_file = tmp_path / "cache.db"
+    db_engine = engine._get_engine(database_file)
+    models.Base.metadata.create_all(bind=db_engine)
+    # NOTE: The cache does not store local data, so connect it directly.
+    mocker.patch.object(
+        CacheQueryProvider,
+        "database_connection",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: db_engine.connect(),
+    )
+    yield engine
+    engine._dispose_engine(database_file)
+
+
+def test_get_engine_reuses_engine(tmp_path):
+    engine = CacheQueryProvider()
+    database_file = tmp_path / "cache.db"
+    db_engine = engine._get_engine(database_file)
+    try:
+        assert engine._get_engine(database_file) is db_engine
+        with db_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # NOTE: `1` is `NORMAL`.
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+
+    finally:
+        engine._dispose_engine(database_file)
+
+
+def test_update_cache(mocker, chain, cache_engine, eth_tester_provider):
+    chain.mine(5)
+    cache_config = cache_engine.config_manager.get_config("cache")
+    mocker.patch.object(cache_config, "batch_size", 2)
+    get_cache_data = mocker.patch.object(
+        cache_engine, "_get_cache_data", side_effect=cache_engine._get_cache_data
+    )
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=5)
+    blocks = list(eth_tester_provider.get_blocks(range(6)))
+    cache_engine.update_cache(query, iter(blocks))
+    # Inserted in batches.
+    assert get_cache_data.call_count == 3
+
+    with cache_engine.database_connection as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM blocks")).scalar() == 6
+
+    # The cache can now serve the query.
+    assert cache_engine.estimate_query(query) is not None
+
+
+def test_fixed_bytes():
+    column_type = models.FixedBytes(32)
+    value = b"\x01" * 32
+    assert column_type.process_bind_param(value, None) == value
+    assert column_type.process_bind_param(f"0x{value.hex()}", None) == value
+    assert column_type.process_result_value(value, None) == value
+
+    with pytest.raises(TypeError):
+        column_type.process_bind_param(b"\x01" * 20, None)
+
+
+def test_migrate_database(mocker, tmp_path):
+    engine = CacheQueryProvider()
+    database_file = tmp_path / "cache.db"
+    mocker.patch.object(engine, "_get_database_file", return_value=database_file)
+    block_hash = b"\x01" * 32
+    address = b"\x02" * 20
+
+    # NOTE: Create a database using the original hex string schema.
+    with engine._get_engine(database_file).begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE contract_events (id INTEGER PRIMARY KEY, event_name VARCHAR, "
+                "contract_address VARCHAR, event_arguments JSON, transaction_hash VARCHAR, "
+                "block_number INTEGER, block_hash VARCHAR, log_index INTEGER, "
+                "transaction_index INTEGER)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX ix_contract_events_contract_address "
+                "ON contract_events (contract_address)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO contract_events VALUES "
+                f"(1, 'Transfer', '{address.hex()}', '{{\"value\": 1}}', '{block_hash.hex()}', "
+                f"1, '{block_hash.hex()}', 0, 0)"
+            )
+        )
+
+    assert engine._get_schema_version(database_file) == 0
+    try:
+        engine.migrate_database("ethereum", "mainnet")
+        assert engine._get_schema_version(database_file) == models.SCHEMA_VERSION
+        with engine._get_engine(database_file).connect() as conn:
+            row = conn.execute(select(models.ContractEvents)).one()
+            assert (
+                conn.execute(text("SELECT typeof(block_hash) FROM contract_events")).scalar()
+                == "blob"
+            )
+
+    finally:
+        engine._dispose_engine(database_file)
+
+    assert row.contract_address == address
+    assert row.block_hash == block_hash
+    assert row.event_arguments == {"value": 1}
+
+
+def test_get_cached_ranges(chain, cache_engine, eth_tester_provider):
+    chain.mine(10)
+    for start_block, stop_block in ((0, 2), (3, 4), (7, 8)):
+        query = BlockQuery(columns=["number"], start_block=start_block, stop_block=stop_block)
+        blocks = eth_tester_provider.get_blocks(range(start_block, stop_block + 1))
+        cache_engine.update_cache(query, iter(blocks))
+
+    query = BlockQuery(columns=["number"], start_block=1, stop_block=10)
+    # Adjacent ranges are merged, and ranges are clipped to the query.
+    assert cache_engine.get_cached_ranges(query) == [(1, 4), (7, 8)]
+
+    blocks = list(cache_engine.perform_query(query.model_copy(update={"stop_block": 4})))
+    assert [b.number for b in blocks] == [1, 2, 3, 4]
+
+
+def test_perform_columnar_query(chain, cache_engine, eth_tester_provider):
+    chain.mine(3)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=3)
+    blocks = list(eth_tester_provider.get_blocks(range(4)))
+    cache_engine.update_cache(query, iter(blocks))
+
+    batches = list(cache_engine.perform_columnar_query(query, ["number", "hash", "difficulty"]))
+    assert len(batches) == 1
+    assert batches[0]["number"] == [0, 1, 2, 3]
+    assert batches[0]["hash"] == [b.hash for b in blocks]
+    assert batches[0]["difficulty"] == [b.difficulty for b in blocks]
+
+    # Columns that are not cached need the models.
+    with pytest.raises(APINotImplementedError):
+        cache_engine.perform_columnar_query(query, ["number", "uncles"])
+
+
+def test_account_transactions_query(chain, cache_engine, eth_tester_provider, sender, receiver):
+    start_nonce = sender.nonce
+    receipts = [sender.transfer(receiver, 1) for _ in range(3)]
+    query = AccountTransactionQuery(
+        columns=["*"],
+        account=sender.address,
+        start_nonce=start_nonce,
+        stop_nonce=start_nonce + 2,
+    )
+    assert cache_engine.estimate_query(query) is None
+
+    cache_engine.update_cache(query, iter(receipts))
+    assert cache_engine.estimate_query(query) is not None
+    actual = list(cache_engine.perform_query(query))
+    assert [r.txn_hash for r in actual] == [r.txn_hash for r in receipts]
+
+    # Only some of the transactions are indexed.
+    query = query.model_copy(update={"stop_nonce": start_nonce + 3})
+    assert cache_engine.estimate_query(query) is None
+
+
+TRANSFER = EventABI(type="event", name="Transfer", inputs=[])
+
+
+def make_log(address, block_number):
+    return ContractLog(
+        event_name="Transfer",
+        contract_address=address,
+        transaction_hash=f"0x{block_number:064x}",
+        block_number=block_number,
+        block_hash=f"0x{block_number:064x}",
+        log_index=0,
+        transaction_index=0,
+    )
+
+
+@pytest.fixture
+def log_cache(mocker, cache_engine):
+    mocker.patch.object(
+        ContractLogCache, "_enabled", new_callable=mocker.PropertyMock, return_value=True
+    )
+    mocker.patch.object(
+        ContractLogCache,
+        "database_connection",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: cache_engine.database_connection,
+    )
+    mocker.patch.object(ContractLogCache, "_ensure_database")
+    return ContractLogCache()
+
+
+def test_contract_log_cache(chain, eth_tester_provider, log_cache, owner, not_owner):
+    chain.mine(10)
+    query = ContractEventQuery(
+        columns=["*"], contract=owner.address, event=TRANSFER, start_block=0, stop_block=5
+    )
+    log_cache.update_cache(query, iter([make_log(owner.address, 2), make_log(owner.address, 4)]))
+
+    wider_query = query.model_copy(update={"stop_block": 10})
+    assert log_cache.get_cached_ranges(wider_query) == [(0, 5)]
+    assert [log.block_number for log in log_cache.perform_query(query)] == [2, 4]
+
+    # Scanning the same blocks again replaces the stored logs.
+    log_cache.update_cache(query, iter([make_log(owner.address, 2)]))
+    assert [log.block_number for log in log_cache.perform_query(query)] == [2]
+
+    # Ranges are only scanned when scanned for every address.
+    other_query = query.model_copy(update={"contract": not_owner.address, "stop_block": 3})
+    log_cache.update_cache(other_query, iter([]))
+    both_query = wider_query.model_copy(update={"contract": [owner.address, not_owner.address]})
+    assert log_cache.get_cached_ranges(both_query) == [(0, 3)]
+
+
+def test_contract_log_cache_decodes_arguments(chain, ethereum, log_cache, owner):
+    chain.mine(5)
+    event = EventABI.model_validate(
+        {
+            "type": "event",
+            "name": "Stored",
+            "inputs": [
+                {"name": "sender", "type": "address", "indexed": True},
+                {"name": "key", "type": "bytes32", "indexed": True},
+                {"name": "label", "type": "string", "indexed": True},
+                {"name": "amount", "type": "uint256", "indexed": False},
+                {"name": "selector", "type": "bytes4", "indexed": False},
+                {"name": "payload", "type": "bytes", "indexed": False},
+                {"name": "hashes", "type": "bytes32[]", "indexed": False},
+            ],
+        }
+    )
+    raw_log = {
+        "address": owner.address,
+        "topics": [
+            HexBytes(keccak(text=event.selector)),
+            HexBytes(encode(["address"], [owner.address])),
+            HexBytes(b"\x01" * 32),
+            HexBytes(keccak(text="label")),
+        ],
+        "data": HexBytes(
+            encode(
+                ["uint256", "bytes4", "bytes", "bytes32[]"],
+                [123, b"\x12\x34\x56\x78", b"\xff" * 40, [b"\x02" * 32]],
+            )
+        ),
+        "blockNumber": 2,
+        "blockHash": HexBytes(b"\x03" * 32),
+        "transactionHash": HexBytes(b"\x04" * 32),
+        "logIndex": 1,
+        "transactionIndex": 0,
+    }
+    # NOTE: The same log as decoded from an RPC result.
+    expected = next(ethereum.decode_logs([raw_log], event))
+    query = ContractEventQuery(
+        columns=["*"], contract=owner.address, event=event, start_block=0, stop_block=5
+    )
+    log_cache.update_cache(query, iter([expected]))
+
+    (actual,) = log_cache.perform_query(query)
+    assert actual.model_dump() == expected.model_dump()
+    assert {k: type(v) for k, v in actual.event_arguments.items()} == {
+        k: type(v) for k, v in expected.event_arguments.items()
+    }
+
+
+def test_contract_log_cache_creates_only_its_tables(mocker, tmp_path, eth_tester_provider):
+    database_file = tmp_path / "cache.db"
+    mocker.patch.object(CacheQueryProvider, "_get_database_file", return_value=database_file)
+    mocker.patch.object(
+        type(eth_tester_provider.network),
+        "is_local",
+        new_callable=mocker.PropertyMock,
+        return_value=False,
+    )
+    mocker.patch.object(
+        ContractLogCache, "_enabled", new_callable=mocker.PropertyMock, return_value=True
+    )
+    engine = CacheQueryProvider()
+    log_cache = ContractLogCache()
+    try:
+        log_cache._ensure_database()
+        with log_cache.database_connection as conn:
+            assert set(inspect(conn).get_table_names()) == {"contract_events", "cached_ranges"}
+
+        # The rest of the cache stays disabled until initialized.
+        assert engine.database_connection is None
+
+        engine.init_database("ethereum", "sepolia")
+        engine.database_bypass = False
+        with engine.database_connection as conn:
+            assert set(inspect(conn).get_table_names()) == set(models.Base.metadata.tables)
+
+        with pytest.raises(Exception, match="already been initialized"):
+            engine.init_database("ethereum", "sepolia")
+
+    finally:
+        engine._dispose_engine(database_file)
+
+
+def test_contract_log_cache_skips_unconfirmed_blocks(
+    mocker, chain, eth_tester_provider, log_cache, owner
+):
+    chain.mine(10)
+    height = chain.blocks.height
+    mocker.patch.object(
+        type(eth_tester_provider.network),
+        "required_confirmations",
+        new_callable=mocker.PropertyMock,
+        return_value=3,
+    )
+    query = ContractEventQuery(
+        columns=["*"], contract=owner.address, event=TRANSFER, start_block=0, stop_block=height
+    )
+    logs = [make_log(owner.address, height - 4), make_log(owner.address, height - 1)]
+    log_cache.update_cache(query, iter(logs))
+
+    assert log_cache.get_cached_ranges(query) == [(0, height - 3)]
+    assert [log.block_number for log in log_cache.perform_query(query)] == [height - 4]
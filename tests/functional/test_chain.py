@@ -206,6 +206,19 @@ def test_history_getitem_account(chain, minimal_proxy, owner):
     assert actual.address == owner.address
 
 
+def test_history_outgoing(mocker, chain, sender, receiver):
+    receipts = [sender.transfer(receiver, 1) for _ in range(3)]
+    history = chain.history[sender.address]
+    # NOTE: Leave a gap in the sessional history, so it is queried.
+    history.sessional = [r for r in history.sessional if r.txn_hash != receipts[1].txn_hash]
+    get_nonce = mocker.spy(AccountHistory, "__len__")
+
+    actual = [r.txn_hash for r in history.outgoing]
+    assert get_nonce.call_count == 1
+    assert actual[-3:] == [r.txn_hash for r in receipts]
+    assert len(actual) == len(set(actual)) == sender.nonce
+
+
 def test_history_getitem_account_ens(mocker, chain, minimal_proxy, owner):
     conversion_spy = mocker.spy(chain.history.conversion_manager, "convert")
     value = "this will not work, but would if given ens and using ape-ens"
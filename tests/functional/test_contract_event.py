@@ -487,6 +487,21 @@ def test_model_dump_hexbytes(mode):
     assert actual["transaction_hash"] == expected_hash
 
 
+def test_model_dump_json_bytes():
+    event = ContractLog(
+        block_number=123,
+        block_hash=b"\x01" * 32,
+        event_arguments={"payload": b"\x12\x34"},
+        event_name="MyEvent",
+        log_index=0,
+        transaction_hash=b"\x02" * 32,
+    )
+    actual = event.model_dump(mode="json")
+    assert actual["event_arguments"] == {"payload": "0x1234"}
+    assert actual["block_hash"] == f"0x{'01' * 32}"
+    assert actual["transaction_hash"] == f"0x{'02' * 32}"
+
+
 def test_model_dump_json():
     # NOTE: There was an issue when using HexBytes for Any.
     event_arguments = {"key": 123, "validators": [HexBytes(123)]}
@@ -3,9 +3,12 @@ from ethpm_types import ContractType
 
 from ape import Contract
 from ape.contracts import ContractInstance
-from ape.exceptions import ContractNotFoundError, ConversionError
+from ape.exceptions import ContractNotFoundError, ConversionError, ProviderError
 from ape.logging import LogLevel, logger
-from ape.managers._contractscache import _merge_contract_types
+from ape.managers import _contractscache
+from ape.managers._contractscache import ApeDataCache, _merge_contract_types
+from ape.utils.os import CacheDatabase, CacheDirectory
+from ape.utils.rpc import RateLimiter
 from ape_ethereum.proxies import ProxyInfo, ProxyType, _make_minimal_proxy
 from tests.conftest import explorer_test, skip_if_plugin_installed
 
@@ -414,6 +417,73 @@ def test_get_multiple_attempts_to_convert(chain):
         chain.contracts.get_multiple(("test.eth",))
 
 
+def test_get_multiple_reports_partial_failures(chain, owner, not_owner, ape_caplog, mocker):
+    contract_type = ContractType(contractName="Fake", abi=[])
+
+    def get(address, **kwargs):
+        if address == owner.address:
+            raise ProviderError("nope")
+
+        return contract_type
+
+    mock_get = mocker.patch.object(type(chain.contracts), "get", side_effect=get)
+    with ape_caplog.at_level(LogLevel.DEBUG):
+        actual = chain.contracts.get_multiple((owner.address, not_owner.address))
+        assert "Failed to get contract types for 1 of 2 addresses." in ape_caplog.messages
+        assert f"Failed to get contract type for '{owner.address}': nope" in ape_caplog.head
+
+    assert actual == {not_owner.address: contract_type}
+
+    # Other errors, such as programming errors, are not swallowed.
+    mock_get.side_effect = ValueError("bug")
+    with pytest.raises(ValueError, match="bug"):
+        chain.contracts.get_multiple((owner.address,))
+
+
+def test_get_multiple_reports_proxy_detection_failures(
+    chain, owner, not_owner, ethereum, ape_caplog, mocker
+):
+    contract_type = ContractType(contractName="Fake", abi=[])
+    mocker.patch.object(type(chain.contracts), "get", return_value=contract_type)
+    get_proxy_infos = mocker.patch.object(type(ethereum), "get_proxy_infos")
+    get_proxy_infos.return_value = {owner.address: ProviderError("nope"), not_owner.address: None}
+
+    # One address failing proxy detection does not fail the others.
+    actual = chain.contracts.get_multiple((owner.address, not_owner.address))
+    assert actual == {not_owner.address: contract_type}
+    assert "Failed to get contract types for 1 of 2 addresses." in ape_caplog.head
+    assert get_proxy_infos.call_args.kwargs == {"raise_on_error": False}
+
+
+@explorer_test
+def test_get_multiple_explorer_rate_limit(
+    mock_explorer, create_mock_sepolia, chain, owner, minimal_proxy_container, mocker
+):
+    contracts = [owner.deploy(minimal_proxy_container) for _ in range(2)]
+    addresses = [contract.address for contract in contracts]
+    acquire = mocker.spy(RateLimiter, "acquire")
+
+    with create_mock_sepolia() as network:
+        for address in addresses:
+            del chain.contracts[address]
+
+        mock_explorer.get_contract_type.side_effect = lambda addr: contracts[0].contract_type
+        network.__dict__["explorer"] = mock_explorer
+        try:
+            actual = chain.contracts.get_multiple(addresses, explorer_rate_limit=100)
+            assert set(actual) == set(addresses)
+            assert acquire.call_count == mock_explorer.get_contract_type.call_count > 0
+
+            # The rate-limit only applies to the call it was given to.
+            acquire.reset_mock()
+            del chain.contracts[addresses[0]]
+            chain.contracts.get(addresses[0])
+            assert acquire.call_count == 0
+        finally:
+            network.__dict__["explorer"] = None
+            mock_explorer.get_contract_type.reset_mock()
+
+
 def test_get_non_contract_address(chain, owner):
     actual = chain.contracts.get(owner.address)
     assert actual is None
@@ -677,3 +747,197 @@ def test_clear_local_caches(chain, vyper_contract_instance, project, owner):
     assert chain.contracts.blueprints.memory == {}
     assert chain.contracts.contract_types.memory == {}
     assert chain.contracts.contract_creations.memory == {}
+
+
+def test_data_cache_database_storage(tmp_path):
+    contract_type = ContractType(contractName="Foo", abi=[])
+
+    def create_cache():
+        storage = CacheDatabase(tmp_path / "data.db", "contract_types")
+        return ApeDataCache(
+            tmp_path, "ethereum", "sepolia", "contract_types", ContractType, storage=storage
+        )
+
+    address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    create_cache()[address] = contract_type
+
+    # Stored in the database instead of a JSON file.
+    cache = create_cache()
+    assert not cache.get_file(address).is_file()
+    assert cache.get_types([address, "0x5FbDB2315678afecb367f032d93F642f64180aa3"]) == {
+        address: contract_type
+    }
+
+
+def test_data_cache_memory_bounds(tmp_path):
+    cache = ApeDataCache(
+        tmp_path, "ethereum", "sepolia", "contract_types", ContractType, max_entries=2
+    )
+    addresses = [f"0x{idx:040x}" for idx in range(3)]
+    for idx, address in enumerate(addresses):
+        cache[address] = ContractType(contractName=f"Contract{idx}", abi=[])
+
+    # The least-recently used contract type is evicted from memory.
+    assert list(cache.memory) == addresses[1:]
+    assert cache.memory_stats.evictions == 1
+
+    # But it is still cached on disk.
+    assert cache[addresses[0]].name == "Contract0"
+    stats = cache.memory_stats
+    assert stats.entries == 2
+    assert stats.misses == 1
+    assert stats.evictions == 2
+
+    assert cache[addresses[0]].name == "Contract0"
+    assert cache.memory_stats.hits == 1
+
+
+def test_data_cache_memory_bounds_bytes(tmp_path):
+    contract_type = ContractType(contractName="Contract", abi=[])
+    max_bytes = 2 * len(contract_type.model_dump_json(by_alias=True))
+    cache = ApeDataCache(
+        tmp_path, "ethereum", "sepolia", "contract_types", ContractType, max_bytes=max_bytes
+    )
+    for idx in range(3):
+        cache[f"0x{idx:040x}"] = contract_type
+
+    assert cache.memory_stats.entries == 2
+    assert cache.memory_stats.size == max_bytes
+
+
+def test_data_cache_memory_bounds_bytes_measures_shared_models_once(tmp_path, mocker):
+    contract_type = ContractType(contractName="Clone", abi=[])
+    size = len(contract_type.model_dump_json(by_alias=True))
+    cache = ApeDataCache(
+        tmp_path, "ethereum", "sepolia", "contract_types", ContractType, max_bytes=10 * size
+    )
+    dump = mocker.spy(ContractType, "model_dump_json")
+    for idx in range(3):
+        cache[f"0x{idx:040x}"] = contract_type
+
+    assert dump.call_count == 1
+    assert cache.memory_stats.size == 3 * size
+
+    cache.memory.clear()
+    assert cache.memory_stats.size == 0
+
+
+def test_data_cache_memory_not_bounded_when_not_on_disk(tmp_path):
+    # Local data is not written to disk, so evicting it would lose it.
+    cache = ApeDataCache(
+        tmp_path, "ethereum", "local", "contract_types", ContractType, max_entries=1
+    )
+    for idx in range(3):
+        cache[f"0x{idx:040x}"] = ContractType(contractName=f"Contract{idx}", abi=[])
+
+    assert cache.memory_stats.entries == 3
+    assert cache.memory_stats.evictions == 0
+
+
+def test_data_cache_does_not_dump_when_not_on_disk(tmp_path, mocker):
+    cache = ApeDataCache(tmp_path, "ethereum", "local", "contract_types", ContractType)
+    dump = mocker.spy(ContractType, "model_dump")
+    cache["0x274b028b03A250cA03644E6c578D81f019eE1323"] = ContractType(contractName="Foo", abi=[])
+    assert dump.call_count == 0
+
+
+def test_memory_stats(chain, owner, minimal_proxy_container):
+    contract = owner.deploy(minimal_proxy_container)
+    _ = chain.contracts[contract.address]
+    stats = chain.contracts.memory_stats
+    assert set(stats) == {"contract_types", "proxy_infos", "blueprints", "contract_creations"}
+    assert stats["contract_types"].entries > 0
+    assert stats["contract_types"].hits > 0
+
+
+def test_data_cache_deduplicate(tmp_path):
+    def create_cache(deduplicate: bool = True):
+        return ApeDataCache(
+            tmp_path,
+            "ethereum",
+            "sepolia",
+            "contract_types",
+            ContractType,
+            content_storage=CacheDirectory(tmp_path / "contract_types_contents"),
+            deduplicate=deduplicate,
+        )
+
+    addresses = [f"0x{idx:040x}" for idx in range(3)]
+    cache = create_cache()
+    for address in addresses:
+        # Equal, but separate, objects (e.g. clones of the same contract).
+        cache[address] = ContractType(contractName="Clone", abi=[])
+
+    # Shared as a single object in memory.
+    assert len({id(cache[address]) for address in addresses}) == 1
+
+    # Stored once on disk, with each address referencing it.
+    content_ids = {cache.get_data(address)["content_id"] for address in addresses}
+    assert len(content_ids) == 1
+    assert len(list((tmp_path / "contract_types_contents").iterdir())) == 1
+
+    # Also shared when read from disk again, even when not deduplicating new data.
+    actual = create_cache(deduplicate=False).get_types(addresses)
+    assert len({id(contract_type) for contract_type in actual.values()}) == 1
+    assert actual[addresses[0]].name == "Clone"
+
+
+def test_data_cache_hashes_only_when_deduplicating(tmp_path, mocker):
+    get_content_id = mocker.spy(_contractscache, "_get_content_id")
+    contents = CacheDirectory(tmp_path / "contract_types_contents")
+    cache = ApeDataCache(
+        tmp_path, "ethereum", "sepolia", "contract_types", ContractType, content_storage=contents
+    )
+    address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    cache[address] = ContractType(contractName="Foo", abi=[])
+    assert cache.get_types([address])[address].name == "Foo"
+    assert get_content_id.call_count == 0
+    assert not list(contents.keys())
+
+
+def test_data_cache_does_not_rewrite_stored_contents(tmp_path, mocker):
+    contents = CacheDirectory(tmp_path / "contract_types_contents")
+
+    def create_cache():
+        return ApeDataCache(
+            tmp_path,
+            "ethereum",
+            "sepolia",
+            "contract_types",
+            ContractType,
+            content_storage=contents,
+            deduplicate=True,
+        )
+
+    create_cache()["0x274b028b03A250cA03644E6c578D81f019eE1323"] = ContractType(
+        contractName="Clone", abi=[]
+    )
+
+    # A new process (cache) finds the content already stored.
+    cache_data = mocker.spy(CacheDirectory, "cache_data")
+    create_cache()["0x5FbDB2315678afecb367f032d93F642f64180aa3"] = ContractType(
+        contractName="Clone", abi=[]
+    )
+    assert all(call.args[0] is not contents for call in cache_data.call_args_list)
+
+
+def test_data_cache_prune_contents(tmp_path):
+    cache = ApeDataCache(
+        tmp_path,
+        "ethereum",
+        "sepolia",
+        "contract_types",
+        ContractType,
+        content_storage=CacheDirectory(tmp_path / "contract_types_contents"),
+        deduplicate=True,
+    )
+    addresses = [f"0x{idx:040x}" for idx in range(2)]
+    cache[addresses[0]] = ContractType(contractName="Foo", abi=[])
+    cache[addresses[1]] = ContractType(contractName="Bar", abi=[])
+
+    # Replacing a contract type leaves its previous content behind.
+    cache[addresses[1]] = ContractType(contractName="Foo", abi=[])
+    assert cache.prune_contents() == 1
+    assert cache.prune_contents() == 0
+    assert cache.get_types(addresses, fetch_from_disk=True)[addresses[1]].name == "Foo"
+    assert len(list((tmp_path / "contract_types_contents").iterdir())) == 1
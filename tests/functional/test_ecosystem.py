@@ -10,7 +10,13 @@ from ethpm_types.abi import ABIType, EventABI, MethodABI
 from evm_trace import CallTreeNode, CallType
 
 from ape.api.networks import ForkedNetworkAPI, NetworkAPI
-from ape.exceptions import CustomError, DecodingError, NetworkError, NetworkNotFoundError
+from ape.exceptions import (
+    APINotImplementedError,
+    CustomError,
+    DecodingError,
+    NetworkError,
+    NetworkNotFoundError,
+)
 from ape.types.address import AddressType
 from ape.types.gas import AutoGasLimit
 from ape.types.units import CurrencyValueComparable
@@ -456,6 +462,31 @@ def test_decode_block_with_hex_values(ethereum):
     assert actual.difficulty == 0
 
 
+def test_decode_block_columns(ethereum):
+    headers = [
+        {
+            "number": "0x11234df",
+            "hash": "0x925cac44d8bac5df3e3eeed6379b3924d6769a054b3c4079899c1d9b442a4041",
+            "timestamp": "0x64e4b0cb",
+            "gasUsed": "0x91b5e5",
+            "transactions": ["0x01", "0x02"],
+        }
+    ]
+    columns = ["number", "hash", "timestamp", "gas_used", "base_fee", "num_transactions"]
+    actual = ethereum.decode_block_columns(headers, columns)
+    assert actual == {
+        "number": [17970399],
+        "hash": [HexBytes(headers[0]["hash"])],
+        "timestamp": [1692709067],
+        "gas_used": [9549285],
+        "base_fee": [0],
+        "num_transactions": [2],
+    }
+
+    with pytest.raises(APINotImplementedError):
+        ethereum.decode_block_columns(headers, ["number", "uncles"])
+
+
 def test_decode_logs_topics_not_first(ethereum):
     """
     Tests against a condition where we could not decode logs if the
@@ -4,10 +4,13 @@ import pytest
 from eth_pydantic_types import HexBytes
 from ethpm_types import ContractType
 
-from ape.exceptions import APINotImplementedError
+from ape.contracts.base import ContractCall, ContractCallHandler, ContractInstance
+from ape.exceptions import APINotImplementedError, ContractLogicError, ProviderError
+from ape.utils.misc import ZERO_ADDRESS
 from ape_ethereum.multicall import Call
 from ape_ethereum.multicall.constants import MULTICALL3_ADDRESS, MULTICALL3_CONTRACT_TYPE
 from ape_ethereum.multicall.exceptions import UnsupportedChainError
+from ape_ethereum.multicall.handlers import _CALL_SIZE_ERROR_PATTERN
 
 RETURNDATA = HexBytes("0x4a821464")
 
@@ -17,6 +20,18 @@ class ReturnData(NamedTuple):
     returnData: bytes
 
 
+BALANCE_CONTRACT_TYPE = {
+    "abi": [
+        {
+            "type": "function",
+            "name": "balanceOf",
+            "stateMutability": "view",
+            "inputs": [{"name": "owner", "type": "address"}],
+            "outputs": [{"name": "", "type": "uint256"}],
+        }
+    ]
+}
+
 RETURNDATA_PARAMS = {
     "result_ok": (ReturnData(True, RETURNDATA), RETURNDATA),
     "result_fail": (ReturnData(False, RETURNDATA), None),
@@ -74,3 +89,147 @@ def test_returndata(returndata_key):
     call = Call()
     call._result = [result]  # type: ignore
     assert call.returnData[0] == output
+
+
+@pytest.fixture
+def fake_calls(mocker):
+    call = Call(max_calldata_size=2 * (224 + 4))
+    call.calls = [
+        {"target": MULTICALL3_ADDRESS, "allowFailure": True, "value": 0, "callData": RETURNDATA}
+        for _ in range(5)
+    ]
+    handled = []
+
+    def handler(calls, **kwargs):
+        handled.append(len(calls))
+        if len(calls) > 1 and any(c.get("tooLarge") for c in calls):
+            raise ProviderError("out of gas")
+
+        return [ReturnData(True, c["callData"]) for c in calls]
+
+    mocker.patch.object(Call, "handler", new_callable=mocker.PropertyMock, return_value=handler)
+    return call, handled
+
+
+def test_call_chunks(fake_calls):
+    call, handled = fake_calls
+    for idx, data in enumerate(call.calls):
+        data["callData"] = HexBytes(idx.to_bytes(4, "big"))
+
+    call()
+
+    # Calls are split by size and results are still in order.
+    assert handled == [2, 2, 1]
+    assert call.returnData == [HexBytes(idx.to_bytes(4, "big")) for idx in range(5)]
+
+
+def test_call_chunks_split_on_size_errors(fake_calls):
+    call, handled = fake_calls
+    call.max_calldata_size = 1_000_000
+    call.calls[3]["tooLarge"] = True
+
+    call()
+
+    assert handled == [5, 2, 3, 1, 2, 1, 1]
+    assert len(call.returnData) == 5
+
+
+@pytest.fixture
+def batched_calls(mocker):
+    mocker.patch.object(
+        ContractInstance, "is_contract", new_callable=mocker.PropertyMock, return_value=True
+    )
+    handled = []
+
+    def handler(calls, **kwargs):
+        handled.append((len(calls), kwargs))
+        return [ReturnData(c["target"] != ZERO_ADDRESS, (123).to_bytes(32, "big")) for c in calls]
+
+    mocker.patch.object(Call, "handler", new_callable=mocker.PropertyMock, return_value=handler)
+    return handled
+
+
+@pytest.fixture
+def balance_of():
+    def get_handler(address):
+        contract = ContractInstance(address, ContractType.model_validate(BALANCE_CONTRACT_TYPE))
+        return ContractCallHandler(contract, contract.contract_type.view_methods)
+
+    return get_handler
+
+
+def test_batch_calls(chain, owner, batched_calls, balance_of):
+    get_balance = balance_of(MULTICALL3_ADDRESS)
+    with chain.batch_calls():
+        latest = [get_balance(owner) for _ in range(3)]
+        earliest = get_balance(owner, block_identifier=0)
+        assert not earliest.done()
+
+    # One multicall per block identifier.
+    assert batched_calls == [(3, {}), (1, {"block_identifier": 0})]
+    assert [future.result() for future in latest] == [123, 123, 123]
+    assert earliest.result() == 123
+
+
+def test_batch_calls_result_flushes(chain, owner, batched_calls, balance_of):
+    get_balance = balance_of(MULTICALL3_ADDRESS)
+    with chain.batch_calls():
+        assert get_balance(owner).result() == 123
+        assert batched_calls == [(1, {})]
+
+    # Nothing left to flush on exit.
+    assert batched_calls == [(1, {})]
+
+
+def test_batch_calls_failed_call(mocker, chain, owner, batched_calls, balance_of):
+    mocker.patch.object(ContractCall, "__call__", side_effect=ContractLogicError("nope"))
+    failing = balance_of(ZERO_ADDRESS)
+    with chain.batch_calls():
+        future = failing(owner)
+
+    # Failed calls are performed on their own, so they raise as usual.
+    with pytest.raises(ContractLogicError, match="nope"):
+        future.result()
+
+
+def test_batch_calls_failed_group(mocker, chain, owner, batched_calls, balance_of):
+    handler = Call.handler  # The fake handler of `batched_calls`.
+
+    def fail_latest(calls, **kwargs):
+        if "block_identifier" not in kwargs:
+            raise ProviderError("node down")
+
+        return handler(calls, **kwargs)
+
+    mocker.patch.object(Call, "handler", new_callable=mocker.PropertyMock, return_value=fail_latest)
+    get_balance = balance_of(MULTICALL3_ADDRESS)
+    with pytest.raises(ProviderError, match="node down"):
+        with chain.batch_calls():
+            latest = get_balance(owner)
+            earliest = get_balance(owner, block_identifier=0)
+
+    # The other groups are still performed and no future is left pending.
+    assert latest.done()
+    with pytest.raises(ProviderError, match="node down"):
+        latest.result()
+
+    assert earliest.result() == 123
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        ("out of gas", True),
+        ("gas required exceeds allowance (50000000)", True),
+        ("transaction exceeds block gas limit", True),
+        ("response size exceeded", True),
+        ("413 Request Entity Too Large", True),
+        ("request exceeds the maximum payload size", True),
+        ("request exceeds max payload size", True),
+        ("execution reverted: amount exceeds balance", False),
+        ("rate limit exceeded", False),
+        ("request timeout", False),
+    ],
+)
+def test_call_size_error_pattern(message, expected):
+    assert bool(_CALL_SIZE_ERROR_PATTERN.search(message)) is expected
@@ -1,4 +1,6 @@
+import asyncio
 from pathlib import Path
+from queue import Empty
 from unittest import mock
 
 import pytest
@@ -22,11 +24,14 @@ from ape.exceptions import (
     UnknownSnapshotError,
 )
 from ape.types.events import LogFilter
+from ape.utils.misc import to_int
 from ape.utils.testing import DEFAULT_TEST_CHAIN_ID
 from ape_ethereum.provider import (
+    AsyncWeb3Provider,
     EthereumNodeProvider,
     Web3Provider,
     _get_trace_from_revert_kwargs,
+    _is_log_limit_error,
     _sanitize_web3_url,
 )
 from ape_ethereum.trace import TransactionTrace
@@ -314,6 +319,74 @@ def test_get_contract_logs_single_log_unmatched(
     assert len(logs) == 0
 
 
+@pytest.fixture
+def log_pages(mocker, chain, ethereum, eth_tester_provider):
+    chain.mine(40)
+    mocker.patch.object(eth_tester_provider, "block_page_size", 8)
+    mocker.patch.object(eth_tester_provider, "concurrency", 2)
+    mocker.patch.object(type(ethereum), "decode_logs", side_effect=lambda logs, *events: logs)
+    pages = []
+
+    def get_logs(rpc, parameters):
+        start = int(parameters[0]["fromBlock"], 16)
+        stop = int(parameters[0]["toBlock"], 16)
+        pages.append((start, stop))
+        logs = [block for block in range(start, stop + 1) if 8 <= block < 16]
+        if len(logs) > 2:
+            raise ProviderError("query returned more than 2 results")
+
+        return logs
+
+    mocker.patch.object(type(eth_tester_provider), "make_request", side_effect=get_logs)
+    return pages
+
+
+def test_get_contract_logs_splits_pages(eth_tester_provider, log_pages):
+    log_filter = LogFilter(start_block=0, stop_block=23)
+    logs = list(Web3Provider.get_contract_logs(eth_tester_provider, log_filter))
+
+    # The page with too many results is split, and logs are still in block order.
+    assert logs == list(range(8, 16))
+    assert (8, 15) in log_pages
+    assert (8, 11) in log_pages
+    assert (8, 9) in log_pages
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        ("query returned more than 10000 results", True),
+        ("Log response size exceeded. You can make requests with up to a 2K block range", True),
+        ("Query exceeds max results 10000", True),
+        ("exceed maximum block range: 50000", True),
+        ("block range is too wide", True),
+        ("eth_getLogs is limited to a 10,000 range", True),
+        ("Too many requests, rate limit exceeded", False),
+        ("429 Client Error: Too Many Requests", False),
+        ("invalid block range params", False),
+        ("execution reverted", False),
+    ],
+)
+def test_is_log_limit_error(message, expected):
+    assert _is_log_limit_error(ProviderError(message)) is expected
+
+
+def test_get_contract_logs_grows_empty_pages(eth_tester_provider, log_pages):
+    log_filter = LogFilter(start_block=16, stop_block=40)
+    assert list(Web3Provider.get_contract_logs(eth_tester_provider, log_filter)) == []
+    assert log_pages[0] == (16, 23)
+    # Pages grow after empty results.
+    assert any(stop - start + 1 > 8 for start, stop in log_pages)
+
+
+def test_get_contract_logs_raises_other_errors(mocker, eth_tester_provider, log_pages):
+    error = ProviderError("bad")
+    mocker.patch.object(type(eth_tester_provider), "make_request", side_effect=error)
+    with pytest.raises(ProviderError, match="bad"):
+        log_filter = LogFilter(start_block=0, stop_block=23)
+        list(Web3Provider.get_contract_logs(eth_tester_provider, log_filter))
+
+
 def test_supports_tracing(eth_tester_provider):
     assert not eth_tester_provider.supports_tracing
 
@@ -575,6 +648,121 @@ def test_make_request_rate_limiting(mocker, ethereum, mock_web3):
     assert result == {"success": True}
 
 
+def test_make_batch_request(eth_tester_provider):
+    actual = eth_tester_provider.make_batch_request(
+        [("eth_chainId", []), ("eth_blockNumber", None)]
+    )
+    assert actual == [eth_tester_provider.chain_id, eth_tester_provider.get_block("latest").number]
+
+
+def test_make_batch_request_error(eth_tester_provider):
+    requests = [("eth_chainId", []), ("ape_thisDoesNotExist", [])]
+    with pytest.raises(APINotImplementedError):
+        eth_tester_provider.make_batch_request(requests)
+
+    chain_id, error = eth_tester_provider.make_batch_request(requests, raise_on_error=False)
+    assert chain_id == eth_tester_provider.chain_id
+    assert isinstance(error, APINotImplementedError)
+
+
+def test_make_batch_request_uses_json_rpc_batches(mocker, ethereum, mock_web3):
+    provider = EthereumNodeProvider(network=ethereum.local, batch_size=2)
+    provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.side_effect = lambda batch: [
+        {"error": {"message": "Method not found"}}
+        if rpc == "ape_thisDoesNotExist"
+        else {"result": f"{rpc}_result"}
+        for rpc, _ in batch
+    ]
+    requests = [("eth_chainId", []), ("ape_thisDoesNotExist", []), ("eth_blockNumber", [])]
+    actual = provider.make_batch_request(requests, raise_on_error=False)
+
+    # Sent as two batches because of the batch size.
+    assert mock_web3.provider.make_batch_request.call_count == 2
+    assert mock_web3.provider.make_request.call_count == 0
+    assert actual[0] == "eth_chainId_result"
+    assert isinstance(actual[1], APINotImplementedError)
+    assert actual[2] == "eth_blockNumber_result"
+
+
+def test_make_batch_request_batches_not_allowed(mocker, ethereum, mock_web3):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.return_value = {
+        "error": {"message": "Batch requests are not supported"}
+    }
+    mock_web3.provider.make_request.side_effect = lambda rpc, params: {"result": rpc}
+    actual = provider.make_batch_request([("eth_chainId", []), ("eth_blockNumber", [])])
+    assert actual == ["eth_chainId", "eth_blockNumber"]
+    assert provider._supports_batch_requests is False
+
+    # Does not attempt to batch again.
+    provider.make_batch_request([("eth_chainId", [])])
+    assert mock_web3.provider.make_batch_request.call_count == 1
+
+
+def test_batch_requests(eth_tester_provider):
+    with eth_tester_provider.batch_requests() as batch:
+        chain_id = batch.add("eth_chainId")
+        error = batch.add("ape_thisDoesNotExist")
+        assert not chain_id.done
+        assert len(batch) == 2
+
+    assert chain_id.result == eth_tester_provider.chain_id
+    with pytest.raises(APINotImplementedError):
+        _ = error.result
+
+
+def test_batch_requests_result_before_flush(eth_tester_provider):
+    batch = eth_tester_provider.batch_requests()
+    chain_id = batch.add("eth_chainId")
+    with pytest.raises(ProviderError, match="Batch request 'eth_chainId' has not been sent."):
+        _ = chain_id.result
+
+    batch.flush()
+    assert chain_id.result == eth_tester_provider.chain_id
+
+
+def test_get_storages(eth_tester_provider, owner):
+    actual = eth_tester_provider.get_storages(owner.address, [0, 1])
+    assert actual == [HexBytes(0).rjust(32, b"\x00")] * 2
+
+
+def test_get_storages_uses_json_rpc_batches(ethereum, mock_web3, owner):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.side_effect = lambda batch: [
+        {"result": to_hex(int(params[1], 16).to_bytes(32, "big"))} for _, params in batch
+    ]
+    actual = provider.get_storages(owner.address, [1, 2])
+    assert actual == [HexBytes(1).rjust(32, b"\x00"), HexBytes(2).rjust(32, b"\x00")]
+    assert mock_web3.provider.make_batch_request.call_count == 1
+
+
+def test_get_blocks(eth_tester_provider):
+    eth_tester_provider.mine(3)
+    head = eth_tester_provider.get_block("latest")
+    actual = list(eth_tester_provider.get_blocks([0, head.number, head.hash]))
+    assert [b.number for b in actual] == [0, head.number, head.number]
+
+
+def test_get_blocks_not_found(eth_tester_provider):
+    with pytest.raises(BlockNotFoundError):
+        list(eth_tester_provider.get_blocks([0, 100_000_000]))
+
+
+def test_get_block_headers(eth_tester_provider):
+    eth_tester_provider.mine(3)
+    head = eth_tester_provider.get_block("latest")
+    # NOTE: The test provider can't batch, so the requests are made one by one.
+    actual = list(eth_tester_provider.get_block_headers([0, head.number]))
+    assert [to_int(h["number"]) for h in actual] == [0, head.number]
+    assert to_int(actual[1]["timestamp"]) == head.timestamp
+
+    with pytest.raises(BlockNotFoundError):
+        list(eth_tester_provider.get_block_headers([100_000_000]))
+
+
 def test_base_fee(eth_tester_provider):
     actual = eth_tester_provider.base_fee
     assert actual >= eth_tester_provider.get_block("pending").base_fee
@@ -862,3 +1050,304 @@ def test_get_trace_from_revert_kwargs(ethereum, owner, chain):
     receipt = owner.call(txn)
     actual = _get_trace_from_revert_kwargs(txn=receipt)
     assert actual == receipt.trace
+
+
+def test_get_transactions_by_account_nonce(eth_tester_provider, sender, receiver):
+    start_nonce = sender.nonce
+    receipts = [sender.transfer(receiver, 1) for _ in range(3)]
+    chain = eth_tester_provider.chain_manager
+    chain.mine(2)
+    receipts.append(sender.transfer(receiver, 1))
+    spy = mock.patch.object(
+        eth_tester_provider.web3.eth,
+        "get_transaction_count",
+        wraps=eth_tester_provider.web3.eth.get_transaction_count,
+    )
+
+    with spy as get_transaction_count:
+        actual = eth_tester_provider.get_transactions_by_account_nonce(
+            sender.address, start_nonce, start_nonce + 3
+        )
+        assert [r.txn_hash for r in actual] == [r.txn_hash for r in receipts]
+        assert get_transaction_count.call_count > 0
+
+
+@pytest.fixture
+def async_provider(eth_tester_provider):
+    from web3 import AsyncWeb3
+    from web3.providers.eth_tester import AsyncEthereumTesterProvider
+
+    # NOTE: Share the chain of the synchronous provider.
+    tester = AsyncEthereumTesterProvider()
+    tester.ethereum_tester = eth_tester_provider.web3.provider.ethereum_tester
+    tester.api_endpoints = eth_tester_provider.web3.provider.api_endpoints
+    provider = AsyncWeb3Provider(eth_tester_provider)
+    provider._web3 = AsyncWeb3(tester)
+    return provider
+
+
+def test_async_provider_get_block(chain, async_provider):
+    chain.mine(2)
+
+    async def get_blocks():
+        return await asyncio.gather(async_provider.get_block(0), async_provider.get_block("latest"))
+
+    first, latest = asyncio.run(get_blocks())
+    assert first == chain.blocks[0]
+    assert latest == chain.blocks.head
+
+
+def test_async_provider_get_block_not_found(async_provider):
+    with pytest.raises(BlockNotFoundError):
+        asyncio.run(async_provider.get_block(1_000_000))
+
+
+def test_async_provider_get_receipt(async_provider, sender, receiver):
+    receipt = sender.transfer(receiver, 1)
+    actual = asyncio.run(async_provider.get_receipt(receipt.txn_hash))
+    assert actual.txn_hash == receipt.txn_hash
+    assert actual.block_number == receipt.block_number
+    assert actual.sender == sender.address
+
+
+def test_async_provider_send_call(mocker, ethereum, async_provider, receiver):
+    make_request = mocker.patch.object(AsyncWeb3Provider, "make_request", return_value="0x1234")
+    txn = ethereum.create_transaction(receiver=receiver.address, data="0x", chain_id=1337)
+    assert asyncio.run(async_provider.send_call(txn, block_id=1)) == HexBytes("0x1234")
+
+    rpc, arguments = make_request.call_args[0]
+    assert rpc == "eth_call"
+    assert arguments[0]["to"] == receiver.address
+    assert "chainId" not in arguments[0]
+    assert arguments[1] == "0x1"
+
+
+def test_async_provider_send_call_no_raise(mocker, ethereum, async_provider, receiver):
+    mocker.patch.object(AsyncWeb3Provider, "make_request", side_effect=ValueError("node error"))
+    txn = ethereum.create_transaction(receiver=receiver.address, data="0x", chain_id=1337)
+    actual = asyncio.run(async_provider.send_call(txn, raise_on_revert=False))
+    assert actual == HexBytes("0x")
+
+
+def test_async_provider_get_contract_logs_splits_pages(mocker, async_provider, log_pages):
+    pages = []
+
+    async def get_logs(rpc, parameters):
+        start = int(parameters[0]["fromBlock"], 16)
+        stop = int(parameters[0]["toBlock"], 16)
+        pages.append((start, stop))
+        logs = [block for block in range(start, stop + 1) if 8 <= block < 16]
+        if len(logs) > 2:
+            raise ProviderError("query returned more than 2 results")
+
+        return logs
+
+    mocker.patch.object(AsyncWeb3Provider, "make_request", side_effect=get_logs)
+
+    async def get_contract_logs():
+        log_filter = LogFilter(start_block=0, stop_block=23)
+        return [log async for log in async_provider.get_contract_logs(log_filter)]
+
+    # The page with too many results is split, and logs are still in block order.
+    assert asyncio.run(get_contract_logs()) == list(range(8, 16))
+    assert (8, 15) in pages
+    assert (8, 9) in pages
+
+
+def test_async_provider_connect(mocker, eth_tester_provider):
+    from web3 import AsyncHTTPProvider
+
+    provider = AsyncWeb3Provider(eth_tester_provider)
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "http_uri",
+        new_callable=mock.PropertyMock,
+        return_value="http://127.0.0.1:8545",
+    )
+
+    async def connect():
+        async with provider:
+            assert provider.is_connected
+            assert isinstance(provider.web3.provider, AsyncHTTPProvider)
+
+    asyncio.run(connect())
+    assert not provider.is_connected
+
+
+def test_async_provider_connect_without_uri(eth_tester_provider):
+    provider = AsyncWeb3Provider(eth_tester_provider)
+    with pytest.raises(ProviderError, match="unable to make async requests"):
+        asyncio.run(provider.connect())
+
+
+class MinedHeads:
+    """
+    Acts as a ``newHeads`` subscription that mines a block whenever a head is awaited.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.closed = False
+
+    def get(self, timeout=None):
+        self.provider.mine()
+        return self.provider.web3.eth.get_block("latest")
+
+    def get_nowait(self):
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+def test_poll_blocks_subscribed(mocker, eth_tester_provider):
+    heads = MinedHeads(eth_tester_provider)
+    mocker.patch.object(type(eth_tester_provider), "_subscribe", return_value=heads)
+    get_latest_block = mocker.spy(type(eth_tester_provider), "_get_latest_block")
+    height = eth_tester_provider.chain_manager.blocks.height
+
+    poller = eth_tester_provider.poll_blocks(stop_block=height + 2, required_confirmations=0)
+    assert [b.number for b in poller] == [height + 1, height + 2]
+
+    # The head is only requested once; new heads are pushed by the subscription.
+    assert get_latest_block.call_count == 1
+    assert heads.closed
+
+
+def test_poll_blocks_subscribed_timeout(mocker, eth_tester_provider):
+    heads = mocker.MagicMock()
+    heads.get.side_effect = Empty
+    mocker.patch.object(type(eth_tester_provider), "_subscribe", return_value=heads)
+    poller = eth_tester_provider.poll_blocks(new_block_timeout=1, required_confirmations=0)
+    with pytest.raises(ProviderError, match="Timed out waiting for next block."):
+        list(poller)
+
+    assert heads.close.call_count == 1
+
+
+def test_poll_blocks_subscription_fails(mocker, eth_tester_provider):
+    heads = MinedHeads(eth_tester_provider)
+
+    def fail(timeout=None):
+        eth_tester_provider.mine()
+        raise ProviderError("Subscription closed")
+
+    mocker.patch.object(heads, "get", side_effect=fail)
+    mocker.patch.object(type(eth_tester_provider), "_subscribe", return_value=heads)
+    height = eth_tester_provider.chain_manager.blocks.height
+
+    # Falls back to polling for the head.
+    poller = eth_tester_provider.poll_blocks(stop_block=height + 1, required_confirmations=0)
+    assert [b.number for b in poller] == [height + 1]
+    assert heads.closed
+
+
+def test_poll_logs_subscribed(mocker, ethereum, eth_tester_provider):
+    chain = eth_tester_provider.chain_manager
+    chain.mine(2)
+    height = chain.blocks.height
+    emitted: set[int] = set()
+
+    class MinedLogs(MinedHeads):
+        def get_nowait(self):
+            # Logs for each new block, plus a log from an orphaned block.
+            for number in range(height + 1, chain.blocks.height + 1):
+                if number not in emitted:
+                    emitted.add(number)
+                    block_hash = chain.blocks[number].hash
+                    orphan_hash = HexBytes(b"\x01" * 32)
+                    return_logs.extend(
+                        [
+                            {"blockNumber": number, "blockHash": block_hash, "logIndex": 1},
+                            {"blockNumber": number, "blockHash": orphan_hash, "logIndex": 0},
+                        ]
+                    )
+
+            return return_logs.pop(0) if return_logs else None
+
+    return_logs: list[dict] = []
+    subscriptions = {
+        "newHeads": MinedHeads(eth_tester_provider),
+        "logs": MinedLogs(eth_tester_provider),
+    }
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "_subscribe",
+        side_effect=lambda kind, *args: subscriptions[kind],
+    )
+    mocker.patch.object(type(ethereum), "decode_logs", side_effect=lambda logs, *_: iter(logs))
+    get_contract_logs = mocker.spy(type(eth_tester_provider), "get_contract_logs")
+
+    address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    poller = eth_tester_provider.poll_logs(
+        stop_block=height + 3, address=address, required_confirmations=1
+    )
+    logs = list(poller)
+    assert [log["blockNumber"] for log in logs] == [height + 1, height + 2, height + 3]
+    assert all(log["blockHash"] == chain.blocks[log["blockNumber"]].hash for log in logs)
+
+    # Only the block confirmed before subscribing is requested.
+    assert get_contract_logs.call_count == 1
+    assert all(s.closed for s in subscriptions.values())
+
+
+def test_poll_logs_subscription_closes(mocker, ethereum, eth_tester_provider, ape_caplog):
+    chain = eth_tester_provider.chain_manager
+    chain.mine(2)
+    height = chain.blocks.height
+
+    class ClosingLogs(MinedHeads):
+        def get_nowait(self):
+            # Delivers the log of the first new block, then closes after it is yielded.
+            if not delivered:
+                delivered.append(height + 1)
+                block_hash = chain.blocks[height + 1].hash
+                return {"blockNumber": height + 1, "blockHash": block_hash, "logIndex": 0}
+
+            elif chain.blocks.height <= height + 2:
+                return None
+
+            raise ProviderError("Subscription 'logs' closed")
+
+    delivered: list[int] = []
+    subscriptions = {
+        "newHeads": MinedHeads(eth_tester_provider),
+        "logs": ClosingLogs(eth_tester_provider),
+    }
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "_subscribe",
+        side_effect=lambda kind, *args: subscriptions[kind],
+    )
+    mocker.patch.object(type(ethereum), "decode_logs", side_effect=lambda logs, *_: iter(logs))
+    get_contract_logs = mocker.patch.object(
+        type(eth_tester_provider),
+        "get_contract_logs",
+        side_effect=lambda log_filter: iter([{"blockNumber": log_filter.start_block}]),
+    )
+
+    poller = eth_tester_provider.poll_logs(stop_block=height + 4, required_confirmations=1)
+    logs = list(poller)
+    assert [log["blockNumber"] for log in logs] == list(range(height, height + 5))
+
+    # Requests the logs of each block from the one seen when the subscription closed.
+    requested = [call.args[0].start_block for call in get_contract_logs.call_args_list]
+    assert requested == [height, height + 2, height + 3, height + 4]
+    assert "Subscription to logs failed, polling instead" in ape_caplog.head
+    assert subscriptions["logs"].closed
+
+
+def test_subscribe_without_ws_uri(eth_tester_provider):
+    assert eth_tester_provider._subscribe("newHeads") is None
+
+
+def test_subscribe_fails(mocker, eth_tester_provider):
+    mocker.patch.object(
+        type(eth_tester_provider),
+        "ws_uri",
+        new_callable=mock.PropertyMock,
+        return_value="ws://127.0.0.1:8546",
+    )
+    error = ProviderError("Connection refused")
+    mocker.patch("ape_ethereum.provider._Subscription.start", side_effect=error)
+    assert eth_tester_provider._subscribe("newHeads") is None
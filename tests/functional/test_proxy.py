@@ -1,7 +1,9 @@
 from typing import TYPE_CHECKING
 
+import pytest
 from eth_pydantic_types import HexBytes
 
+from ape.exceptions import APINotImplementedError, ProviderError
 from ape_ethereum.proxies import ProxyType
 from ape_ethereum.utils import strip_compiler_metadata, strip_push_data
 from ape_test.provider import LocalProvider
@@ -115,3 +117,122 @@ def test_provider_not_supports_get_storage(
 
     assert actual is None  # Because of provider.
     assert my_provider.times_get_storage_was_called == 1
+
+
+@pytest.fixture
+def batching_provider(mocker, eth_tester_provider):
+    mocker.patch.object(
+        type(eth_tester_provider), "supports_batch_requests", new_callable=mocker.PropertyMock
+    ).return_value = True
+    return mocker.patch.object(type(eth_tester_provider), "make_batch_request")
+
+
+def test_get_proxy_info_single(mocker, ethereum, eth_tester_provider, batching_provider):
+    proxy = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    target = "0xBEbeBeBEbeBebeBeBEBEbebEBeBeBebeBeBebebe"
+    empty_slot = "0x" + "00" * 32
+    # Code containing a DELEGATECALL, an empty Safe slot, and the EIP-1967 slot set.
+    get_code = mocker.patch.object(type(eth_tester_provider), "get_code")
+    get_code.return_value = HexBytes("0x5af4")
+    batching_provider.return_value = [
+        empty_slot,
+        "0x" + "00" * 12 + target[2:].lower(),
+        *([empty_slot] * 5),
+    ]
+
+    actual = ethereum.get_proxy_info(proxy)
+    assert actual is not None
+    assert actual.type == ProxyType.Standard
+    assert actual.target == target
+
+    # The storage slots are fetched in a single batch.
+    assert batching_provider.call_count == 1
+    requests = batching_provider.call_args[0][0]
+    assert all(rpc == "eth_getStorageAt" for rpc, _ in requests)
+
+    # Storage is not requested when the code cannot delegate calls.
+    batching_provider.reset_mock()
+    get_code.return_value = HexBytes("0x6001")
+    assert ethereum.get_proxy_info(proxy) is None
+    assert batching_provider.call_count == 0
+
+
+def test_get_proxy_info_storage_error(mocker, ethereum, eth_tester_provider, batching_provider):
+    proxy = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    mocker.patch.object(type(eth_tester_provider), "get_code").return_value = HexBytes("0x5af4")
+    empty_slot = "0x" + "00" * 32
+    error = ProviderError("header not found")
+    batching_provider.return_value = [error, *([empty_slot] * 6)]
+
+    # A failed lookup must not be mistaken for "not a proxy".
+    with pytest.raises(ProviderError, match="header not found"):
+        ethereum.get_proxy_info(proxy)
+
+    # Only unsupported storage lookups mean proxies cannot be detected.
+    batching_provider.return_value = [APINotImplementedError(), *([empty_slot] * 6)]
+    assert ethereum.get_proxy_info(proxy) is None
+
+
+def test_get_proxy_infos(ethereum, batching_provider):
+    minimal = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    standard = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+    no_code = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+    target = "0xBEbeBeBEbeBebeBeBEBEbebEBeBeBebeBeBebebe"
+    minimal_code = f"0x363d3d373d3d3d363d73{target[2:].lower()}5af43d82803e903d91602b57fd5bf3"
+    empty_slot = "0x" + "00" * 32
+    batching_provider.side_effect = [
+        [minimal_code, "0x5af4", "0x"],
+        [empty_slot, "0x" + "00" * 12 + target[2:].lower(), *([empty_slot] * 5)],
+    ]
+
+    actual = ethereum.get_proxy_infos([minimal, standard, no_code, minimal])
+    assert list(actual) == [minimal, standard, no_code]
+    assert actual[minimal].type == ProxyType.Minimal
+    assert actual[minimal].target == target
+    assert actual[standard].type == ProxyType.Standard
+    assert actual[standard].target == target
+    assert actual[no_code] is None
+
+    # Storage is only requested for the contract that may delegate calls.
+    assert batching_provider.call_count == 2
+    storage_requests = batching_provider.call_args_list[1][0][0]
+    assert {params[0] for _, params in storage_requests} == {standard}
+
+
+def test_get_proxy_infos_partial_failure(mocker, ethereum, eth_tester_provider, batching_provider):
+    failing = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    standard = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+    target = "0xBEbeBeBEbeBebeBeBEBEbebEBeBeBebeBeBebebe"
+    empty_slot = "0x" + "00" * 32
+    error = ProviderError("header not found")
+    batching_provider.side_effect = [
+        ["0x5af4", "0x5af4"],
+        [
+            error,
+            *([empty_slot] * 6),
+            empty_slot,
+            "0x" + "00" * 12 + target[2:].lower(),
+            *([empty_slot] * 5),
+        ],
+    ]
+
+    # One failing address does not prevent detecting the others.
+    actual = ethereum.get_proxy_infos([failing, standard], raise_on_error=False)
+    assert actual[failing] is error
+    assert actual[standard].type == ProxyType.Standard
+    assert actual[standard].target == target
+
+
+def test_get_proxy_info_reads_slots_until_found(mocker, ethereum, eth_tester_provider):
+    proxy = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    target = "0xBEbeBeBEbeBebeBeBEBEbebEBeBeBebeBeBebebe"
+    mocker.patch.object(type(eth_tester_provider), "get_code").return_value = HexBytes("0x5af4")
+    get_storage = mocker.patch.object(type(eth_tester_provider), "get_storage")
+    get_storage.return_value = HexBytes("0x" + "00" * 12 + target[2:].lower())
+
+    actual = ethereum.get_proxy_info(proxy)
+    assert actual.type == ProxyType.Standard
+    assert actual.target == target
+
+    # Without batching, the first slot set identifies the proxy.
+    assert get_storage.call_count == 1
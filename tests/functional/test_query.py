@@ -1,10 +1,23 @@
 import time
+from threading import Event
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from ape.api.query import validate_and_expand_columns
+import ape.managers.query as query_module
+from ape.api.query import (
+    BlockQuery,
+    ContractCreation,
+    ContractCreationQuery,
+    QueryAPI,
+    concat_columns,
+    validate_and_expand_columns,
+)
+from ape.exceptions import QueryEngineError
+from ape.managers.query import QueryStatsMap
 from ape.utils import DEFAULT_TEST_CHAIN_ID, BaseInterfaceModel
+from ape_ethereum.query import EthereumQueryProvider
 
 
 def test_basic_query(chain, eth_tester_provider):
@@ -44,6 +57,19 @@ def test_relative_block_query(chain, eth_tester_provider):
     assert df.number.max() == chain.blocks[-2].number == start_block + 9
 
 
+def test_block_query_pages(chain, eth_tester_provider):
+    chain.mine(10)
+    batch_size = eth_tester_provider.batch_size
+    eth_tester_provider.batch_size = 3
+    try:
+        df = chain.blocks.query("number", start_block=0, stop_block=10)
+    finally:
+        eth_tester_provider.batch_size = batch_size
+
+    # Fetched in concurrent pages, but still in order.
+    assert list(df["number"].values) == list(range(11))
+
+
 def test_block_transaction_query(chain, eth_tester_provider, sender, receiver):
     sender.transfer(receiver, 100)
     query = chain.blocks[-1].transactions
@@ -101,3 +127,297 @@ def test_specify_engine(chain, eth_tester_provider):
     actual = chain.blocks.query("*", engine_to_use="__default__")
     expected = offset + 3
     assert len(actual) == expected
+
+
+def test_block_query_partially_cached(mocker, chain, eth_tester_provider):
+    chain.mine(10)
+    cached_ranges = [(2, 4), (7, 7)]
+    engine = mocker.MagicMock()
+    engine.estimate_query.return_value = None
+    engine.get_cached_ranges.side_effect = lambda q: [
+        (max(start, q.start_block), min(stop, q.stop_block))
+        for start, stop in cached_ranges
+        if start <= q.stop_block and stop >= q.start_block
+    ]
+    engine.perform_query.side_effect = lambda q: eth_tester_provider.get_blocks(
+        range(q.start_block, q.stop_block + 1)
+    )
+    mocker.patch.dict(chain.query_manager.engines, {"cache": engine})
+
+    df = chain.blocks.query("number", start_block=0, stop_block=10)
+
+    # Only the cached ranges are served from cache, and the result is still in order.
+    assert list(df["number"].values) == list(range(11))
+    served = [(q.start_block, q.stop_block) for (q,), _ in engine.perform_query.call_args_list]
+    assert served == cached_ranges
+
+
+def test_query_columns(chain, eth_tester_provider):
+    chain.mine(4)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=4)
+    batches = list(
+        chain.query_manager.query_columns(
+            query, ["number", "hash", "uncles"], engine_to_use="__default__", batch_size=2
+        )
+    )
+
+    # Engines that return models are adapted into batches of columns.
+    # NOTE: `uncles` are not in block headers, so the default engine returns models.
+    assert [batch["number"] for batch in batches] == [[0, 1], [2, 3], [4]]
+    assert batches[0]["hash"][1] == chain.blocks[1].hash
+
+
+def test_query_header_columns(mocker, chain, eth_tester_provider):
+    chain.mine(3)
+    provider_cls = type(eth_tester_provider)
+    get_block_headers = mocker.spy(provider_cls, "get_block_headers")
+    get_blocks = mocker.spy(provider_cls, "get_blocks")
+    columns = ["number", "hash", "timestamp", "gas_used", "base_fee", "num_transactions"]
+
+    df = chain.blocks.query(*columns, start_block=0, stop_block=3)
+
+    # Only block headers are fetched, without decoding whole blocks.
+    assert get_block_headers.call_count == 1
+    assert get_blocks.call_count == 0
+    blocks = list(eth_tester_provider.get_blocks(range(4)))
+    for column in columns:
+        assert df[column].tolist() == [getattr(b, column) for b in blocks]
+
+
+def test_concat_columns():
+    batches = [{"number": np.array([0, 1])}, {"number": np.array([2])}]
+    assert list(concat_columns(batches, ["number"])["number"]) == [0, 1, 2]
+    assert concat_columns([{"number": [0], "hash": [b""]}], ["number"]) == {"number": [0]}
+
+
+class CachingEngine(QueryAPI):
+    def __init__(self):
+        self.cached: list = []
+        self.aborted = False
+        self.writers: list = []
+
+    def estimate_query(self, query):
+        return None
+
+    def perform_query(self, query):
+        raise QueryEngineError("Cannot perform queries.")
+
+    def update_cache(self, query, result):
+        try:
+            self.cached.extend(result)
+        except Exception:
+            self.aborted = True
+            raise
+
+
+@pytest.fixture
+def caching_engine(mocker, chain):
+    engine = CachingEngine()
+    mocker.patch.dict(chain.query_manager.engines, {"caching": engine})
+    writer_class = query_module._CacheWriter
+
+    def create_writer(*args, **kwargs):
+        writer = writer_class(*args, **kwargs)
+        engine.writers.append(writer)
+        return writer
+
+    mocker.patch.object(query_module, "_CacheWriter", side_effect=create_writer)
+    return engine
+
+
+def test_query_streams_to_caches(mocker, chain, eth_tester_provider, caching_engine):
+    chain.mine(5)
+    mocker.patch.object(chain.query_manager, "cache_chunk_size", 2)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=5)
+    blocks = list(chain.query_manager.query(query, engine_to_use="__default__"))
+
+    # The cache writes are done once the result is exhausted.
+    assert [b.number for b in caching_engine.cached] == [b.number for b in blocks]
+    assert not caching_engine.aborted
+
+
+def test_query_streams_to_caches_falls_behind(
+    mocker, chain, eth_tester_provider, caching_engine, ape_caplog
+):
+    chain.mine(3)
+    mocker.patch.object(chain.query_manager, "cache_chunk_size", 1)
+    mocker.patch.object(chain.query_manager, "cache_queue_size", 1)
+    started = Event()
+    release = Event()
+
+    def update_cache(query, result):
+        started.set()
+        release.wait(timeout=5)
+        CachingEngine.update_cache(caching_engine, query, result)
+
+    mocker.patch.object(caching_engine, "update_cache", side_effect=update_cache)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=3)
+    result = chain.query_manager.query(query, engine_to_use="__default__")
+    next(result)
+    started.wait(timeout=5)
+    blocks = [next(result) for _ in range(2)]
+    release.set()
+    blocks.extend(result)
+
+    # The slow cache update is skipped, with a warning, rather than stalling the query.
+    assert len(blocks) == 3
+    assert caching_engine.aborted
+    assert "CachingEngine: Cache writer fell behind, skipping cache update." in ape_caplog.head
+
+
+def test_query_streams_to_caches_partially_consumed(chain, eth_tester_provider, caching_engine):
+    chain.mine(5)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=5)
+    result = chain.query_manager.query(query, engine_to_use="__default__")
+    next(result)
+    result.close()
+    for writer in caching_engine.writers:
+        writer.join(timeout=5)
+
+    # The cache is not updated with an incomplete result.
+    assert caching_engine.aborted
+
+
+def test_query_streams_to_caches_error(mocker, chain, eth_tester_provider, caching_engine):
+    chain.mine(2)
+    mocker.patch.object(caching_engine, "update_cache", side_effect=ValueError("bad cache"))
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=2)
+    blocks = list(chain.query_manager.query(query, engine_to_use="__default__"))
+
+    # The query is still served, and the error is raised when the writer is joined.
+    assert len(blocks) == 3
+    writer = next(w for w in caching_engine.writers if w.engine is caching_engine)
+    with pytest.raises(ValueError, match="bad cache"):
+        writer.join(timeout=5)
+
+    assert isinstance(writer.error, ValueError)
+
+
+@pytest.fixture
+def query_manager(chain):
+    chain.query_manager.reset_engine_stats()
+    yield chain.query_manager
+    chain.query_manager.reset_engine_stats()
+
+
+def test_engine_stats(chain, eth_tester_provider, query_manager):
+    chain.mine(3)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=3)
+    list(query_manager.query(query, engine_to_use="__default__"))
+
+    network = eth_tester_provider.network.choice
+    stats = query_manager.engine_stats.get(network, "__default__", "BlockQuery")
+    assert stats.samples == 1
+    assert stats.results == 4
+    assert stats.time_per_result > 0
+    assert query_manager.engine_stats.path.is_file()
+
+
+def test_engine_stats_adjust_estimates(eth_tester_provider, query_manager):
+    network = eth_tester_provider.network.choice
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=3)
+    estimate = query_manager.engines["__default__"].estimate_query(query)
+    for _ in range(query_manager.min_stats_samples):
+        # The engine is 10 times slower than it estimates.
+        query_manager.engine_stats.record(
+            network, "__default__", "BlockQuery", 4, estimate * 10, estimate, 0.5
+        )
+
+    assert query_manager._estimate_query("__default__", query) == estimate * 10
+
+
+def test_engine_stats_learn_time_ratio(mocker, chain, eth_tester_provider, query_manager):
+    class SlowEngine(QueryAPI):
+        # NOTE: Estimates 2 ms, but takes 10 times as long.
+        def estimate_query(self, query):
+            return 2
+
+        def perform_query(self, query):
+            time.sleep(0.02)
+            yield eth_tester_provider.get_block(query.start_block)
+
+    mocker.patch.dict(query_manager.engines, {"slow": SlowEngine()}, clear=True)
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=0)
+    for _ in range(10):
+        list(query_manager.query(query))
+
+    network = eth_tester_provider.network.choice
+    stats = query_manager.engine_stats.get(network, "slow", "BlockQuery")
+    assert stats.samples == 10
+    assert stats.time_ratio == pytest.approx(10, rel=0.3)
+
+
+def test_engine_stats_flush_interval(mocker, eth_tester_provider, query_manager):
+    network = eth_tester_provider.network.choice
+    stats = query_manager.engine_stats
+    mocker.patch.object(type(stats), "flush_interval", 3600.0)
+    stats.record(network, "__default__", "BlockQuery", 4, 1.0, 1, 0.5)
+    assert stats.path.is_file()
+
+    # Records within the interval are only written on flush (e.g. at exit).
+    stats.record(network, "__default__", "BlockQuery", 4, 1.0, 1, 0.5)
+    assert (
+        QueryStatsMap.model_validate_file(stats.path)
+        .get(network, "__default__", "BlockQuery")
+        .samples
+        == 1
+    )
+    stats.flush()
+    assert (
+        QueryStatsMap.model_validate_file(stats.path)
+        .get(network, "__default__", "BlockQuery")
+        .samples
+        == 2
+    )
+
+
+def test_engine_stats_corrupt_file(query_manager):
+    path = query_manager.engine_stats.path
+    query_manager.reset_engine_stats()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('{"networks": {')
+    assert query_manager.engine_stats.networks == {}
+    assert not path.is_file()
+
+
+@pytest.fixture
+def deployed_at(mocker, chain):
+    probed = []
+
+    def get_code(address, block_id=None):
+        probed.append(block_id)
+        return b"\x60" if block_id is None or block_id >= 777 else b""
+
+    mocker.patch.object(chain, "get_code", side_effect=get_code)
+    return probed
+
+
+@pytest.mark.parametrize("search_width", (1, 3, 8))
+def test_find_creation_block(eth_tester_provider, owner, deployed_at, search_width):
+    engine = EthereumQueryProvider(search_width=search_width)
+    assert engine._find_creation_block(owner.address, 0, 10_000) == 777
+
+
+def test_contract_creation_query_caches_creation(
+    mocker, chain, eth_tester_provider, owner, deployed_at
+):
+    creation = ContractCreation(txn_hash="0x123", block=777, deployer=owner.address)
+    find_creation = mocker.patch.object(
+        EthereumQueryProvider, "_find_creation_in_block_via_parity", return_value=iter([creation])
+    )
+    mocker.patch.object(
+        type(chain.blocks), "height", new_callable=mocker.PropertyMock, return_value=10_000
+    )
+    engine = EthereumQueryProvider()
+    query = ContractCreationQuery(columns=["*"], contract=owner.address)
+
+    with chain.contracts.use_temporary_caches():
+        assert list(engine.perform_query(query)) == [creation]
+        assert find_creation.call_args[0][0] == 777
+        assert chain.contracts.contract_creations[owner.address] == creation
+
+        # The cached creation is used without searching again.
+        deployed_at.clear()
+        assert list(engine.perform_query(query)) == [creation]
+        assert engine.estimate_query(query) == 1
+        assert deployed_at == []
@@ -1,9 +1,13 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from ape.utils.misc import SOURCE_EXCLUDE_PATTERNS
 from ape.utils.os import (
+    CacheDatabase,
+    CacheDirectory,
     clean_path,
     create_tempdir,
     get_all_files_in_directory,
@@ -210,3 +214,88 @@ def test_clean_path_not_relative_to_home():
     path = Path(name)
     actual = clean_path(path)
     assert actual == name
+
+
+def test_cache_database(tmp_path):
+    database = CacheDatabase(tmp_path / "data.db", "contract_types")
+    assert database.get_data("0x123") == {}
+    assert not (tmp_path / "data.db").is_file()  # Only created once data is cached.
+
+    database["0x123"] = {"contractName": "Foo"}
+    database.cache_many({"0x456": {"contractName": "Bar"}, "0x789": {"contractName": "Baz"}})
+    assert database["0x123"] == {"contractName": "Foo"}
+    assert database.get_many(["0x123", "0x456", "0xabc"]) == {
+        "0x123": {"contractName": "Foo"},
+        "0x456": {"contractName": "Bar"},
+    }
+    assert sorted(database.keys()) == ["0x123", "0x456", "0x789"]
+    assert database.has_data("0x456")
+    assert not database.has_data("0xabc")
+
+    del database["0x123"]
+    assert database.get_data("0x123") == {}
+
+    # Tables in the same file are separate.
+    other = CacheDatabase(tmp_path / "data.db", "proxy_info")
+    assert other.get_data("0x456") == {}
+
+
+def test_cache_database_threads(tmp_path):
+    database = CacheDatabase(tmp_path / "data.db", "contract_types")
+
+    def cache_and_read(idx: int) -> dict:
+        database[f"0x{idx}"] = {"contractName": f"Foo{idx}"}
+        return database[f"0x{idx}"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(cache_and_read, range(20)))
+
+    assert results == [{"contractName": f"Foo{idx}"} for idx in range(20)]
+    assert len(list(database.keys())) == 20
+
+
+def test_cache_database_closes_connections(tmp_path, mocker):
+    connect = mocker.spy(sqlite3, "connect")
+    database = CacheDatabase(tmp_path / "data.db", "contract_types")
+    database["0x123"] = {"contractName": "Foo"}
+    assert database["0x123"] == {"contractName": "Foo"}
+    assert list(database.keys()) == ["0x123"]
+
+    assert connect.call_count == 3
+    for connection in connect.spy_return_list:
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            connection.execute("SELECT 1")
+
+
+def test_cache_database_compress(tmp_path):
+    data = {"abi": [{"type": "function", "name": "foo"}] * 100}
+    CacheDatabase(tmp_path / "data.db", "compressed", compress=True)["0x123"] = data
+    CacheDatabase(tmp_path / "data.db", "uncompressed")["0x123"] = data
+
+    # Compressed data is readable with or without compression enabled.
+    assert CacheDatabase(tmp_path / "data.db", "compressed")["0x123"] == data
+
+    connection = sqlite3.connect(tmp_path / "data.db")
+    sizes = {
+        table: len(connection.execute(f"SELECT data FROM {table}").fetchone()[0])
+        for table in ("compressed", "uncompressed")
+    }
+    assert sizes["compressed"] < sizes["uncompressed"]
+
+
+def test_cache_database_invalid_table(tmp_path):
+    with pytest.raises(ValueError, match="Invalid table name"):
+        CacheDatabase(tmp_path / "data.db", "contract-types; DROP TABLE foo")
+
+
+def test_cache_database_import_directory(tmp_path):
+    directory = CacheDirectory(tmp_path / "contract_types")
+    directory["0x123"] = {"contractName": "Foo"}
+    directory["0x456"] = {"contractName": "Bar"}
+
+    database = CacheDatabase(tmp_path / "data.db", "contract_types")
+    assert database.import_directory(directory) == 2
+    assert database.get_many(directory.keys()) == {
+        "0x123": {"contractName": "Foo"},
+        "0x456": {"contractName": "Bar"},
+    }
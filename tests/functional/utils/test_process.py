@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+from ape.utils.process import concurrent_map
+
+
+def test_concurrent_map():
+    def fn(item):
+        # NOTE: Earlier items take longer, yet results stay in order.
+        time.sleep((10 - item) / 1000)
+        return item * 2
+
+    actual = list(concurrent_map(fn, range(10), concurrency=4))
+    assert actual == [i * 2 for i in range(10)]
+
+
+def test_concurrent_map_is_lazy():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = concurrent_map(lambda x: x, items(), concurrency=2, prefetch=3)
+    assert next(results) == 0
+    # Only the prefetch window was pulled from the items.
+    assert len(consumed) == 3
+    results.close()
+
+
+def test_concurrent_map_uses_threads():
+    thread_ids = set()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fn(item):
+        thread_ids.add(threading.get_ident())
+        barrier.wait()
+        return item
+
+    assert list(concurrent_map(fn, range(2), concurrency=2)) == [0, 1]
+    assert len(thread_ids) == 2
+
+
+def test_concurrent_map_raises():
+    def fn(item):
+        if item == 3:
+            raise ValueError("bad item")
+
+        return item
+
+    results = concurrent_map(fn, range(10))
+    assert [next(results) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError, match="bad item"):
+        next(results)
+
+
+def test_concurrent_map_import_from_utils():
+    from ape.utils import concurrent_map as utils_concurrent_map
+
+    assert utils_concurrent_map is concurrent_map
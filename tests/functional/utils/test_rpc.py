@@ -1,6 +1,6 @@
 import pytest
 
-from ape.utils.rpc import RPCHeaders, stream_response
+from ape.utils.rpc import RateLimiter, RPCHeaders, stream_response
 
 
 def test_stream_response(mocker):
@@ -59,3 +59,30 @@ class TestRPCHeaders:
     def test_contains_user_agent(self, key, headers):
         headers["User-Agent"] = "test0/1.0"
         assert key in headers
+
+
+class TestRateLimiter:
+    def test_acquire_burst(self, mocker):
+        sleep = mocker.patch("ape.utils.rpc.time.sleep")
+        limiter = RateLimiter(2)
+        limiter.acquire()
+        limiter.acquire()
+        assert sleep.call_count == 0
+
+    def test_acquire_waits(self, mocker):
+        now = 100.0
+        mocker.patch("ape.utils.rpc.time.monotonic", side_effect=lambda: now)
+
+        def sleep(delay):
+            nonlocal now
+            now += delay
+
+        sleep_patch = mocker.patch("ape.utils.rpc.time.sleep", side_effect=sleep)
+        limiter = RateLimiter(4, burst=1)
+        limiter.acquire()
+        limiter.acquire()
+        sleep_patch.assert_called_once_with(0.25)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match="Rate must be greater than 0."):
+            RateLimiter(0)
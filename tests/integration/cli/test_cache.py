@@ -1,3 +1,4 @@
+from ape.utils.os import CacheDatabase, CacheDirectory
 from tests.integration.cli.utils import run_once
 
 
@@ -13,3 +14,29 @@ def test_cache_init_purge(ape_cli, runner):
     )
     assert "SUCCESS" in result.output
     assert "Caching database purged for ethereum:sepolia.\n" in result.output
+
+
+@run_once
+def test_cache_stats(ape_cli, runner):
+    result = runner.invoke(ape_cli, ("cache", "stats", "--reset", "-v", "SUCCESS"))
+    assert "Query engine stats reset." in result.output
+
+    result = runner.invoke(ape_cli, ("cache", "stats"))
+    assert "No query engine stats." in result.output
+
+
+@run_once
+def test_cache_migrate_data(ape_cli, runner, config):
+    folder = config.DATA_FOLDER / "ethereum" / "sepolia" / "contract_types"
+    CacheDirectory(folder)["0x123"] = {"contractName": "Foo"}
+    # Folders of other data are not migrated.
+    (folder.parent / "other-data").mkdir(exist_ok=True)
+
+    cmd = ("cache", "migrate-data", "--network", "ethereum:sepolia", "--delete")
+    result = runner.invoke(ape_cli, cmd, catch_exceptions=False)
+    assert "Skipping unknown cached data folder 'other-data'." in result.output
+    assert "Cached data migrated for ethereum:sepolia." in result.output
+
+    database = CacheDatabase(folder.parent / "data.db", "contract_types")
+    assert database["0x123"] == {"contractName": "Foo"}
+    assert not list(folder.iterdir())